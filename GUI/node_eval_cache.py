@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+"""
+This module containing memoization cache for `Node` evaluation. Results are stored under key made by the `Node`
+(i.e. node id, op code and fingerprints of input values), so evaluating the same inputs again returns instantly.
+Least recently used entries are evicted when the cache is full
+"""
+
+from collections import OrderedDict
+
+import threading
+
+DEBUG = False
+
+EVAL_CACHE_SIZE = 4096  # max number of stored results per scene
+
+def fingerprint(value):
+    """Return hashable fingerprint of evaluated value used inside cache key
+
+    :param value: evaluated value
+    :return: ``(type, value)`` if the value is hashable, the type keeps equal values of different types apart
+        (``1``, ``1.0`` and ``True``). ``None`` for not evaluated value or unhashable one (i.e. arrays, their
+        ``repr`` is truncated so it can't identify the value). Result depending on such value shouldn't be cached
+    """
+    if value is None: return None
+    try:
+        hash(value)
+        return (type(value), value)
+    except TypeError:
+        return None
+
+class EvalCache():
+    """Class contains LRU cache of `Node` evaluation results for one `Scene`"""
+    def __init__(self, max_size=EVAL_CACHE_SIZE):
+        """
+        :param max_size: max number of stored results
+        :type max_size: ``int``
+
+        :Instance Attributes:
+
+        - **enabled** - if ``False`` nothing is looked up nor stored
+        - **max_size** - max number of stored results
+        - **hits** - number of successful lookups
+        - **misses** - number of failed lookups
+        """
+        self.enabled = True
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+
+        self._entries = OrderedDict()   # key -> (node id, value), least recently used first
+        self._node_keys = {}            # node id -> set of keys, used by invalidation
+        self._lock = threading.Lock()   # nodes can be evaluated from worker threads (parallel evaluation)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        """
+        Look up stored result
+
+        :param key: key created by `Node`
+        :return: ``(found, value)``
+        :rtype: ``tuple``
+        """
+        with self._lock:
+            if not self.enabled or key not in self._entries:
+                self.misses += 1
+                return False, None
+
+            # re-insert to mark as most recently used
+            entry = self._entries.pop(key)
+            self._entries[key] = entry
+            self.hits += 1
+            return True, entry[1]
+
+    def store(self, key, node_id, value):
+        """
+        Store evaluated result, evict least recently used results when cache is full
+
+        :param key: key created by `Node`
+        :param node_id: id of evaluated `Node`, used by :func:`invalidateNode`
+        :type node_id: ``int``
+        :param value: evaluated value
+        """
+        if not self.enabled: return
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (node_id, value)
+            self._node_keys.setdefault(node_id, set()).add(key)
+
+            while len(self._entries) > self.max_size:
+                old_key, (old_node_id, _) = self._entries.popitem(last=False)
+                keys = self._node_keys[old_node_id]
+                keys.discard(old_key)
+                if not keys: del self._node_keys[old_node_id]
+
+    def invalidateNode(self, node_id):
+        """Drop all stored results of `Node`. Called on structural edits (node removed, edge changed)
+
+        :param node_id: id of the `Node`
+        :type node_id: ``int``
+        """
+        with self._lock:
+            for key in self._node_keys.pop(node_id, ()):
+                self._entries.pop(key, None)
+        if DEBUG: print("EvalCache: invalidated node", node_id)
+
+    def clear(self):
+        """Drop all stored results and reset counters"""
+        with self._lock:
+            self._entries.clear()
+            self._node_keys.clear()
+        self.hits = 0
+        self.misses = 0
@@ -0,0 +1,355 @@
+# -*- coding: utf-8 -*-
+"""
+This module containing crash recovery journal of `Scene`. Every state committed by history (see
+:func:`~GUI.node_editor.SceneHistory.commitChanges`) is appended as a small record into a journal file next to the
+graph file, so edits done since the last save survive a crash of the application (i.e. Maya). When the journal grows
+too big it's compacted: full snapshot of the `Scene` is written on background thread (see :mod:`~GUI.node_saver`)
+and the records it contains are dropped. Loading the graph replays the journal if it belongs to the graph file.
+
+Journal is a text file, the first line is JSON header, every next line is one JSON record with serialized states of
+touched `Nodes` and `Edges` (``null`` for removed ones). States are complete, so replaying a record twice or on top
+of newer snapshot gives the same result. Incomplete last line (crash during write) is ignored.
+"""
+
+from collections import OrderedDict
+from PySide2 import QtCore
+
+import json
+import os
+import time
+
+import GUI.node_storage as node_storage
+
+DEBUG = False
+
+JOURNAL_VERSION = 1
+JOURNAL_EXTENSION = ".journal"                                      # graph.json -> graph.json.journal
+SNAPSHOT_EXTENSION = ".snapshot" + node_storage.BINARY_EXTENSION    # graph.json -> graph.json.snapshot.zgb
+JOURNAL_SYNC_INTERVAL = 2.0                 # seconds, appended records are flushed to disk at most this late
+JOURNAL_COMPACT_SIZE = 4 * 1024 * 1024      # bytes of records which trigger compaction into snapshot
+
+def getJournalFilename(filename):
+    """Return journal file path of graph file"""
+    return filename + JOURNAL_EXTENSION
+
+def getSnapshotFilename(filename):
+    """Return snapshot file path of graph file"""
+    return filename + SNAPSHOT_EXTENSION
+
+def getFileStamp(filename):
+    """Return ``[size, modification time]`` identifying current content of the file, ``None`` if it doesn't exist
+
+    :rtype: ``list``
+    """
+    try: stat = os.stat(filename)
+    except OSError: return None
+    return [stat.st_size, stat.st_mtime]
+
+def _dumpRecord(value):
+    # one line of ascii JSON, journal is handled as bytes so positions match lengths on every platform
+    return (json.dumps(value, separators=(',', ':')) + "\n").encode("ascii")
+
+def _loadRecord(line):
+    return json.loads(line.decode("ascii"), object_pairs_hook=OrderedDict)
+
+def readJournal(filename):
+    """
+    Read journal file
+
+    :param filename: journal file path
+    :type filename: ``str``
+    :return: ``(header, records)``, ``(None, [])`` if there is no valid journal. Reading stops at the first damaged
+        record
+    :rtype: ``tuple``
+    """
+    try:
+        with open(filename, "rb") as file: lines = file.read().split(b"\n")
+    except (IOError, OSError): return None, []
+
+    try: header = _loadRecord(lines[0])
+    except ValueError: return None, []
+    if not isinstance(header, dict) or header.get('journal') != JOURNAL_VERSION: return None, []
+
+    records = []
+    for line in lines[1:]:
+        if not line: continue
+        try: records.append(_loadRecord(line))
+        except ValueError:
+            if DEBUG: print("node_journal: damaged record in", filename)
+            break
+    return header, records
+
+def mergeRecords(records):
+    """
+    Merge records into final state of every touched item
+
+    :return: ``(nodes, edges)``, each one ``OrderedDict`` of id -> serialized state (``None`` for removed item)
+    :rtype: ``tuple``
+    """
+    nodes, edges = OrderedDict(), OrderedDict()
+    for record in records:
+        for item_id, state in record['nodes']: nodes[item_id] = state
+        for item_id, state in record['edges']: edges[item_id] = state
+    return nodes, edges
+
+class SceneJournal():
+    """Class appending committed changes of `Scene` into journal file and recovering them after crash"""
+    def __init__(self, scene):
+        """
+        :param scene: Reference to the :class:`~GUI.node_editor.Scene`
+        :type scene: :class:`~GUI.node_editor.Scene`
+
+        :Instance Attributes:
+
+        - **scene** - reference to the :class:`~GUI.node_editor.Scene`
+        - **graph_filename** - graph file the journal belongs to, ``None`` while closed
+        - **sync_interval** - seconds between forced writes of appended records to disk, ``0`` syncs every record
+        - **compact_size** - bytes of records after which the journal is compacted into snapshot
+        """
+        self.scene = scene
+        self.graph_filename = None
+        self.sync_interval = JOURNAL_SYNC_INTERVAL
+        self.compact_size = JOURNAL_COMPACT_SIZE
+
+        self._base = None           # stamp of graph file the records apply on, None until the graph file is saved
+        self._snapshot = None       # name of snapshot file the records apply on instead of the graph file
+        self._file = None           # journal file opened for appending, created with the first record
+        self._file_start = 0        # value of _written at the first record inside the journal file
+        self._written = 0           # bytes of records appended since opened
+        self._last_sync = 0.0
+        self._sync_scheduled = False
+        self._is_compacting = False
+
+        self.scene.history.addHistoryCommittedListener(self.onHistoryCommitted)
+
+    def isOpen(self):
+        """
+        :return: ``True`` if committed changes are journaled
+        :rtype: ``bool``
+        """
+        return self.graph_filename is not None
+
+    def getFilename(self):
+        """Return path of the journal file, ``None`` while closed"""
+        return getJournalFilename(self.graph_filename) if self.isOpen() else None
+
+    def createHeader(self):
+        """
+        :return: header of the journal file
+        :rtype: ``OrderedDict``
+        """
+        return OrderedDict([('journal', JOURNAL_VERSION),
+                            ('graph', os.path.basename(self.graph_filename)),
+                            ('base', self._base),
+                            ('snapshot', self._snapshot)])
+
+    def open(self, graph_filename, keep=False):
+        """
+        Start journaling changes of the `Scene` loaded from (or saved into) `graph_filename`. Journal file is
+        created with the first record
+
+        :param graph_filename: graph file
+        :type graph_filename: ``str``
+        :param keep: if ``True`` continue existing journal (after recovery), otherwise it's replaced
+        :type keep: ``bool``
+        """
+        self.close(discard=not keep or graph_filename != self.graph_filename)
+        self.graph_filename = graph_filename
+        self._written = self._file_start = 0
+        self._base, self._snapshot = getFileStamp(graph_filename), None
+        if keep:
+            header, records = readJournal(self.getFilename())
+            if header is not None:
+                # written again without damaged tail, new records mustn't be glued to incomplete line
+                self._base, self._snapshot = header['base'], header['snapshot']
+                data = b"".join(_dumpRecord(record) for record in records)
+                self._file_start = -len(data)
+                self.writeHeader(data)
+
+    def close(self, discard=True):
+        """
+        Stop journaling
+
+        :param discard: if ``True`` journal and snapshot files are removed (changes were saved or thrown away),
+            otherwise they're kept for recovery
+        :type discard: ``bool``
+        """
+        if not self.isOpen(): return
+        if self._file is not None:
+            self.sync()
+            self._file.close()
+            self._file = None
+        if discard:
+            for filename in (self.getFilename(), getSnapshotFilename(self.graph_filename)):
+                if os.path.exists(filename): os.remove(filename)
+        self.graph_filename = None
+
+    def onHistoryCommitted(self, nodes_delta, edges_delta):
+        """Append committed states of `Nodes` and `Edges` (the `after` side of history delta)"""
+        if not self.isOpen(): return
+        self.append(OrderedDict([('nodes', [[item_id, states[1]] for item_id, states in nodes_delta.items()]),
+                                 ('edges', [[item_id, states[1]] for item_id, states in edges_delta.items()])]))
+
+    def writeHeader(self, records=b""):
+        """(Re)create the journal file with current header followed by `records` and open it for appending"""
+        data = _dumpRecord(self.createHeader()) + records
+        node_storage.saveAtomic(self.getFilename(), lambda stream: stream.write(data), binary=True)
+        self._file = open(self.getFilename(), "ab")
+        self._last_sync = time.time()
+
+    def append(self, record):
+        """Append record into the journal file, compact the journal if it's too big"""
+        line = _dumpRecord(record)
+        if self._file is None: self.writeHeader()
+        self._file.write(line)
+        self._file.flush()
+        self._written += len(line)
+
+        if time.time() - self._last_sync >= self.sync_interval: self.sync()
+        else: self.scheduleSync()
+
+        if self._written - self._file_start > self.compact_size: self.compact()
+
+    def sync(self):
+        """Force appended records to disk"""
+        self._sync_scheduled = False
+        if self._file is None or self._file.closed: return
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._last_sync = time.time()
+
+    def scheduleSync(self):
+        """Sync appended records shortly, even when no more records come"""
+        if self._sync_scheduled or not self.scene.hasGraphics(): return
+        self._sync_scheduled = True
+        QtCore.QTimer.singleShot(int(self.sync_interval * 1000), self.sync)
+
+    def getMark(self):
+        """
+        :return: position in journaled changes, snapshot of the `Scene` taken now contains all changes up to it
+        :rtype: ``int``
+        """
+        return self._written
+
+    def startSave(self, filename):
+        """
+        Called when background save of the graph starts. If the journal is closed (graph wasn't saved yet) it's
+        opened for `filename` right away, so no change done while saving is missed
+
+        :param filename: saved graph file
+        :type filename: ``str``
+        :return: position in journaled changes, see :func:`getMark`
+        :rtype: ``int``
+        """
+        if not self.isOpen():
+            self.open(filename)
+            self._base = None   # nothing to recover until the save finishes
+        return self.getMark()
+
+    def compact(self):
+        """Write snapshot of the `Scene` on background thread, journal records it contains are dropped when done"""
+        if self._is_compacting or self._base is None: return
+        self._is_compacting = True
+        if DEBUG: print("node_journal: compacting", self.getFilename())
+        self.scene.saver.saveAsync(getSnapshotFilename(self.graph_filename), autosave=True)
+
+    def onSaved(self, job):
+        """
+        Handle finished :class:`~GUI.node_saver.SaveJob`. Snapshot replaces journal records before the job mark,
+        saved graph file (maybe new one after `Save As`) becomes the new base of the journal
+
+        :param job: finished save
+        :type job: :class:`~GUI.node_saver.SaveJob`
+        """
+        if job.autosave:
+            self._is_compacting = False
+            # graph could be saved elsewhere meanwhile
+            if job.error is None and self.isOpen() and job.filename == getSnapshotFilename(self.graph_filename):
+                self.rewrite(job.journal_mark, self.graph_filename, os.path.basename(job.filename))
+        elif job.error is None:
+            self.rewrite(job.journal_mark, job.filename, None)
+        elif self._base is None and job.filename == self.graph_filename:
+            self.close()    # first save failed, there is nothing the journal could be applied on
+
+    def rewrite(self, mark, graph_filename, snapshot):
+        """
+        Replace the journal by new one containing only records after `mark`
+
+        :param mark: position in journaled changes, see :func:`getMark`
+        :type mark: ``int``
+        :param graph_filename: graph file the new journal belongs to
+        :type graph_filename: ``str``
+        :param snapshot: name of snapshot file the records apply on, ``None`` applies them on the graph file
+        :type snapshot: ``str``
+        """
+        records = b""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            with open(self.getFilename(), "rb") as file:
+                file.readline()     # header
+                file.read(max(mark - self._file_start, 0))
+                records = file.read()
+        old_journal = self.getFilename()
+        old_snapshot = getSnapshotFilename(self.graph_filename) if self.isOpen() else None
+
+        self.graph_filename = graph_filename
+        self._base, self._snapshot = getFileStamp(graph_filename), snapshot
+        self._file_start = max(mark, self._file_start)
+        if records or snapshot is not None: self.writeHeader(records)     # snapshot has to be found after crash
+        elif os.path.exists(self.getFilename()): os.remove(self.getFilename())
+
+        # files not referenced anymore
+        if old_journal is not None and old_journal != self.getFilename() and os.path.exists(old_journal):
+            os.remove(old_journal)
+        if old_snapshot is not None and snapshot is None and os.path.exists(old_snapshot):
+            os.remove(old_snapshot)
+        if DEBUG: print("node_journal: rewritten", self.getFilename(), "with %d bytes of records" % len(records))
+
+    def loadFromFile(self, graph_filename, lazy=False):
+        """
+        Load graph file into the `Scene` and replay its journal left by a crashed session, if the journal belongs
+        to the current content of the graph file. Recovered `Scene` is marked modified
+
+        :param graph_filename: graph file
+        :type graph_filename: ``str``
+        :param lazy: create graphics lazily, see :func:`~GUI.node_editor.Scene.loadFromFile`
+        :type lazy: ``bool``
+        :return: ``True`` if changes were recovered from the journal
+        :rtype: ``bool``
+        :raises: :class:`~GUI.node_editor.InvalidFile` if there was an error decoding the graph file
+        """
+        header, records = readJournal(getJournalFilename(graph_filename))
+        if header is None or header.get('base') is None or header['base'] != getFileStamp(graph_filename):
+            self.scene.loadFromFile(graph_filename, lazy)
+            return False
+
+        source = graph_filename
+        if header.get('snapshot'):
+            source = os.path.join(os.path.dirname(graph_filename), header['snapshot'])
+        try: self.scene.loadFromFile(source, lazy)
+        except Exception:
+            if source == graph_filename: raise
+            # records may depend on the snapshot, replaying them on the graph file could mix two states
+            if DEBUG: print("node_journal: snapshot", source, "can't be loaded")
+            self.scene.loadFromFile(graph_filename, lazy)
+            return False
+
+        start = time.time()
+        if records: self.replay(records)
+        if DEBUG: print("node_journal: replayed %d records in %.3fs" % (len(records), time.time() - start))
+        recovered = bool(records) or source != graph_filename
+        if recovered: self.scene.has_been_modified = True
+        return recovered
+
+    def replay(self, records):
+        """Bring the `Scene` into the state after journal records. Records are merged first, so every touched
+        item is created, updated or removed only once"""
+        nodes, edges = mergeRecords(records)
+        history = self.scene.history    # committed state mirrors the Scene, captured by Scene.loadFromFile
+        self.scene.scheduler.suspendAsync()
+        try:
+            history.applyDelta(OrderedDict((item_id, (None, state)) for item_id, state in nodes.items()),
+                               OrderedDict((item_id, (None, state)) for item_id, state in edges.items()))
+        finally:
+            self.scene.scheduler.resumeAsync()
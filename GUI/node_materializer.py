@@ -0,0 +1,214 @@
+# -*- coding: utf-8 -*-
+"""
+This module containing lazy creation of `Node` graphics. When a graph is loaded lazily (see
+:func:`~GUI.node_editor.Scene.loadFromFile`) only the graph model is built (ids, positions, `Sockets`, `Edges`),
+``NodeGraphics``, content widgets and ``EdgeGraphics`` are created only for `Nodes` near the visible part of the view.
+More of them are created (materialized) when the user pans or zooms
+"""
+
+from collections import OrderedDict
+from PySide2 import QtCore
+
+import GUI.node_spatial as node_spatial
+
+DEBUG = False
+
+MATERIALIZE_MARGIN = 400            # scene pixels around visible area which get materialized too
+MATERIALIZE_NODE_SIZE = (200, 250)  # estimated size of `Node` without graphics
+MATERIALIZE_DELAY = 15              # ms, viewport changes during this time are handled at once
+MATERIALIZE_NODE_CELL = 1024        # scene pixels, grid cell of pending `Nodes`
+MATERIALIZE_EDGE_CELL = 4096        # scene pixels, grid cell of pending `Edges` (coarser, edges can be long)
+
+class SceneMaterializer():
+    """Class creating graphics of lazily loaded `Nodes` and `Edges` when they get close to the viewport"""
+    def __init__(self, scene):
+        """
+        :param scene: Reference to the :class:`~GUI.node_editor.Scene`
+        :type scene: :class:`~GUI.node_editor.Scene`
+
+        :Instance Attributes:
+
+        - **scene** - reference to the :class:`~GUI.node_editor.Scene`
+        - **is_deferring** - while ``True`` new `Nodes` and `Edges` don't create their graphics (lazy loading)
+        - **margin** - scene pixels around visible area which get materialized too
+        """
+        self.scene = scene
+        self.is_deferring = False
+        self.margin = MATERIALIZE_MARGIN
+
+        self._pending_nodes = OrderedDict()     # node id -> node without graphics
+        self._pending_edges = OrderedDict()     # edge id -> edge without graphics
+        self._node_grid = node_spatial.SpatialGrid(MATERIALIZE_NODE_CELL)   # pending nodes by estimated rect
+        self._edge_grid = node_spatial.SpatialGrid(MATERIALIZE_EDGE_CELL)   # pending edges by rect of both nodes
+        self._geometry = {}                     # (graphics class, socket rows) -> Graphics Node with the sizes
+        self._update_scheduled = False
+
+    def hasPending(self):
+        """
+        :return: ``True`` if some `Nodes` or `Edges` are still without graphics
+        :rtype: ``bool``
+        """
+        return bool(self._pending_nodes or self._pending_edges)
+
+    def collect(self):
+        """Register all `Nodes` and `Edges` of the `Scene` which have no graphics yet. Called after lazy loading"""
+        if not self.scene.hasGraphics(): return
+        for node in self.scene.iterNodes():
+            if node.node_graphic is not None: continue
+            self._pending_nodes[node.id] = node
+            self._node_grid.insert(node, *self.getNodeRect(node))
+        for edge in self.scene.iterEdges():
+            if edge.edge_graphic is not None or edge.start_socket is None or edge.end_socket is None: continue
+            self._pending_edges[edge.id] = edge
+            self._edge_grid.insert(edge, *self.getEdgeRect(edge))
+        if DEBUG: print("SceneMaterializer: pending %d nodes, %d edges" % (len(self._pending_nodes), len(self._pending_edges)))
+
+    def removeNode(self, node):
+        """Forget removed `Node`"""
+        if self._pending_nodes.get(node.id) is not node: return
+        del self._pending_nodes[node.id]
+        self._node_grid.remove(node)
+
+    def removeEdge(self, edge):
+        """Forget removed `Edge`"""
+        if self._pending_edges.get(edge.id) is not edge: return
+        del self._pending_edges[edge.id]
+        self._edge_grid.remove(edge)
+
+    def moveNode(self, node):
+        """Update indexed area of pending `Node` without graphics and of its pending `Edges` after it was moved"""
+        if self._pending_nodes.get(node.id) is node: self._node_grid.insert(node, *self.getNodeRect(node))
+        for socket in (node.inputs + node.outputs):
+            for edge in socket.edges:
+                if self._pending_edges.get(edge.id) is edge and edge.start_socket is not None and edge.end_socket is not None:
+                    self._edge_grid.insert(edge, *self.getEdgeRect(edge))
+
+    def scheduleUpdate(self):
+        """Materialize `Nodes` near the viewport shortly, many calls (i.e. while panning) are merged into one update"""
+        if self._update_scheduled or not self.hasPending() or not self.scene.hasGraphics(): return
+        self._update_scheduled = True
+        QtCore.QTimer.singleShot(MATERIALIZE_DELAY, self.update)
+
+    def getVisibleRect(self):
+        """Return united visible area of all views of the `Scene` extended by margin, ``None`` if there is no view
+
+        :rtype: ``QRectF``
+        """
+        rect = None
+        for view in self.scene.scene_graphic.views():
+            view_rect = view.mapToScene(view.viewport().rect()).boundingRect()
+            rect = view_rect if rect is None else rect.united(view_rect)
+        if rect is None: return None
+        return rect.adjusted(-self.margin, -self.margin, self.margin, self.margin)
+
+    def update(self):
+        """Materialize pending `Nodes` and `Edges` in the visible area"""
+        self._update_scheduled = False
+        if not self.hasPending() or not self.scene.hasGraphics(): return
+        rect = self.getVisibleRect()
+        if rect is not None: self.materializeRect(rect)
+
+    def getNodeRect(self, node):
+        """Return `Node` scene rect as ``(left, top, right, bottom)``, estimated for `Node` without graphics"""
+        if node.node_graphic is not None:
+            rect = node.node_graphic.sceneBoundingRect()
+            return rect.left(), rect.top(), rect.right(), rect.bottom()
+        x, y = node._pos
+        return x, y, x + MATERIALIZE_NODE_SIZE[0], y + MATERIALIZE_NODE_SIZE[1]
+
+    def getEdgeRect(self, edge):
+        """Return rect containing both `Nodes` of the `Edge` as ``(left, top, right, bottom)``"""
+        start_rect, end_rect = self.getNodeRect(edge.start_socket.node), self.getNodeRect(edge.end_socket.node)
+        return (min(start_rect[0], end_rect[0]), min(start_rect[1], end_rect[1]),
+                max(start_rect[2], end_rect[2]), max(start_rect[3], end_rect[3]))
+
+    def getGeometry(self, node):
+        """
+        Return Graphics Node of materialized `Node` of the same kind (graphics class and socket count), its sizes
+        are used to place `Sockets` of `Node` without graphics, so `Edges` to it can be drawn. If there is no such
+        `Node` yet, `node` itself is materialized
+
+        :param node: `Node` without graphics
+        :type node: :class:`~GUI.node_creator.NodeConfig`
+        :rtype: :class:`~GUI.node_creator.NodeGraphics`
+        """
+        geometry = self._geometry.get(self._getGeometryKey(node))
+        if geometry is None:
+            self.materializeNodes([node])
+            geometry = node.node_graphic
+        return geometry
+
+    def _getGeometryKey(self, node):
+        return (node.getGraphicsNodeClass(), node.segment_amount)
+
+    def materializeRect(self, rect):
+        """
+        Materialize pending `Nodes` intersecting `rect` and pending `Edges` crossing it. `Edge` needs graphics of its
+        start `Node`, the end `Node` can stay without graphics
+
+        :param rect: scene area
+        :type rect: ``QRectF``
+        :return: number of materialized `Nodes`
+        :rtype: ``int``
+        """
+        left, top, right, bottom = rect.left(), rect.top(), rect.right(), rect.bottom()
+        nodes = OrderedDict()
+
+        # only grid cells around the area are visited, not all pending items
+        for node in self._node_grid.query(left, top, right, bottom):
+            if node.node_graphic is not None:     # materialized meanwhile (i.e. edge connected to it)
+                self.removeNode(node)
+                continue
+            nodes[node.id] = node
+
+        edges = []
+        for edge in self._edge_grid.query(left, top, right, bottom):
+            if edge.edge_graphic is not None or edge.start_socket is None or edge.end_socket is None:
+                self.removeEdge(edge)
+                continue
+            edges.append(edge)
+            start = edge.start_socket.node
+            if start.node_graphic is None: nodes[start.id] = start
+
+        self.materializeNodes(list(nodes.values()))
+        for edge in edges:
+            if edge.edge_graphic is not None: continue
+            self.removeEdge(edge)
+            edge.initGraphics()
+
+        if DEBUG: print("SceneMaterializer: materialized %d nodes, %d edges, pending %d nodes, %d edges" % (
+            len(nodes), len(edges), len(self._pending_nodes), len(self._pending_edges)))
+        return len(nodes)
+
+    def materializeNodes(self, nodes):
+        """
+        Create graphics of `Nodes` and of their pending `Edges` whose both `Nodes` have graphics now
+
+        :param nodes: `Nodes` to materialize
+        :type nodes: list[:class:`~GUI.node_creator.NodeConfig`]
+        """
+        if not self.scene.hasGraphics(): return
+        for node in nodes:
+            self.removeNode(node)
+            if node.node_graphic is not None: continue
+            node.initGraphics()
+            self._geometry.setdefault(self._getGeometryKey(node), node.node_graphic)
+
+        for node in nodes:
+            for socket in (node.inputs + node.outputs):
+                for edge in socket.edges:
+                    if edge.edge_graphic is not None:
+                        edge.updatePositions()  # end of the edge was placed by borrowed geometry
+                        continue
+                    if edge.start_socket is None or edge.end_socket is None: continue
+                    if edge.start_socket.node.node_graphic is None or edge.end_socket.node.node_graphic is None: continue
+                    self.removeEdge(edge)
+                    edge.initGraphics()
+
+    def materializeAll(self):
+        """Create graphics of all pending `Nodes` and `Edges`"""
+        self.materializeNodes(list(self._pending_nodes.values()))
+        for edge in list(self._pending_edges.values()):
+            if edge.edge_graphic is None: edge.initGraphics()
+        self._pending_edges.clear()
+        self._edge_grid.clear()
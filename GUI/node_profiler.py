@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+"""
+This module containing evaluation profiler. When enabled, every `Node` evaluation records its wall time (own time,
+time spent evaluating input `Nodes` is excluded), call count and eval cache hits. Records are grouped per evaluation
+pass and summed since the profiler was cleared, so the most expensive `Nodes` can be listed or shown as heat map
+"""
+
+from collections import OrderedDict, deque
+
+import threading
+import time
+
+DEBUG = False
+
+PROFILER_PASSES = 32    # number of evaluation passes kept
+
+timer = getattr(time, 'perf_counter', time.time)    # python 2 has no perf_counter
+
+class NodeStats():
+    """Class containing evaluation statistics of one `Node`"""
+    def __init__(self, node_id, title):
+        """
+        :Instance Attributes:
+
+        - **node_id** - id of the `Node`
+        - **title** - title of the `Node` when it was evaluated
+        - **time** - own evaluation time in seconds
+        - **calls** - number of evaluations
+        - **cache_hits** - number of evaluations answered by eval cache
+        """
+        self.node_id = node_id
+        self.title = title
+        self.time = 0.0
+        self.calls = 0
+        self.cache_hits = 0
+
+    def __repr__(self):
+        return "<NodeStats %s %.3fms %d calls %d hits>" % (self.title, self.time*1000, self.calls, self.cache_hits)
+
+    def add(self, elapsed, cache_hit=False):
+        self.time += elapsed
+        self.calls += 1
+        if cache_hit: self.cache_hits += 1
+
+class EvalPass():
+    """Class containing statistics of one evaluation pass"""
+    def __init__(self, index):
+        """
+        :Instance Attributes:
+
+        - **index** - sequential number of the pass
+        - **nodes** - node id -> :class:`NodeStats`, in evaluation order
+        - **time** - total own time of all evaluated `Nodes` in seconds
+        """
+        self.index = index
+        self.nodes = OrderedDict()
+        self.time = 0.0
+
+    def __repr__(self):
+        return "<EvalPass %d: %d nodes %.3fms>" % (self.index, len(self.nodes), self.time*1000)
+
+    def getSorted(self):
+        """Return :class:`NodeStats` sorted from the most expensive
+
+        :rtype: list[:class:`NodeStats`]
+        """
+        return sorted(self.nodes.values(), key=lambda stats: stats.time, reverse=True)
+
+class EvalProfiler():
+    """Class contains per-node evaluation profiler of one `Scene`"""
+    def __init__(self, scene, max_passes=PROFILER_PASSES):
+        """
+        :param scene: Reference to the :class:`~GUI.node_editor.Scene`
+        :type scene: :class:`~GUI.node_editor.Scene`
+        :param max_passes: number of evaluation passes kept
+        :type max_passes: ``int``
+
+        :Instance Attributes:
+
+        - **scene** - reference to the :class:`~GUI.node_editor.Scene`
+        - **enabled** - if ``False`` nothing is recorded
+        - **heat_map** - if ``True`` `Nodes` are tinted by their cost (see :func:`getNodeCost`)
+        - **passes** - recorded :class:`EvalPass` objects, oldest first
+        """
+        self.scene = scene
+        self.enabled = False
+        self.heat_map = False
+        self.passes = deque(maxlen=max_passes)
+
+        self._pass_count = 0
+        self._current = None        # pass being recorded
+        self._totals = {}           # node id -> NodeStats summed over all passes since clear
+        self._max_time = 0.0        # highest total time, heat map scale
+        self._lock = threading.Lock()   # nodes can be evaluated from worker threads
+        self._thread_state = threading.local()  # stack of running evaluations of current thread
+
+    def beginPass(self):
+        """Start recording new evaluation pass, pass in progress is finished first"""
+        if not self.enabled: return
+        self.endPass()
+        with self._lock:
+            self._pass_count += 1
+            self._current = EvalPass(self._pass_count)
+
+    def endPass(self):
+        """Finish recording current evaluation pass and repaint the heat map"""
+        with self._lock:
+            if self._current is None: return
+            finished, self._current = self._current, None
+            if finished.nodes: self.passes.append(finished)
+        if DEBUG: print("EvalProfiler:", finished)
+        # headless Scene (batch, compile) has no graphics scene to repaint
+        if self.heat_map and finished.nodes and self.scene.scene_graphic is not None:
+            self.scene.scheduler.callInMainThread(self.scene.scene_graphic.update)
+
+    def start(self):
+        """Start measuring `Node` evaluation
+
+        :return: token passed to :func:`stop`, ``None`` when profiler is disabled
+        """
+        if not self.enabled: return None
+        stack = getattr(self._thread_state, 'stack', None)
+        if stack is None: stack = self._thread_state.stack = []
+        token = [timer(), 0.0]  # start time, time spent in nested evaluations
+        stack.append(token)
+        return token
+
+    def stop(self, node, token, cache_hit=False):
+        """Finish measuring `Node` evaluation started by :func:`start` and record it
+
+        :param node: evaluated `Node`
+        :type node: :class:`~GUI.node_creator.NodeConfig`
+        :param token: value returned by :func:`start`
+        :param cache_hit: ``True`` if result came from eval cache
+        :type cache_hit: ``bool``
+        """
+        if token is None: return
+        elapsed = timer() - token[0]
+        stack = self._thread_state.stack
+        stack.pop()
+        if stack: stack[-1][1] += elapsed   # parent's own time excludes this evaluation
+        own_time = max(elapsed - token[1], 0.0)
+
+        with self._lock:
+            if self._current is None:   # evaluation outside of scheduler pass
+                self._pass_count += 1
+                self._current = EvalPass(self._pass_count)
+            stats = self._current.nodes.get(node.id)
+            if stats is None: stats = self._current.nodes[node.id] = NodeStats(node.id, node.title)
+            stats.add(own_time, cache_hit)
+            self._current.time += own_time
+
+            total = self._totals.get(node.id)
+            if total is None: total = self._totals[node.id] = NodeStats(node.id, node.title)
+            total.title = node.title
+            total.add(own_time, cache_hit)
+            if total.time > self._max_time: self._max_time = total.time
+
+    def getLastPass(self):
+        """
+        :return: last recorded pass, ``None`` if nothing was recorded
+        :rtype: :class:`EvalPass`
+        """
+        return self.passes[-1] if self.passes else None
+
+    def getNodeStats(self, node):
+        """
+        :return: statistics of `Node` summed since the profiler was cleared, ``None`` if it wasn't evaluated
+        :rtype: :class:`NodeStats`
+        """
+        return self._totals.get(node.id)
+
+    def getTotals(self):
+        """Return statistics of all evaluated `Nodes` summed since the profiler was cleared, most expensive first
+
+        :rtype: list[:class:`NodeStats`]
+        """
+        with self._lock: totals = list(self._totals.values())
+        return sorted(totals, key=lambda stats: stats.time, reverse=True)
+
+    def getNodeCost(self, node):
+        """Return cost of `Node` relative to the most expensive one, used by heat map
+
+        :return: value between ``0.0`` and ``1.0``
+        :rtype: ``float``
+        """
+        stats = self._totals.get(node.id)
+        if stats is None or self._max_time <= 0.0: return 0.0
+        return stats.time / self._max_time
+
+    def removeNode(self, node_id):
+        """Forget statistics of removed `Node`
+
+        :param node_id: id of the `Node`
+        :type node_id: ``int``
+        """
+        with self._lock:
+            if self._totals.pop(node_id, None) is not None:
+                self._max_time = max([stats.time for stats in self._totals.values()] or [0.0])
+
+    def clear(self):
+        """Drop all recorded statistics"""
+        with self._lock:
+            self.passes.clear()
+            self._current = None
+            self._totals = {}
+            self._max_time = 0.0
@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+"""
+This module containing background saving of `Scene`. Serialized data of the `Scene` are captured on main thread
+(unchanged `Nodes` and `Edges` reuse serialized state kept by history, see
+:func:`~GUI.node_editor.SceneHistory.serializeScene`), encoding and writing the file runs on worker thread, so saving
+big graph doesn't block the UI
+"""
+
+from PySide2 import QtCore
+
+import GUI.node_storage as node_storage
+
+DEBUG = False
+
+class SaveJob(QtCore.QRunnable):
+    """Class representing background save started by :func:`SceneSaver.saveAsync`"""
+    def __init__(self, saver, data, filename, compact=False, callback=None, progress_callback=None, autosave=False):
+        """
+        :param saver: saver running this job
+        :type saver: :class:`SceneSaver`
+        :param data: snapshot of serialized `Scene`, it's never modified
+        :type data: ``dict``
+        :param filename: target file
+        :type filename: ``str``
+        :param compact: if ``True`` JSON is written without indentation and whitespace
+        :type compact: ``bool``
+        :param callback: function called on main thread with this job when it finishes
+        :type callback: ``function``
+        :param progress_callback: function called on main thread with ``(job, written, total)`` number of `Nodes`
+            and `Edges` while writing
+        :type progress_callback: ``function``
+        :param autosave: ``True`` for snapshot written by the journal, the `Scene` stays modified
+        :type autosave: ``bool``
+
+        :Instance Attributes:
+
+        - **filename** - target file
+        - **journal_mark** - position in changes journaled by :class:`~GUI.node_journal.SceneJournal` when the
+          snapshot was taken
+        - **modified_version** - :attr:`~GUI.node_editor.Scene.modified_version` when the snapshot was taken
+        - **error** - exception raised by writing, ``None`` when the file was saved
+        - **is_finished** - ``True`` when the job finished and its result was delivered
+        """
+        super(SaveJob, self).__init__()
+        self.setAutoDelete(False)   # python object is kept by the saver until finish is delivered
+        self.saver = saver
+        self.data = data
+        self.filename = filename
+        self.compact = compact
+        self.callback = callback
+        self.progress_callback = progress_callback
+        self.autosave = autosave
+        journal = saver.scene.journal
+        self.journal_mark = journal.getMark() if autosave else journal.startSave(filename)
+        self.modified_version = saver.scene.modified_version
+        self.error = None
+        self.is_finished = False
+
+    def isSuccessful(self):
+        """
+        :return: ``True`` if the file was written
+        :rtype: ``bool``
+        """
+        return self.is_finished and self.error is None
+
+    def run(self):
+        self.saver.runJob(self)
+
+class SaveJobNotifier(QtCore.QObject):
+    """Lives in main thread, delivers progress and finished :class:`SaveJob` from worker thread back to main thread"""
+    progress = QtCore.Signal(object, int, int)
+    finished = QtCore.Signal(object)
+
+    def __init__(self, saver):
+        super(SaveJobNotifier, self).__init__()
+        self.saver = saver
+        self.progress.connect(self.onProgress)
+        self.finished.connect(self.onFinished)
+
+    @QtCore.Slot(object, int, int)
+    def onProgress(self, job, written, total):
+        self.saver.onJobProgress(job, written, total)
+
+    @QtCore.Slot(object)
+    def onFinished(self, job):
+        self.saver.onJobFinished(job)
+
+class SceneSaver():
+    """Class saving `Scene` to file on worker thread"""
+    def __init__(self, scene):
+        """
+        :param scene: Reference to the :class:`~GUI.node_editor.Scene`
+        :type scene: :class:`~GUI.node_editor.Scene`
+
+        :Instance Attributes:
+
+        - **scene** - reference to the :class:`~GUI.node_editor.Scene`
+        """
+        self.scene = scene
+
+        self._thread_pool = None    # single thread, saves are written in order they were requested
+        self._notifier = None
+        self._jobs = []             # started jobs whose finish wasn't delivered yet
+
+    def saveAsync(self, filename, compact=False, callback=None, progress_callback=None, autosave=False):
+        """
+        Capture snapshot of the `Scene` and write it to file on worker thread. `has_been_modified` of the `Scene`
+        is cleared when the write succeeds and the `Scene` wasn't modified meanwhile
+
+        :param filename: target file, JSON or binary format by extension
+        :type filename: ``str``
+        :param compact: if ``True`` JSON is written without indentation and whitespace
+        :type compact: ``bool``
+        :param callback: function called on main thread with finished :class:`SaveJob`
+        :type callback: ``function``
+        :param progress_callback: function called on main thread with ``(job, written, total)`` while writing
+        :type progress_callback: ``function``
+        :param autosave: ``True`` for snapshot written by the journal, `has_been_modified` isn't cleared
+        :type autosave: ``bool``
+        :return: started job
+        :rtype: :class:`SaveJob`
+        """
+        if self._thread_pool is None:
+            self._thread_pool = QtCore.QThreadPool()
+            self._thread_pool.setMaxThreadCount(1)
+            self._notifier = SaveJobNotifier(self)
+
+        job = SaveJob(self, self.scene.history.serializeScene(), filename, compact, callback, progress_callback,
+                      autosave)
+        self._jobs.append(job)
+        self._thread_pool.start(job)
+        if DEBUG: print("SceneSaver: started saving", filename)
+        return job
+
+    def runJob(self, job):
+        """Write snapshot of the job to file, called on worker thread"""
+        try:
+            node_storage.writeFile(job.data, job.filename, job.compact,
+                                   progress=lambda written, total: self._notifier.progress.emit(job, written, total))
+        except Exception as e:
+            if DEBUG: print("SceneSaver: saving", job.filename, "failed:", e)
+            job.error = e
+        finally:
+            job.data = None
+            self._notifier.finished.emit(job)
+
+    def onJobProgress(self, job, written, total):
+        """Deliver progress of the job on main thread"""
+        if not job.is_finished and job.progress_callback is not None: job.progress_callback(job, written, total)
+
+    def onJobFinished(self, job):
+        """Finish the job on main thread: clear `has_been_modified` flag, update the journal and call its callback"""
+        if job.is_finished: return     # already delivered by waitForDone
+        job.is_finished = True
+        if job in self._jobs: self._jobs.remove(job)
+
+        if job.error is None and not job.autosave and job.modified_version == self.scene.modified_version:
+            self.scene.has_been_modified = False
+        self.scene.journal.onSaved(job)
+        if DEBUG: print("SceneSaver: finished saving", job.filename, job.error or "")
+
+        if job.callback is not None: job.callback(job)
+
+    def isSaving(self):
+        """
+        :return: ``True`` while some save didn't finish yet
+        :rtype: ``bool``
+        """
+        return bool(self._jobs)
+
+    def waitForDone(self):
+        """Block until all started saves are written and deliver their results (i.e. before closing the window)
+
+        :return: ``True`` if all of them succeeded
+        :rtype: ``bool``
+        """
+        if not self._jobs: return True
+        jobs = self._jobs[:]
+        self._thread_pool.waitForDone()
+        for job in jobs: self.onJobFinished(job)
+        return all(job.error is None for job in jobs)
@@ -0,0 +1,474 @@
+# -*- coding: utf-8 -*-
+"""
+This module containing evaluation scheduler. Given a set of changed `Nodes` it collects the downstream subgraph,
+orders it topologically once and evaluates every `Node` of the subgraph exactly once per pass. Optionally independent
+branches of the subgraph are evaluated in parallel on a thread pool. Interactive edits are evaluated as cancellable
+background job, results are applied on main thread when the job finishes
+"""
+
+from PySide2 import QtCore
+from collections import OrderedDict
+
+import threading
+
+try:
+    from concurrent import futures
+except ImportError:
+    futures = None  # parallel evaluation not available (python 2 without 'futures' backport)
+
+DEBUG = False
+
+PARALLEL_WORKERS = 4    # thread pool size used by parallel evaluation
+
+class EvaluationJob(QtCore.QRunnable):
+    """Class representing background evaluation pass started by :func:`NodeScheduler.evaluateAsync`"""
+    def __init__(self, scheduler, nodes, order):
+        """
+        :param scheduler: scheduler running this job
+        :type scheduler: :class:`NodeScheduler`
+        :param nodes: changed `Nodes`
+        :type nodes: list[:class:`~GUI.node_creator.NodeConfig`]
+        :param order: changed `Nodes` with all their descendants in topological order
+        :type order: list[:class:`~GUI.node_creator.NodeConfig`]
+
+        :Instance Attributes:
+
+        - **nodes** - changed `Nodes`, taken over by the job which cancels this one
+        - **order** - `Nodes` evaluated by this job
+        - **evaluated_nodes** - node id -> ``True``, `Nodes` already evaluated by this job (pass state of the job,
+          scheduler's own state belongs to synchronous passes on main thread)
+        - **scheduled_nodes** - ids of `Nodes` in `order`, see :func:`NodeScheduler.isScheduled`
+        - **main_thread_calls** - Qt calls requested during evaluation, applied when the job finishes
+        - **is_cancelled** - ``True`` when newer edit, structural edit (or synchronous pass) took over
+        """
+        super(EvaluationJob, self).__init__()
+        self.setAutoDelete(False)   # python object is kept by the scheduler until finish is delivered
+        self.scheduler = scheduler
+        self.nodes = nodes
+        self.order = order
+        self.evaluated_nodes = {}
+        self.scheduled_nodes = set(node.id for node in order)
+        self.main_thread_calls = []
+        self.is_cancelled = False
+
+    def cancel(self):
+        """Stop evaluation before next `Node`. Qt calls requested by this job are discarded, values it already
+        wrote into `Nodes` are overwritten by the job (or synchronous pass) which takes over its `Nodes`"""
+        self.is_cancelled = True
+
+    def run(self):
+        self.scheduler.runJob(self)
+
+class EvaluationJobNotifier(QtCore.QObject):
+    """Lives in main thread, delivers finished :class:`EvaluationJob` from worker thread back to main thread"""
+    finished = QtCore.Signal(object)
+
+    def __init__(self, callback):
+        super(EvaluationJobNotifier, self).__init__()
+        self.callback = callback
+        self.finished.connect(self.onFinished)
+
+    @QtCore.Slot(object)
+    def onFinished(self, job):
+        self.callback(job)
+
+class NodeScheduler():
+    """Class contains all the code for scheduling `Node` evaluation"""
+    def __init__(self, scene):
+        """
+        :param scene: Reference to the :class:`~GUI.node_editor.Scene`
+        :type scene: :class:`~GUI.node_editor.Scene`
+
+        :Instance Attributes:
+
+        - **scene** - reference to the :class:`~GUI.node_editor.Scene`
+        - **is_running** - ``True`` while synchronous evaluation pass is in progress (background jobs keep their
+          own state, see :class:`EvaluationJob`)
+        - **parallel** - if ``True`` independent branches are evaluated on thread pool (needs ``concurrent.futures``)
+        - **max_workers** - thread pool size
+        """
+        self.scene = scene
+        self.is_running = False
+        self.parallel = False
+        self.max_workers = PARALLEL_WORKERS
+
+        self._evaluated_nodes = {}  # node id -> True, nodes already evaluated in current pass
+        self._scheduled_nodes = set()   # ids of nodes in subgraph of current pass
+        self._pending_nodes = []    # nodes requested while pass was running, evaluated by next pass
+
+        self._executor = None
+        self._thread_state = threading.local()  # main_thread_calls list and job of current worker thread
+        self._main_thread_calls = []    # Qt calls requested from worker threads, flushed after parallel pass
+
+        self._thread_pool = None    # single thread running background jobs, see evaluateAsync
+        self._notifier = None
+        self._current_job = None    # latest background job, older ones are cancelled
+        self._jobs = []             # started jobs whose finish wasn't delivered yet
+        self._suspended = 0         # > 0 while new jobs are deferred (scene is being deserialized), see suspendAsync
+        self._deferred_nodes = []   # changed nodes of deferred and stopped jobs, evaluated by resumeAsync
+        self._deferred_order = []   # nodes marked Pending by stopped jobs
+        self._resume_scheduled = False
+
+    def getDownstreamNodes(self, nodes):
+        """Return given `Nodes` with all their descendants, each `Node` only once
+
+        :param nodes: starting `Nodes`
+        :type nodes: list[:class:`~GUI.node_creator.NodeConfig`]
+        :rtype: list[:class:`~GUI.node_creator.NodeConfig`]
+        """
+        visited = OrderedDict()
+        stack = list(nodes)
+        while stack:
+            node = stack.pop()
+            if node.id in visited: continue
+            visited[node.id] = node
+            stack.extend(node.getChildrenNodes())
+        return list(visited.values())
+
+    def sortTopologically(self, nodes):
+        """Order `Nodes` so every `Node` comes after all of its parents inside given subgraph (Kahn's algorithm).
+        `Nodes` inside a cycle can't be ordered, they're appended at the end
+
+        :param nodes: `Nodes` of the subgraph
+        :type nodes: list[:class:`~GUI.node_creator.NodeConfig`]
+        :rtype: list[:class:`~GUI.node_creator.NodeConfig`]
+        """
+        subgraph = OrderedDict((node.id, node) for node in nodes)
+        children = {}
+        in_degree = dict((node_id, 0) for node_id in subgraph)
+        for node_id, node in subgraph.items():
+            children[node_id] = [child for child in node.getChildrenNodes() if child.id in subgraph]
+            for child in children[node_id]: in_degree[child.id] += 1
+
+        ready = [node for node_id, node in subgraph.items() if in_degree[node_id] == 0]
+        ready.reverse()     # pop from the end, keep original order for independent nodes
+        order = []
+        while ready:
+            node = ready.pop()
+            order.append(node)
+            for child in children[node.id]:
+                in_degree[child.id] -= 1
+                if in_degree[child.id] == 0: ready.append(child)
+
+        if len(order) < len(subgraph):
+            if DEBUG: print("!W", "NodeScheduler::sortTopologically", "cycle detected, unordered nodes appended")
+            ordered = set(node.id for node in order)
+            order.extend(node for node_id, node in subgraph.items() if node_id not in ordered)
+
+        return order
+
+    def getComponents(self, nodes):
+        """Split ordered `Nodes` into independent branches (weakly connected components of the subgraph).
+        Every branch keeps the topological order
+
+        :param nodes: topologically ordered `Nodes` of the subgraph
+        :type nodes: list[:class:`~GUI.node_creator.NodeConfig`]
+        :rtype: list[list[:class:`~GUI.node_creator.NodeConfig`]]
+        """
+        parent = dict((node.id, node.id) for node in nodes)
+
+        def find(node_id):
+            while parent[node_id] != node_id:
+                parent[node_id] = parent[parent[node_id]]
+                node_id = parent[node_id]
+            return node_id
+
+        for node in nodes:
+            for child in node.getChildrenNodes():
+                if child.id in parent: parent[find(child.id)] = find(node.id)
+
+        components = OrderedDict()
+        for node in nodes: components.setdefault(find(node.id), []).append(node)
+        return list(components.values())
+
+    def canRunParallel(self):
+        """Return ``True`` if parallel evaluation is enabled and available
+
+        :rtype: ``bool``
+        """
+        return self.parallel and futures is not None
+
+    def callInMainThread(self, callback, *args):
+        """Call `callback` now, or when called from worker thread queue it until the parallel pass (or background job)
+        finishes. Used for everything touching Qt (graphics update, tool tips, labels)
+
+        :param callback: function to call
+        """
+        calls = getattr(self._thread_state, 'main_thread_calls', None)
+        if calls is not None: calls.append((callback, args))
+        else: callback(*args)
+
+    def getCurrentJob(self):
+        """Return background job running on current thread
+
+        :return: running job, ``None`` when called outside of worker thread
+        :rtype: :class:`EvaluationJob`
+        """
+        return getattr(self._thread_state, 'job', None)
+
+    def getEvaluatedNodes(self):
+        # pass state of current thread: background job keeps its own, None when no pass is running
+        job = self.getCurrentJob()
+        if job is not None: return job.evaluated_nodes
+        return self._evaluated_nodes if self.is_running else None
+
+    def isEvaluated(self, node):
+        """Return ``True`` if `Node` was already evaluated during current pass
+
+        :rtype: ``bool``
+        """
+        evaluated_nodes = self.getEvaluatedNodes()
+        return evaluated_nodes is not None and node.id in evaluated_nodes
+
+    def isScheduled(self, node):
+        """Return ``True`` if `Node` belongs to the subgraph of current pass. Its descendants were marked `Dirty` when
+        the pass started and are evaluated after it, so the `Node` doesn't need to walk them again
+
+        :rtype: ``bool``
+        """
+        job = self.getCurrentJob()
+        if job is not None: return node.id in job.scheduled_nodes
+        return self.is_running and node.id in self._scheduled_nodes
+
+    def markEvaluated(self, node):
+        """Remember `Node` was evaluated during current pass (also nodes pulled as inputs outside the subgraph)"""
+        evaluated_nodes = self.getEvaluatedNodes()
+        if evaluated_nodes is not None: evaluated_nodes[node.id] = True
+
+    def evaluate(self, nodes):
+        """
+        Mark given `Nodes` with all their descendants `Dirty` and evaluate them in topological order. When called
+        while pass is running (i.e. evaluation changed some input), `Nodes` are evaluated by next pass
+
+        :param nodes: changed `Nodes`
+        :type nodes: list[:class:`~GUI.node_creator.NodeConfig`]
+        :return: evaluated `Nodes` in evaluation order
+        :rtype: list[:class:`~GUI.node_creator.NodeConfig`]
+        """
+        if self.getCurrentJob() is not None:
+            # input changed by background job, graph can't be evaluated from worker thread
+            self.callInMainThread(self.evaluateAsync, list(nodes))
+            return []
+        if self.is_running:
+            self._pending_nodes.extend(nodes)
+            return []
+
+        # background job can't run along, this pass takes over its nodes
+        nodes = self.cancelJobs() + list(nodes)
+
+        evaluated = []
+        while nodes:
+            order = self.sortTopologically(self.getDownstreamNodes(nodes))
+            for node in order:
+                node.markDirty(update_graphics=False)
+                node.markPending(False, update_graphics=False)
+            self.scene.updateNodesGraphics(order)
+
+            components = self.getComponents(order) if self.canRunParallel() else [order]
+
+            self._scheduled_nodes = set(node.id for node in order)
+            self.is_running = True
+            self.scene.profiler.beginPass()
+            try:
+                if len(components) > 1: self.evaluateParallel(order, components)
+                else: self.evaluateNodes(order)
+            finally:
+                self.is_running = False
+                self._evaluated_nodes = {}
+                self._scheduled_nodes = set()
+                self.scene.profiler.endPass()
+
+            if DEBUG: print("NodeScheduler: evaluated %d nodes" % len(order))
+            evaluated.extend(order)
+            nodes, self._pending_nodes = self._pending_nodes, []
+
+        return evaluated
+
+    def evaluateNodes(self, nodes, job=None):
+        """Evaluate ordered `Nodes` one by one, skip the ones already evaluated in current pass
+
+        :param job: background job, evaluation stops when it gets cancelled
+        :type job: :class:`EvaluationJob`
+        """
+        evaluated_nodes = job.evaluated_nodes if job is not None else self._evaluated_nodes
+        for node in nodes:
+            if job is not None and job.is_cancelled: return
+            if node.id in evaluated_nodes: continue
+            node.eval()
+            self.markEvaluated(node)
+
+    def evaluateParallel(self, order, components):
+        """
+        Evaluate independent branches on thread pool. Dirty parents outside of the subgraph (shared between branches)
+        are evaluated on main thread first, Qt calls requested by workers are applied on main thread afterwards
+
+        :param order: topologically ordered `Nodes` of the subgraph
+        :param components: independent branches of the subgraph, see :func:`getComponents`
+        """
+        subgraph = set(node.id for node in order)
+        for node in order:
+            for socket in node.inputs:
+                for edge in socket.edges:
+                    parent = edge.getOtherSocket(socket).node
+                    if parent.id not in subgraph and parent.isDirty(): parent.eval()
+
+        if self._executor is None: self._executor = futures.ThreadPoolExecutor(max_workers=self.max_workers)
+        self._main_thread_calls = []
+        try:
+            jobs = [self._executor.submit(self._evaluateInWorker, component) for component in components]
+            for job in jobs: job.result()   # wait for all branches, re-raise worker exception
+        finally:
+            calls, self._main_thread_calls = self._main_thread_calls, []
+            for callback, args in calls: callback(*args)
+        if DEBUG: print("NodeScheduler: %d branches evaluated in parallel" % len(components))
+
+    def _evaluateInWorker(self, nodes):
+        self._thread_state.main_thread_calls = self._main_thread_calls
+        try: self.evaluateNodes(nodes)
+        finally: self._thread_state.main_thread_calls = None
+
+    def evaluateAsync(self, nodes):
+        """
+        Evaluate given `Nodes` with all their descendants as background job, so editing doesn't block the UI.
+        Job in flight is cancelled and its `Nodes` are evaluated by the new one. `Nodes` are marked `Pending`
+        until the job finishes and its Qt calls are applied on main thread in one batch. Values written by the job
+        are read on main thread only after :func:`finishJobs`
+
+        :param nodes: changed `Nodes`
+        :type nodes: list[:class:`~GUI.node_creator.NodeConfig`]
+        :return: started job, ``None`` when requested during synchronous pass (`Nodes` are evaluated by next pass)
+            or while jobs are suspended (`Nodes` are evaluated by :func:`resumeAsync`)
+        :rtype: :class:`EvaluationJob`
+        """
+        if self.getCurrentJob() is not None:
+            self.callInMainThread(self.evaluateAsync, list(nodes))
+            return None
+        if self.is_running:
+            self._pending_nodes.extend(nodes)
+            return None
+        if self._suspended:
+            self._deferred_nodes.extend(nodes)
+            return None
+
+        nodes = list(nodes)
+        if self._current_job is not None:
+            self._current_job.cancel()
+            nodes = self._current_job.nodes + nodes
+
+        order = self.sortTopologically(self.getDownstreamNodes(nodes))
+        for node in order: node.markPending(update_graphics=False)
+        self.scene.updateNodesGraphics(order)
+
+        if self._thread_pool is None:
+            self._thread_pool = QtCore.QThreadPool()
+            self._thread_pool.setMaxThreadCount(1)  # jobs run one after another, cancelled one stops quickly
+            self._notifier = EvaluationJobNotifier(self.onJobFinished)
+
+        job = EvaluationJob(self, nodes, order)
+        self._current_job = job
+        self._jobs.append(job)
+        self._thread_pool.start(job)
+        if DEBUG: print("NodeScheduler: started background job of %d nodes" % len(order))
+        return job
+
+    def runJob(self, job):
+        """Evaluate `Nodes` of the background job, called on worker thread. Pass state is kept by the job, the
+        scheduler's one is left to main thread"""
+        self._thread_state.main_thread_calls = job.main_thread_calls
+        self._thread_state.job = job
+        self.scene.profiler.beginPass()
+        try:
+            if not job.is_cancelled:
+                for node in job.order: node.markDirty(update_graphics=False)
+                self.evaluateNodes(job.order, job)
+        finally:
+            self.scene.profiler.endPass()
+            self._thread_state.job = None
+            self._thread_state.main_thread_calls = None
+            self._notifier.finished.emit(job)
+
+    def onJobFinished(self, job):
+        """Apply Qt calls and clear `Pending` state of finished background job on main thread. Qt calls of cancelled
+        job are dropped, its `Nodes` are evaluated again by the job (or pass) which cancelled it"""
+        if job in self._jobs: self._jobs.remove(job)
+        if job is not self._current_job or job.is_cancelled:
+            if DEBUG: print("NodeScheduler: dropped cancelled background job")
+            return
+        self._current_job = None
+
+        for callback, args in job.main_thread_calls: callback(*args)
+        nodes = [node for node in job.order if self.scene.getNodeByID(node.id) is node]   # skip nodes removed meanwhile
+        for node in nodes: node.markPending(False, update_graphics=False)
+        self.scene.updateNodesGraphics(nodes)
+        if DEBUG: print("NodeScheduler: applied background job of %d nodes" % len(nodes))
+
+    def isEvaluatingAsync(self):
+        """Return ``True`` while background job results weren't applied yet
+
+        :rtype: ``bool``
+        """
+        return self._current_job is not None
+
+    def finishJobs(self):
+        """
+        Wait until current background job finishes and apply it right away instead of next event loop iteration.
+        Called before `Node` values are read or changed on main thread (:func:`ZenoNode.eval`, context menu), so
+        they never see values of job in flight. Does nothing on worker threads
+        """
+        if self._current_job is None or self.is_running or self.getCurrentJob() is not None: return
+        self._thread_pool.waitForDone()
+        if self._current_job is not None: self.onJobFinished(self._current_job)
+
+    def cancelJobs(self):
+        """Cancel background jobs and wait until worker thread stops
+
+        :return: changed `Nodes` of the latest job, they still need evaluation
+        :rtype: list[:class:`~GUI.node_creator.NodeConfig`]
+        """
+        if not self._jobs: return []
+        for job in self._jobs: job.cancel()
+        self._thread_pool.waitForDone()
+        nodes = self._current_job.nodes if self._current_job is not None else []
+        self._current_job = None
+        return nodes
+
+    def stopJobs(self):
+        """
+        Cancel background jobs and wait until worker thread stops, called before every structural edit (worker
+        mustn't walk `Edges` being changed). Changed `Nodes` of the stopped job are evaluated by new job once the
+        edit is done (next event loop iteration, or :func:`resumeAsync` when jobs are suspended)
+        """
+        if not self._jobs: return
+        order = self._current_job.order if self._current_job is not None else []
+        nodes = self.cancelJobs()
+        if not nodes: return
+        self._deferred_nodes.extend(nodes)
+        self._deferred_order.extend(order)
+        if not self._suspended and not self._resume_scheduled:
+            self._resume_scheduled = True
+            QtCore.QTimer.singleShot(0, self.resumeDeferred)
+
+    def suspendAsync(self):
+        """
+        Stop background jobs and defer new ones until matching :func:`resumeAsync`. Used while `Scene` is being
+        deserialized (history restore, paste), so no job runs on half built graph
+        """
+        self._suspended += 1
+        self.stopJobs()
+
+    def resumeAsync(self):
+        """End :func:`suspendAsync`, `Nodes` changed meanwhile are evaluated as one background job"""
+        self._suspended = max(self._suspended - 1, 0)
+        if not self._suspended: self.resumeDeferred()
+
+    def resumeDeferred(self):
+        """Evaluate `Nodes` of deferred and stopped jobs as new background job, removed `Nodes` are skipped"""
+        self._resume_scheduled = False
+        if self._suspended: return
+        nodes, self._deferred_nodes = self._deferred_nodes, []
+        order, self._deferred_order = self._deferred_order, []
+        order = [node for node in order if self.scene.getNodeByID(node.id) is node]
+        for node in order: node.markPending(False, update_graphics=False)
+        self.scene.updateNodesGraphics(order)
+        nodes = [node for node in nodes if self.scene.getNodeByID(node.id) is node]
+        if nodes: self.evaluateAsync(nodes)
@@ -0,0 +1,357 @@
+# -*- coding: utf-8 -*-
+"""
+This module containing spatial indexes of the `Scene`. ``GraphicsScene`` runs without Qt's item index (see
+:class:`~GUI.node_editor.GraphicsScene`), so asking it for items in an area walks all items of the scene. Indexes
+here are uniform grids updated incrementally when items move, area queries visit only the grid cells around the
+area.
+
+Hit-testing of big scene can be compared against Qt's own lookup by ``benchmarks/spatial_index.py``
+"""
+
+from PySide2 import QtCore, QtWidgets
+
+DEBUG = False
+
+GRID_CELL_SIZE = 128        # scene pixels, size of one grid cell
+SOCKET_EXTENT = 6.0         # half size of `Graphics Socket` bounding rect (radius and outline)
+MAX_VOLATILE_ITEMS = 16     # untracked items tested on every query, more of them are indexed like tracked ones
+
+class SpatialGrid():
+    """Uniform grid of items with axis aligned bounds"""
+    def __init__(self, cell_size=GRID_CELL_SIZE):
+        """
+        :param cell_size: size of one grid cell in scene pixels
+        :type cell_size: ``float``
+
+        :Instance Attributes:
+
+        - **cell_size** - size of one grid cell in scene pixels
+        """
+        self.cell_size = cell_size
+
+        self._cells = {}    # (column, row) -> {item: bounds}
+        self._items = {}    # item -> (bounds, cell range)
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, item):
+        return item in self._items
+
+    def getCellRange(self, left, top, right, bottom):
+        """Return ``(first column, first row, last column, last row)`` of cells touched by the bounds"""
+        size = self.cell_size
+        return int(left // size), int(top // size), int(right // size), int(bottom // size)
+
+    def insert(self, item, left, top, right, bottom):
+        """
+        Add `item` into the grid or move it to new bounds
+
+        :param item: indexed object
+        :param left: left bound in scene coordinates
+        :type left: ``float``
+        :param top: top bound in scene coordinates
+        :type top: ``float``
+        :param right: right bound in scene coordinates
+        :type right: ``float``
+        :param bottom: bottom bound in scene coordinates
+        :type bottom: ``float``
+        """
+        bounds = (left, top, right, bottom)
+        cell_range = self.getCellRange(left, top, right, bottom)
+        old = self._items.get(item)
+        if old is not None:
+            if old[0] == bounds: return
+            if old[1] == cell_range:
+                # moved inside the same cells, only bounds change
+                self._items[item] = (bounds, cell_range)
+                for cell in self._iterCells(cell_range): self._cells[cell][item] = bounds
+                return
+            self.remove(item)
+
+        self._items[item] = (bounds, cell_range)
+        for cell in self._iterCells(cell_range):
+            cell_items = self._cells.get(cell)
+            if cell_items is None: cell_items = self._cells[cell] = {}
+            cell_items[item] = bounds
+
+    def remove(self, item):
+        """Remove `item` from the grid, unknown items are ignored"""
+        old = self._items.pop(item, None)
+        if old is None: return
+        for cell in self._iterCells(old[1]):
+            cell_items = self._cells[cell]
+            del cell_items[item]
+            if not cell_items: del self._cells[cell]
+
+    def clear(self):
+        """Remove all items"""
+        self._cells.clear()
+        self._items.clear()
+
+    def getBounds(self, item):
+        """Return ``(left, top, right, bottom)`` of indexed `item`, ``None`` if it isn't indexed"""
+        entry = self._items.get(item)
+        return entry[0] if entry is not None else None
+
+    def query(self, left, top, right, bottom):
+        """
+        Return items whose bounds intersect the area
+
+        :rtype: ``list``
+        """
+        cell_range = self.getCellRange(left, top, right, bottom)
+        cell_count = (cell_range[2] - cell_range[0] + 1) * (cell_range[3] - cell_range[1] + 1)
+        if cell_count > len(self._cells):
+            # area bigger than populated part of the grid, walk items instead of empty cells
+            candidates = ((item, entry[0]) for item, entry in self._items.items())
+        else:
+            candidates = self._iterCandidates(cell_range)
+
+        found = {}
+        for item, bounds in candidates:
+            if item in found: continue
+            if bounds[0] <= right and bounds[2] >= left and bounds[1] <= bottom and bounds[3] >= top: found[item] = True
+        return list(found.keys())
+
+    def _iterCells(self, cell_range):
+        first_column, first_row, last_column, last_row = cell_range
+        for column in range(first_column, last_column + 1):
+            for row in range(first_row, last_row + 1):
+                yield (column, row)
+
+    def _iterCandidates(self, cell_range):
+        cells = self._cells
+        for cell in self._iterCells(cell_range):
+            cell_items = cells.get(cell)
+            if cell_items is None: continue
+            for item_bounds in cell_items.items(): yield item_bounds
+
+class SocketIndex():
+    """Index of scene positions of `Sockets` with graphics, used for socket snapping and highlighting. `Sockets` of
+    moved `Nodes` are re-indexed lazily before next query, so dragging doesn't touch the grid"""
+    def __init__(self, scene, cell_size=GRID_CELL_SIZE):
+        """
+        :param scene: Reference to the :class:`~GUI.node_editor.Scene`
+        :type scene: :class:`~GUI.node_editor.Scene`
+        :param cell_size: size of one grid cell in scene pixels
+        :type cell_size: ``float``
+
+        :Instance Attributes:
+
+        - **scene** - reference to the :class:`~GUI.node_editor.Scene`
+        - **grid** - :class:`SpatialGrid` of `Sockets`
+        """
+        self.scene = scene
+        self.grid = SpatialGrid(cell_size)
+
+        self._positions = {}    # socket -> (x, y) scene position
+        self._dirty_nodes = {}  # nodes which moved since last query, their sockets need re-indexing
+
+    def updateSocket(self, socket):
+        """Index current scene position of the `Socket`, `Socket` without graphics is removed from the index"""
+        socket_graphic = socket.socket_graphic
+        if socket_graphic is None or socket.node.node_graphic is None:
+            self.removeSocket(socket)
+            return
+        node_pos, socket_pos = socket.node.node_graphic.pos(), socket_graphic.pos()
+        x, y = node_pos.x() + socket_pos.x(), node_pos.y() + socket_pos.y()
+        self._positions[socket] = (x, y)
+        self.grid.insert(socket, x - SOCKET_EXTENT, y - SOCKET_EXTENT, x + SOCKET_EXTENT, y + SOCKET_EXTENT)
+
+    def updateNode(self, node):
+        """Index current scene positions of all `Sockets` of the `Node` (i.e. after it moved)"""
+        self._dirty_nodes.pop(node, None)
+        for socket in (node.inputs + node.outputs): self.updateSocket(socket)
+
+    def markNodeDirty(self, node):
+        """Re-index `Sockets` of the `Node` before next query, i.e. after it moved"""
+        self._dirty_nodes[node] = True
+
+    def update(self):
+        """Re-index `Sockets` of dirty `Nodes`, removed `Nodes` are skipped"""
+        if not self._dirty_nodes: return
+        nodes, self._dirty_nodes = self._dirty_nodes, {}
+        for node in nodes:
+            if self.scene.getNodeByID(node.id) is node: self.updateNode(node)
+
+    def removeSocket(self, socket):
+        """Remove `Socket` from the index"""
+        if self._positions.pop(socket, None) is not None: self.grid.remove(socket)
+
+    def clear(self):
+        """Remove all `Sockets` from the index"""
+        self._positions.clear()
+        self._dirty_nodes.clear()
+        self.grid.clear()
+
+    def getPosition(self, socket):
+        """Return indexed ``(x, y)`` scene position of the `Socket`, ``None`` if it isn't indexed"""
+        self.update()
+        return self._positions.get(socket)
+
+    def getSocketsInRect(self, left, top, right, bottom):
+        """
+        Return `Sockets` which `Graphics Socket` intersects the scene area
+
+        :rtype: list[:class:`~GUI.node_creator.SocketConfig`]
+        """
+        self.update()
+        return self.grid.query(left, top, right, bottom)
+
+    def getSocketsNear(self, x, y, radius):
+        """
+        Return `Sockets` which `Graphics Socket` intersects square area of `radius` around the scene point
+
+        :rtype: list[:class:`~GUI.node_creator.SocketConfig`]
+        """
+        self.update()
+        return self.grid.query(x - radius, y - radius, x + radius, y + radius)
+
+    def getNearestSocket(self, x, y, radius):
+        """
+        Return the `Socket` nearest to the scene point from `Sockets` returned by :func:`getSocketsNear`
+
+        :return: ``(socket, (x, y))`` nearest `Socket` and its scene position, ``(None, None)`` if there is none
+        :rtype: ``tuple``
+        """
+        nearest, nearest_socket, nearest_pos = None, None, None
+        for socket in self.getSocketsNear(x, y, radius):
+            pos = self._positions[socket]
+            dx, dy = pos[0] - x, pos[1] - y
+            dist = dx * dx + dy * dy    # squared length is enough for comparison
+            if nearest is None or dist < nearest: nearest, nearest_socket, nearest_pos = dist, socket, pos
+        return nearest_socket, nearest_pos
+
+class ItemIndex():
+    """
+    Index of top level ``QGraphicsItems`` of ``GraphicsScene`` backing hit-testing (see
+    :func:`~GUI.node_editor.GraphicsView.itemAt`), rubber band selection and cutting of `Edges`. Bounds of tracked
+    items (`Graphics Nodes`, `Graphics Edges` and cut line) are recomputed lazily after they're marked dirty. Other
+    items can change their geometry unnoticed, so they're tested on every query. Only first ``MAX_VOLATILE_ITEMS``
+    of them, more untracked items are indexed by their bounds like tracked ones (changes must be reported by
+    :func:`markDirty`)
+    """
+    def __init__(self, cell_size=GRID_CELL_SIZE):
+        """
+        :param cell_size: size of one grid cell in scene pixels
+        :type cell_size: ``float``
+
+        :Instance Attributes:
+
+        - **grid** - :class:`SpatialGrid` of tracked items
+        """
+        self.grid = SpatialGrid(cell_size)
+
+        self._order = {}        # item -> insertion number, later inserted items stack on top of earlier ones
+        self._dirty = {}        # tracked items which bounds need update
+        self._volatile = {}     # items which are always tested
+        self._counter = 0
+
+    def addItem(self, item, tracked=True):
+        """
+        Index top level item added into the scene
+
+        :param item: item added by ``QGraphicsScene.addItem``
+        :type item: ``QGraphicsItem``
+        :param tracked: ``True`` if changes of item geometry are reported by :func:`markDirty`
+        :type tracked: ``bool``
+        """
+        self._counter += 1
+        self._order[item] = self._counter
+        if tracked or len(self._volatile) >= MAX_VOLATILE_ITEMS: self._dirty[item] = True
+        else: self._volatile[item] = True
+
+    def removeItem(self, item):
+        """Forget item removed from the scene"""
+        if self._order.pop(item, None) is None: return
+        self._dirty.pop(item, None)
+        self._volatile.pop(item, None)
+        self.grid.remove(item)
+
+    def markDirty(self, item):
+        """Recompute bounds of tracked item before next query, i.e. after it moved"""
+        if item in self._order and item not in self._volatile: self._dirty[item] = True
+
+    def clear(self):
+        """Forget all items"""
+        self.grid.clear()
+        self._order.clear()
+        self._dirty.clear()
+        self._volatile.clear()
+
+    def getItemBounds(self, item):
+        """Return ``(left, top, right, bottom)`` scene bounds of item including its children"""
+        rect = item.mapRectToScene(item.boundingRect().united(item.childrenBoundingRect()))
+        return rect.left(), rect.top(), rect.right(), rect.bottom()
+
+    def update(self):
+        """Recompute bounds of dirty items"""
+        if not self._dirty: return
+        for item in self._dirty: self.grid.insert(item, *self.getItemBounds(item))
+        self._dirty.clear()
+
+    def query(self, rect):
+        """
+        Return top level items whose bounds (with children) intersect scene rect, topmost first
+
+        :param rect: scene area
+        :type rect: ``QRectF``
+        :rtype: list[``QGraphicsItem``]
+        """
+        self.update()
+        left, top, right, bottom = rect.left(), rect.top(), rect.right(), rect.bottom()
+        items = self.grid.query(left, top, right, bottom)
+        for item in self._volatile:
+            bounds = self.getItemBounds(item)
+            if bounds[0] <= right and bounds[2] >= left and bounds[1] <= bottom and bounds[3] >= top: items.append(item)
+        order = self._order
+        items.sort(key=lambda item: (item.zValue(), order[item]), reverse=True)
+        return items
+
+    def itemAt(self, path):
+        """
+        Return topmost visible item (top level or child) which shape intersects the scene path, the same item
+        ``QGraphicsView.itemAt`` finds
+
+        :param path: scene area, usually one view pixel mapped into the scene
+        :type path: ``QPainterPath``
+        :rtype: ``QGraphicsItem`` or ``None``
+        """
+        for item in self.query(path.boundingRect()):
+            hit = self._hitItem(item, path)
+            if hit is not None: return hit
+        return None
+
+    def _hitItem(self, item, path):
+        # children stack above their parent (unless flagged otherwise), the last child is the topmost one
+        if not item.isVisible(): return None
+        children = item.childItems()
+        behind = []
+        for child in reversed(children):
+            if child.flags() & QtWidgets.QGraphicsItem.ItemStacksBehindParent:
+                behind.append(child)
+                continue
+            hit = self._hitItem(child, path)
+            if hit is not None: return hit
+        if item.collidesWithPath(item.mapFromScene(path), QtCore.Qt.IntersectsItemShape): return item
+        for child in behind:
+            hit = self._hitItem(child, path)
+            if hit is not None: return hit
+        return None
+
+    def selectableItemsInPath(self, path, mode=QtCore.Qt.IntersectsItemShape):
+        """
+        Return visible selectable top level items which shape intersects the scene path (rubber band selection)
+
+        :param path: scene area
+        :type path: ``QPainterPath``
+        :param mode: how the shape of item has to collide with the path
+        :type mode: ``QtCore.Qt.ItemSelectionMode``
+        :rtype: list[``QGraphicsItem``]
+        """
+        items = []
+        for item in self.query(path.boundingRect()):
+            if not item.isVisible() or not item.flags() & QtWidgets.QGraphicsItem.ItemIsSelectable: continue
+            if item.collidesWithPath(item.mapFromScene(path), mode): items.append(item)
+        return items
@@ -0,0 +1,373 @@
+# -*- coding: utf-8 -*-
+"""
+This module containing `Scene` file writing and reading. `Nodes` and `Edges` are serialized and written one by one,
+so the whole serialized `Scene` is never held in memory as one string. Files are written into temporary file next to
+the target and renamed over it when complete, so crash in the middle of saving never corrupts existing file.
+
+Besides JSON, graphs can be stored in compact binary format (selected by file extension, see :data:`BINARY_EXTENSION`).
+It stores the same data as JSON: struct-packed tables of `Nodes`, `Sockets` and `Edges` plus string table of titles and
+content, so converting between both formats is lossless. Converter: ``python -m GUI.node_storage source destination``
+
+Binary layout (little endian, version 1)::
+
+    header      magic "ZGB\\0", version (H), flags (H), string count, node count, socket count, edge count, scene string (I)
+    strings     length (I) + utf-8 bytes, each different string stored once
+    nodes       id (Q), flags (B), title, pos x, pos y, input count, output count, content, extra keys
+    sockets     id (Q), index (H), position (B), multi edges (B), socket type (i), inputs of all nodes first
+    edges       id (Q), flags (B), edge type (i), start (Q), end (Q)
+
+Records which don't fit the tables (i.e. unexpected keys or types) are stored as JSON string instead
+"""
+
+from collections import OrderedDict
+
+import json
+import os
+import struct
+import sys
+import tempfile
+
+DEBUG = False
+
+JSON_INDENT = 4     # indentation of non-compact files
+PROGRESS_STEP = 256 # written `Nodes` and `Edges` between progress reports
+
+BINARY_EXTENSION = ".zgb"
+BINARY_MAGIC = b"ZGB\0"
+BINARY_VERSION = 1
+
+class BinaryFormatError(Exception): pass
+
+def writeJSON(scene, stream, indent=JSON_INDENT):
+    """
+    Write serialized `Scene` into text stream, same document as ``json.dumps(scene.serialize(), indent=indent)``
+
+    :param scene: `Scene` to write
+    :type scene: :class:`~GUI.node_editor.Scene`
+    :param stream: opened text file
+    :param indent: indentation, ``None`` for compact output (no whitespace)
+    :type indent: ``int``
+    """
+    writeJSONData(scene.serializeHeader(),
+                  (node.serialize() for node in scene.iterNodes()),
+                  (edge.serialize() for edge in scene.iterEdges()),
+                  stream, indent)
+
+def writeJSONData(header, nodes, edges, stream, indent=JSON_INDENT):
+    """
+    Write already serialized `Scene` into text stream, one `Node` and `Edge` at a time
+
+    :param header: serialized `Scene` without `Nodes` and `Edges`, see :func:`~GUI.node_editor.Scene.serializeHeader`
+    :type header: ``dict``
+    :param nodes: serialized `Nodes` (any iterable, i.e. generator)
+    :param edges: serialized `Edges` (any iterable)
+    :param stream: opened text file
+    :param indent: indentation, ``None`` for compact output (no whitespace)
+    :type indent: ``int``
+    """
+    if indent is None: item_separator, key_separator = ",", ":"
+    else: item_separator, key_separator = ",", ": "
+
+    def newline(depth):
+        return "" if indent is None else "\n" + " " * (indent * depth)
+
+    def encode(value, depth):
+        # nested value starts on current line, its following lines are shifted to the depth (json strings don't contain raw newlines)
+        text = json.dumps(value, indent=indent, separators=(item_separator, key_separator))
+        return text if indent is None else text.replace("\n", newline(depth))
+
+    stream.write("{")
+    separator = ""
+    for key, value in header.items():
+        stream.write(separator + newline(1) + json.dumps(key) + key_separator + encode(value, 1))
+        separator = item_separator
+
+    for key, items in (('nodes', nodes), ('edges', edges)):
+        stream.write(separator + newline(1) + json.dumps(key) + key_separator + "[")
+        count = 0
+        for item in items:
+            stream.write((item_separator if count else "") + newline(2) + encode(item, 2))
+            count += 1
+        stream.write((newline(1) if count else "") + "]")
+        separator = item_separator
+
+    stream.write(newline(0) + "}")
+
+def replaceFile(source, destination):
+    """Rename `source` over `destination` (atomic where the platform allows it)"""
+    if hasattr(os, 'replace'): os.replace(source, destination)     # python 3.3+, atomic on windows too
+    else:
+        if os.name == 'nt' and os.path.exists(destination): os.remove(destination)
+        os.rename(source, destination)
+
+def saveAtomic(filename, write, binary=False):
+    """
+    Write file through temporary file in the same directory, which is renamed over `filename` only when
+    writing succeeded. Existing file is left untouched if writing fails
+
+    :param filename: target file path
+    :type filename: ``str``
+    :param write: function writing content into given opened stream
+    :type write: ``function``
+    :param binary: open temporary file in binary mode
+    :type binary: ``bool``
+    """
+    directory = os.path.dirname(os.path.abspath(filename))
+    handle, temp_path = tempfile.mkstemp(prefix=".%s." % os.path.basename(filename), suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(handle, "wb" if binary else "w") as stream:
+            write(stream)
+            stream.flush()
+            os.fsync(stream.fileno())
+
+        # temporary file is private (0600), keep permissions of the saved file
+        if os.path.exists(filename):
+            os.chmod(temp_path, os.stat(filename).st_mode & 0o7777)
+        else:
+            umask = os.umask(0)
+            os.umask(umask)
+            os.chmod(temp_path, 0o666 & ~umask)
+
+        replaceFile(temp_path, filename)
+        if DEBUG: print("node_storage: saved", filename)
+    except:
+        if os.path.exists(temp_path): os.remove(temp_path)
+        raise
+
+# ------------------------------------------ binary format ------------------------------------------
+
+_HEADER = struct.Struct("<4sHHIIIII")
+_LENGTH = struct.Struct("<I")
+_NODE = struct.Struct("<QBIddHHII")
+_SOCKET = struct.Struct("<QHBBi")
+_EDGE = struct.Struct("<QBiQQ")
+
+_NO_STRING = 0xFFFFFFFF
+_RECORD_JSON = 1    # record flag, whole record stored as JSON string
+_EDGE_NO_START = 2
+_EDGE_NO_END = 4
+
+_NODE_KEYS = ['id', 'title', 'pos_x', 'pos_y', 'inputs', 'outputs', 'content']
+_SOCKET_KEYS = ['id', 'index', 'multi_edges', 'position', 'socket_type']
+_EDGE_KEYS = ['id', 'edge_type', 'start', 'end']
+
+_string_types = (str, type(u""))
+
+def _isInt(value, low, high):
+    return type(value) in (int, type(2**64)) and low <= value <= high   # type() excludes bool, python 2 has long
+
+def _dumpCompact(value):
+    return json.dumps(value, separators=(",", ":"))
+
+_decoder = json.JSONDecoder(object_pairs_hook=OrderedDict)   # json.loads() creates new decoder on every call
+
+def _loadOrdered(text):
+    return _decoder.decode(text)
+
+def _unpackTable(record, buffer, offset, count):
+    """Return list of `count` records unpacked from `buffer` at `offset`"""
+    end = offset + record.size * count
+    if end > len(buffer): raise struct.error("table ends after the end of file")
+    if hasattr(record, 'iter_unpack'): return list(record.iter_unpack(buffer[offset:end]))    # python 3.4+
+    return [record.unpack_from(buffer, position) for position in range(offset, end, record.size)]
+
+def _fitsSocket(data):
+    return (list(data.keys()) == _SOCKET_KEYS and _isInt(data['id'], 0, 2**64-1) and _isInt(data['index'], 0, 0xFFFF)
+            and type(data['multi_edges']) is bool and _isInt(data['position'], 0, 0xFF) and _isInt(data['socket_type'], -2**31, 2**31-1))
+
+def _fitsNode(data):
+    return (list(data.keys())[:len(_NODE_KEYS)] == _NODE_KEYS and _isInt(data['id'], 0, 2**64-1)
+            and isinstance(data['title'], _string_types) and type(data['pos_x']) is float and type(data['pos_y']) is float
+            and len(data['inputs']) <= 0xFFFF and len(data['outputs']) <= 0xFFFF
+            and all(_fitsSocket(socket) for socket in data['inputs'] + data['outputs']))
+
+def _fitsEdge(data):
+    return (list(data.keys()) == _EDGE_KEYS and _isInt(data['id'], 0, 2**64-1) and _isInt(data['edge_type'], -2**31, 2**31-1)
+            and (data['start'] is None or _isInt(data['start'], 0, 2**64-1)) and (data['end'] is None or _isInt(data['end'], 0, 2**64-1)))
+
+def packBinary(header, nodes, edges):
+    """
+    Pack serialized `Scene` into binary format
+
+    :param header: serialized `Scene` without `Nodes` and `Edges`, see :func:`~GUI.node_editor.Scene.serializeHeader`
+    :type header: ``dict``
+    :param nodes: serialized `Nodes` (any iterable, i.e. generator)
+    :param edges: serialized `Edges` (any iterable)
+    :rtype: ``bytes``
+    """
+    strings = OrderedDict()     # string -> index
+
+    def intern(text):
+        index = strings.get(text)
+        if index is None: index = strings[text] = len(strings)
+        return index
+
+    node_table, socket_table, edge_table = bytearray(), bytearray(), bytearray()
+    node_count = socket_count = edge_count = 0
+
+    for data in nodes:
+        node_count += 1
+        if not _fitsNode(data):
+            node_table += _NODE.pack(0, _RECORD_JSON, intern(_dumpCompact(data)), 0.0, 0.0, 0, 0, _NO_STRING, _NO_STRING)
+            continue
+        extra = OrderedDict((key, value) for key, value in data.items() if key not in _NODE_KEYS)
+        node_table += _NODE.pack(data['id'], 0, intern(data['title']), data['pos_x'], data['pos_y'],
+                                 len(data['inputs']), len(data['outputs']), intern(_dumpCompact(data['content'])),
+                                 intern(_dumpCompact(extra)) if extra else _NO_STRING)
+        for socket in data['inputs'] + data['outputs']:
+            socket_count += 1
+            socket_table += _SOCKET.pack(socket['id'], socket['index'], socket['position'], socket['multi_edges'], socket['socket_type'])
+
+    for data in edges:
+        edge_count += 1
+        if not _fitsEdge(data):
+            edge_table += _EDGE.pack(0, _RECORD_JSON, intern(_dumpCompact(data)), 0, 0)
+            continue
+        flags = (_EDGE_NO_START if data['start'] is None else 0) | (_EDGE_NO_END if data['end'] is None else 0)
+        edge_table += _EDGE.pack(data['id'], flags, data['edge_type'], data['start'] or 0, data['end'] or 0)
+
+    scene_string = intern(_dumpCompact(header))
+    string_table = bytearray()
+    for text in strings:
+        encoded = text.encode("utf-8")
+        string_table += _LENGTH.pack(len(encoded))
+        string_table += encoded
+
+    header_bytes = _HEADER.pack(BINARY_MAGIC, BINARY_VERSION, 0, len(strings), node_count, socket_count, edge_count, scene_string)
+    return bytes(header_bytes) + bytes(string_table) + bytes(node_table) + bytes(socket_table) + bytes(edge_table)
+
+def unpackBinary(buffer):
+    """
+    Unpack binary format back to serialized `Scene`, the same data as loaded from JSON file
+
+    :param buffer: content of binary file
+    :type buffer: ``bytes``
+    :rtype: ``OrderedDict``
+    :raises: :class:`BinaryFormatError` if `buffer` isn't valid binary graph
+    """
+    try:
+        magic, version, flags, string_count, node_count, socket_count, edge_count, scene_string = _HEADER.unpack_from(buffer, 0)
+    except struct.error: raise BinaryFormatError("file is too short")
+    if magic != BINARY_MAGIC: raise BinaryFormatError("not a binary graph file")
+    if version > BINARY_VERSION: raise BinaryFormatError("binary graph version %d is not supported (max %d)" % (version, BINARY_VERSION))
+
+    try:
+        offset = _HEADER.size
+        strings = []
+        for index in range(string_count):
+            length, = _LENGTH.unpack_from(buffer, offset)
+            offset += _LENGTH.size
+            strings.append(buffer[offset:offset+length].decode("utf-8"))
+            offset += length
+
+        node_records = _unpackTable(_NODE, buffer, offset, node_count)
+        offset += _NODE.size * node_count
+        socket_records = _unpackTable(_SOCKET, buffer, offset, socket_count)
+        offset += _SOCKET.size * socket_count
+        edge_records = _unpackTable(_EDGE, buffer, offset, edge_count)
+
+        sockets = [OrderedDict([('id', socket_id), ('index', socket_index), ('multi_edges', bool(multi_edges)),
+                                ('position', position), ('socket_type', socket_type)])
+                   for socket_id, socket_index, position, multi_edges, socket_type in socket_records]
+
+        nodes = []
+        socket_offset = 0
+        for node_id, node_flags, title, pos_x, pos_y, input_count, output_count, content, extra in node_records:
+            if node_flags & _RECORD_JSON:
+                nodes.append(_loadOrdered(strings[title]))
+                continue
+            inputs = sockets[socket_offset:socket_offset+input_count]
+            outputs = sockets[socket_offset+input_count:socket_offset+input_count+output_count]
+            socket_offset += input_count + output_count
+            node = OrderedDict([('id', node_id), ('title', strings[title]), ('pos_x', pos_x), ('pos_y', pos_y),
+                                ('inputs', inputs), ('outputs', outputs), ('content', _loadOrdered(strings[content]))])
+            if extra != _NO_STRING: node.update(_loadOrdered(strings[extra]))
+            nodes.append(node)
+
+        edges = []
+        for edge_id, edge_flags, edge_type, start, end in edge_records:
+            if edge_flags & _RECORD_JSON:
+                edges.append(_loadOrdered(strings[edge_type]))
+                continue
+            edges.append(OrderedDict([('id', edge_id), ('edge_type', edge_type),
+                                      ('start', None if edge_flags & _EDGE_NO_START else start),
+                                      ('end', None if edge_flags & _EDGE_NO_END else end)]))
+
+        data = _loadOrdered(strings[scene_string])
+    except (struct.error, IndexError, ValueError) as e:
+        raise BinaryFormatError("corrupted binary graph file (%s)" % e)
+
+    data['nodes'] = nodes
+    data['edges'] = edges
+    return data
+
+def isBinaryFile(filename):
+    """Return ``True`` if `filename` has binary graph extension"""
+    return os.path.splitext(filename)[1].lower() == BINARY_EXTENSION
+
+def writeBinary(scene, stream):
+    """Write `Scene` in binary format into binary stream, `Nodes` and `Edges` are serialized one by one"""
+    stream.write(packBinary(scene.serializeHeader(),
+                            (node.serialize() for node in scene.iterNodes()),
+                            (edge.serialize() for edge in scene.iterEdges())))
+
+def readFile(filename):
+    """
+    Read serialized `Scene` from JSON or binary file (by extension)
+
+    :rtype: ``dict``
+    """
+    if isBinaryFile(filename):
+        with open(filename, "rb") as file: return unpackBinary(file.read())
+    with open(filename, "r") as file: return _loadOrdered(file.read())
+
+def _reportProgress(items, progress, done, total):
+    # yield items and report number of written items every PROGRESS_STEP items
+    for index, item in enumerate(items, 1):
+        yield item
+        if index % PROGRESS_STEP == 0: progress(done + index, total)
+
+def writeFile(data, filename, compact=False, progress=None):
+    """
+    Write serialized `Scene` to JSON or binary file (by extension), atomically
+
+    :param data: serialized `Scene`, see :func:`~GUI.node_editor.Scene.serialize`
+    :type data: ``dict``
+    :param filename: target file path
+    :type filename: ``str``
+    :param compact: if ``True`` JSON is written without indentation and whitespace
+    :type compact: ``bool``
+    :param progress: optional function called with ``(written, total)`` number of `Nodes` and `Edges`
+    :type progress: ``function``
+    """
+    nodes, edges = data['nodes'], data['edges']
+    header = OrderedDict((key, value) for key, value in data.items() if key not in ('nodes', 'edges'))
+    total = len(nodes) + len(edges)
+    if progress is not None:
+        nodes, edges = _reportProgress(nodes, progress, 0, total), _reportProgress(edges, progress, len(nodes), total)
+
+    if isBinaryFile(filename):
+        saveAtomic(filename, lambda stream: stream.write(packBinary(header, nodes, edges)), binary=True)
+    else:
+        indent = None if compact else JSON_INDENT
+        saveAtomic(filename, lambda stream: writeJSONData(header, nodes, edges, stream, indent))
+    if progress is not None: progress(total, total)
+
+def convertFile(source, destination, compact=False):
+    """Convert graph file between JSON and binary format (formats are chosen by extensions)"""
+    writeFile(readFile(source), destination, compact)
+
+def main(argv=None):
+    args = sys.argv[1:] if argv is None else argv
+    compact = "--compact" in args
+    paths = [arg for arg in args if arg != "--compact"]
+    if len(paths) != 2:
+        sys.stderr.write("usage: python -m GUI.node_storage [--compact] source destination\n"
+                         "convert graph file between JSON and binary (%s) format\n" % BINARY_EXTENSION)
+        return 2
+    convertFile(paths[0], paths[1], compact)
+    if DEBUG: print("converted %s (%d bytes) -> %s (%d bytes)" % (paths[0], os.path.getsize(paths[0]), paths[1], os.path.getsize(paths[1])))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,214 @@
+""" This module evaluates saved graph files (like the ones in ZCore/Save) from command line, without maya and without
+editor window. Every file is loaded into headless scene, all Output nodes are evaluated and result is written as one
+JSON line per file. Files are processed in parallel by process pool.
+
+Input nodes can be bound to arrays of sample values (i.e. driven key sweep), the graph is then evaluated element-wise
+over NumPy arrays in one pass (see :func:`ZCore.NodeBase.evalBatch`) and Output nodes report arrays
+
+usage: python -m ZCore.Batch [-j JOBS] [-o OUTPUT] [-b ID=VALUES ...] path [path ...]
+"""
+
+from collections import OrderedDict
+
+import argparse
+import functools
+import glob
+import json
+import multiprocessing
+import os
+import sys
+import time
+
+import GUI.node_editor as node_editor
+import GUI.node_storage as node_storage
+import ZCore.Config as Config
+import ZCore.NodeBase as NodeBase
+
+DEBUG = False
+
+def collectFiles(paths):
+    """
+    Expand directories to graph files inside (JSON and binary, not recursive), keep order and drop duplicates
+
+    :param paths: graph files or directories containing them
+    :type paths: list[``str``]
+    :return: absolute paths of graph files
+    :rtype: list[``str``]
+    """
+    files = OrderedDict()
+    for path in paths:
+        if os.path.isdir(path):
+            for pattern in ("*.json", "*" + node_storage.BINARY_EXTENSION):
+                for file_path in sorted(glob.glob(os.path.join(path, pattern))): files[os.path.abspath(file_path)] = True
+        else: files[os.path.abspath(path)] = True
+    return list(files.keys())
+
+def toJSON(value):
+    """
+    Convert evaluated value to JSON serializable one, values can be NumPy arrays or scalars (batch evaluation)
+
+    :param value: value of Output node
+    :return: list for arrays, python number for NumPy scalars, otherwise `value` itself
+    """
+    if NodeBase.isArray(value): return value.tolist()
+    if hasattr(value, 'item'): return value.item()
+    return value
+
+def loadValues(source):
+    """
+    Load sample values bound to Input node: ``start:stop:count`` sweep, ``.npy`` file, ``.json`` file with list of
+    numbers or text file with one number per line
+
+    :param source: sweep specification or path to file with values
+    :type source: ``str``
+    :return: sample values
+    :rtype: ``numpy.ndarray``
+    :raises BatchNotAvailable: when NumPy is not installed
+    """
+    numpy = NodeBase.numpy
+    if numpy is None: raise NodeBase.BatchNotAvailable("NumPy is not installed, batch evaluation is not available")
+    sweep = source.split(":")
+    if len(sweep) == 3 and not os.path.exists(source):
+        return numpy.linspace(float(sweep[0]), float(sweep[1]), int(sweep[2]))
+    if source.endswith(".npy"): return numpy.load(source)
+    if source.endswith(".json"):
+        with open(source) as file: return numpy.asarray(json.load(file))
+    return numpy.loadtxt(source, ndmin=1)
+
+def parseBindings(specs):
+    """
+    Parse ``ID=VALUES`` command line bindings, see :func:`loadValues` for `VALUES` forms
+
+    :param specs: bindings from command line, can be ``None``
+    :type specs: list[``str``]
+    :return: Input node id -> sample values
+    :rtype: ``OrderedDict``
+    :raises ValueError: when binding is not in ``ID=VALUES`` form
+    """
+    bindings = OrderedDict()
+    for spec in specs or []:
+        node_id, _, source = spec.partition("=")
+        if not source: raise ValueError("binding '%s' is not in ID=VALUES form" % spec)
+        bindings[int(node_id)] = loadValues(source)
+    return bindings
+
+def loadScene(file_path):
+    """
+    Load graph file (JSON or binary) into new headless `Scene`
+
+    :param file_path: path to graph file
+    :type file_path: ``str``
+    :return: loaded `Scene` without graphics
+    :rtype: :class:`~GUI.node_editor.Scene`
+    :raises: :class:`~GUI.node_editor.InvalidFile` if there was an error decoding the file
+    """
+    scene = node_editor.Scene(headless=True)
+    scene.setNodeClassSelector(lambda data: Config.get_class_from_opcode(data['op_code']))
+    scene.loadFromFile(file_path)
+    return scene
+
+def evaluateFile(file_path, bindings=None):
+    """
+    Load graph file into headless scene and evaluate all its Output nodes
+
+    :param file_path: path to graph file
+    :type file_path: ``str``
+    :param bindings: Input node id -> sample values, downstream of these nodes is evaluated over arrays
+    :type bindings: ``dict``
+    :return: result with keys 'file', 'ok', 'time', 'outputs' (id, title, value, valid, message) or 'error'
+    :rtype: ``OrderedDict``
+    """
+    result = OrderedDict([('file', file_path), ('ok', False)])
+    start = time.time()
+    try:
+        scene = loadScene(file_path)
+        outputs = [node for node in scene.iterNodes() if getattr(node, 'op_code', None) == Config.OP_NODE_OUTPUT]
+        scene.scheduler.evaluate(scene.nodes)
+        if bindings:
+            bound = OrderedDict()
+            for node_id, values in bindings.items():
+                node = scene.getNodeByID(node_id)
+                if node is None or not hasattr(node, 'bindBatch'): raise ValueError("no Input node with id %d" % node_id)
+                bound[node] = values
+            NodeBase.evalBatch(scene, bound, keep_bound=True)
+
+        result['outputs'] = [OrderedDict([
+            ('id', node.id),
+            ('title', node.title),
+            ('value', toJSON(node.value) if not node.isInvalid() else None),
+            ('valid', not node.isInvalid()),
+            ('message', node.tool_tip),
+        ]) for node in outputs]
+        result['ok'] = all(output['valid'] for output in result['outputs'])
+    except Exception as e:
+        if DEBUG: raise
+        result['error'] = "%s: %s" % (e.__class__.__name__, e)
+    result['time'] = round(time.time() - start, 6)
+    return result
+
+def redirectPrints():
+    """Send prints to stderr, node code prints diagnostics and stdout is kept for JSON lines only"""
+    sys.stdout = sys.stderr
+
+def evaluateFiles(files, jobs=1, bindings=None):
+    """
+    Evaluate graph files, in parallel worker processes when `jobs` > 1
+
+    :param files: paths to graph files
+    :type files: list[``str``]
+    :param jobs: number of worker processes
+    :type jobs: ``int``
+    :param bindings: Input node id -> sample values, applied to every file
+    :type bindings: ``dict``
+    :return: results of :func:`evaluateFile` in the order of `files`
+    :rtype: generator of ``OrderedDict``
+    """
+    if jobs <= 1 or len(files) <= 1:
+        for file_path in files: yield evaluateFile(file_path, bindings)
+        return
+
+    pool = multiprocessing.Pool(processes=min(jobs, len(files)), initializer=redirectPrints)
+    try:
+        for result in pool.imap(functools.partial(evaluateFile, bindings=bindings), files): yield result
+    finally:
+        pool.close()
+        pool.join()
+
+def main(argv=None):
+    """
+    Command line entry point, writes one JSON line per graph file
+
+    :param argv: command line arguments, ``None`` means ``sys.argv``
+    :type argv: list[``str``]
+    :return: exit code, 1 if any graph file failed
+    :rtype: ``int``
+    """
+    parser = argparse.ArgumentParser(prog="python -m ZCore.Batch", description="Evaluate Output nodes of saved graph files and write results as JSON lines")
+    parser.add_argument("paths", nargs="+", help="graph files or directories containing them")
+    parser.add_argument("-j", "--jobs", type=int, default=multiprocessing.cpu_count(), help="number of worker processes (default: cpu count)")
+    parser.add_argument("-o", "--output", help="write results to file instead of stdout")
+    parser.add_argument("-b", "--bind", action="append", metavar="ID=VALUES", help="bind Input node to sample values evaluated element-wise: start:stop:count, .npy, .json or text file (needs NumPy)")
+    args = parser.parse_args(argv)
+
+    try: bindings = parseBindings(args.bind)
+    except Exception as e: parser.error(str(e))
+
+    files = collectFiles(args.paths)
+    stdout = sys.stdout
+    stream = open(args.output, "w") if args.output else stdout
+    failed = 0
+    redirectPrints()
+    try:
+        for result in evaluateFiles(files, args.jobs, bindings):
+            if not result['ok']: failed += 1
+            stream.write(json.dumps(result) + "\n")
+            stream.flush()
+    finally:
+        sys.stdout = stdout
+        if stream is not stdout: stream.close()
+
+    if failed: sys.stderr.write("%d of %d graph files failed\n" % (failed, len(files)))
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
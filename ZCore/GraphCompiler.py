@@ -0,0 +1,225 @@
+""" This module compiles ZenoNode math graph (Input -> operations -> Output) into a single flat Python function,
+so graphs evaluated thousands of times (parameter sweeps, rig validation) skip walking nodes, sockets and edges """
+
+from collections import OrderedDict
+
+import ZCore.Config as Config
+
+DEBUG = False
+
+COMPILED_CACHE_SIZE = 16    # number of compiled structures kept per scene (undo of structural edit reuses them)
+
+class CompileError(Exception):
+    """Raised when graph contains `Node` which can't be compiled or compiled graph is called with wrong arguments"""
+    pass
+
+class CompiledGraph(object):
+    """Compiled graph, call it with Input values (in `input_ids` order) to get tuple of Output values"""
+    def __init__(self, function, source, input_ids, output_ids, structure_key):
+        """
+        :param function: compiled python function
+        :type function: ``callable``
+        :param source: python source of the `function`
+        :type source: ``str``
+        :param input_ids: Input node ids in argument order
+        :type input_ids: list[``int``]
+        :param output_ids: Output node ids in result order
+        :type output_ids: list[``int``]
+        :param structure_key: structural hash of the graph, see :func:`GraphCompiler.getStructureKey`
+        :type structure_key: ``tuple``
+
+        :Instance Attributes:
+
+        - **function** - compiled python function
+        - **source** - python source of the function, printed when ``DEBUG`` is on
+        - **input_ids** - Input node ids in argument order
+        - **output_ids** - Output node ids in result order
+        - **structure_key** - structural hash the graph was compiled for
+        """
+        self.function = function
+        self.source = source
+        self.input_ids = input_ids      # Input node ids in argument order
+        self.output_ids = output_ids    # Output node ids in result order
+        self.structure_key = structure_key
+
+    def __call__(self, *args):
+        """
+        Evaluate compiled graph
+
+        :param args: Input values in `input_ids` order, numbers or numpy arrays (batch evaluation)
+        :return: Output values in `output_ids` order, ``None`` for invalid Outputs
+        :rtype: ``tuple``
+        :raises CompileError: when number of `args` doesn't match number of Inputs
+        """
+        if len(args) != len(self.input_ids):
+            raise CompileError("compiled graph expects %d inputs, got %d" % (len(self.input_ids), len(args)))
+        return self.function(*args)
+
+def getCompiler(scene):
+    """
+    Return compiler owned by the `Scene`, its compiled graphs are reused until structure of the `Scene` changes
+
+    :param scene: `Scene` with ZenoNode graph
+    :type scene: :class:`~GUI.node_editor.Scene`
+    :return: compiler of the `Scene`, created on first use
+    :rtype: :class:`GraphCompiler`
+    """
+    if scene.compiler is None: scene.compiler = GraphCompiler(scene)
+    return scene.compiler
+
+class GraphCompiler(object):
+    """Class compiling `Scene` graph into :class:`CompiledGraph`, keeps compiled graphs of recent structures"""
+    def __init__(self, scene):
+        """
+        :param scene: Reference to the :class:`~GUI.node_editor.Scene`
+        :type scene: :class:`~GUI.node_editor.Scene`
+
+        :Instance Attributes:
+
+        - **scene** - reference to the :class:`~GUI.node_editor.Scene`
+        """
+        self.scene = scene
+
+        self._compiled = OrderedDict()  # structure key -> CompiledGraph
+        self._current = None
+        self._current_version = None    # scene.structure_version the current compiled graph was checked against
+
+    def getCompiled(self):
+        """
+        Return compiled graph for current `Scene` structure, graph is recompiled only when `Edges` or `Nodes`
+        (their op_codes) changed
+
+        :return: compiled graph
+        :rtype: :class:`CompiledGraph`
+        :raises CompileError: when graph contains `Node` which can't be compiled
+        """
+        if self._current is not None and self._current_version == self.scene.structure_version:
+            return self._current
+
+        structure_key = self.getStructureKey()
+        compiled = self._compiled.pop(structure_key, None)
+        if compiled is None:
+            compiled = self.compile(structure_key)
+            if DEBUG: print("GraphCompiler: compiled\n%s" % compiled.source)
+        self._compiled[structure_key] = compiled
+        while len(self._compiled) > COMPILED_CACHE_SIZE: self._compiled.popitem(last=False)
+
+        self._current = compiled
+        self._current_version = self.scene.structure_version
+        return compiled
+
+    def evaluate(self, *args):
+        """
+        Evaluate compiled graph of current `Scene` structure, see :func:`CompiledGraph.__call__`
+
+        :param args: Input values in Input `Nodes` order
+        :return: Output values in Output `Nodes` order
+        :rtype: ``tuple``
+        """
+        return self.getCompiled()(*args)
+
+    def getGraphNodes(self):
+        """
+        Collect Output `Nodes` with all their ancestors. Only ZenoNodes can be compiled
+
+        :return: `Nodes` in topological order
+        :rtype: list[:class:`~ZCore.NodeBase.ZenoNode`]
+        :raises CompileError: when ancestor isn't ZenoNode
+        """
+        visited = OrderedDict()
+        stack = [node for node in self.scene.iterNodes() if getattr(node, 'op_code', None) == Config.OP_NODE_OUTPUT]
+        while stack:
+            node = stack.pop()
+            if node.id in visited: continue
+            if not hasattr(node, 'op_code'): raise CompileError("node '%s' can't be compiled" % node.title)
+            visited[node.id] = node
+            stack.extend(parent for parent in self.getInputNodes(node) if parent is not None)
+        return self.scene.scheduler.sortTopologically(list(visited.values()))
+
+    def getInputNodes(self, node):
+        """
+        Get first `Node` connected to every `Input Socket` of `node` (like :func:`NodeConfig.getInput`)
+
+        :param node: `Node` which inputs are collected
+        :type node: :class:`~ZCore.NodeBase.ZenoNode`
+        :return: connected `Nodes` in socket order, ``None`` for not connected socket
+        :rtype: list[:class:`~ZCore.NodeBase.ZenoNode` or ``None``]
+        """
+        nodes = []
+        for socket in node.inputs:
+            edge = socket.edges[0] if socket.edges else None
+            nodes.append(edge.getOtherSocket(socket).node if edge is not None else None)
+        return nodes
+
+    def getStructureKey(self):
+        """
+        Structural hash of the graph: `Nodes` with their op_codes and connections between `Sockets`
+
+        :return: hashable key identifying compiled graph
+        :rtype: ``tuple``
+        """
+        nodes = self.getGraphNodes()
+        node_ids = set(node.id for node in nodes)
+        connections = []
+        for node in nodes:
+            for socket in node.inputs:
+                for edge in socket.edges:
+                    other = edge.getOtherSocket(socket)
+                    if other.node.id in node_ids: connections.append((other.node.id, other.index, node.id, socket.index))
+        return (tuple(sorted((node.id, node.op_code) for node in nodes)), tuple(sorted(connections)))
+
+    def compile(self, structure_key=None):
+        """
+        Emit source of flat function and compile it. Inputs are arguments and Outputs are returned as tuple (both
+        in `Scene` order)
+
+        :param structure_key: structural hash of the graph, computed when ``None``
+        :type structure_key: ``tuple``
+        :return: new compiled graph
+        :rtype: :class:`CompiledGraph`
+        :raises CompileError: when graph contains `Node` which can't be compiled
+        """
+        nodes = self.getGraphNodes()
+        graph_ids = set(node.id for node in nodes)
+        input_ids = [node.id for node in self.scene.iterNodes() if node.id in graph_ids and node.op_code == Config.OP_NODE_INPUT]
+        output_ids = [node.id for node in self.scene.iterNodes() if node.id in graph_ids and node.op_code == Config.OP_NODE_OUTPUT]
+        arguments = dict((node_id, "in_%d" % index) for index, node_id in enumerate(input_ids))
+
+        names = {}          # node id -> local variable name
+        invalid = set()     # ids of nodes which evaluate to None (not connected input)
+        # like interpreted nodes, operation which raises (i.e. division by zero or None input) makes its branch None
+        guarded = "try: %s = %s\n    except Exception: %s = None"
+        namespace = {}      # fallback evalOperation of nodes without op_expression
+        lines = []
+
+        for index, node in enumerate(nodes):
+            name = names[node.id] = "n%d" % index
+
+            if node.op_code == Config.OP_NODE_INPUT:
+                lines.append("%s = %s" % (name, arguments[node.id]))
+                continue
+
+            parents = self.getInputNodes(node)
+            if any(parent is None or parent.id in invalid for parent in parents):
+                invalid.add(node.id)
+                lines.append("%s = None" % name)
+                continue
+
+            parent_names = tuple(names[parent.id] for parent in parents)
+            if node.op_code == Config.OP_NODE_OUTPUT:
+                lines.append("%s = %s" % (name, parent_names[0]))
+            elif getattr(node, 'op_expression', None) is not None:
+                lines.append(guarded % (name, node.op_expression % parent_names, name))
+            elif hasattr(node, 'evalOperation'):
+                namespace["op_%d" % index] = node.evalOperation
+                lines.append(guarded % (name, "op_%d(%s)" % (index, ", ".join(parent_names)), name))
+            else:
+                raise CompileError("node '%s' can't be compiled" % node.title)
+
+        source = "def compiled_graph(%s):\n" % ", ".join(arguments[node_id] for node_id in input_ids)
+        for line in lines: source += "    %s\n" % line
+        source += "    return (%s)\n" % "".join("%s, " % names[node_id] for node_id in output_ids)
+
+        exec(compile(source, "<zeno graph>", "exec"), namespace)
+        if structure_key is None: structure_key = self.getStructureKey()
+        return CompiledGraph(namespace['compiled_graph'], source, input_ids, output_ids, structure_key)
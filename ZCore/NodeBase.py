@@ -1,198 +1,294 @@
-from PySide2 import QtCore,QtWidgets,QtGui
-
-import GUI.node_creator as node_creator
-import GUI.node_content as node_content
-
-import ZCore.ToolsSystem as ToolsSystem
-
-DEBUG = False
-
-NODE_COLORS = {
-    "math" : QtGui.QColor("#303030"),
-    "evaluation" : QtGui.QColor("#912130"),
-    "unknown" :  QtGui.QColor("#454545"),
-}
-
-class ZenoNodeGraphics(node_creator.NodeGraphics):
-    def __init__(self, node, icon="", parent=None):
-        super(ZenoNodeGraphics, self).__init__(node, parent)
-        self.icon = icon
-
-    @property
-    def node_type(self):
-        return self.node.node_type
-    
-    def getNodeHeaderColor(self, key):
-        try: return NODE_COLORS[key]
-        except: return NODE_COLORS["unknown"]
-
-    def initSizes(self):
-        super(ZenoNodeGraphics, self).initSizes()
-        self.width = 160
-        self.edge_roundness = 5
-        self.edge_padding = 0 # feels like edge padding is edge/outline width
-        self.title_height = 20
-        self.title_horizontal_padding = 5
-        self.title_vertical_padding = 10
-        
-        # calculate node height from input and output amount
-        self.height = self.title_height + (self.node.segment_amount*self.node.socket_spacing) + (self.node.socket_spacing/4)
-
-    def initAsset(self):
-        super(ZenoNodeGraphics, self).initAsset()
-        self._title_font = QtGui.QFont("Ubuntu", 8)
-        self._brush_title = QtGui.QBrush(self.getNodeHeaderColor(self.node_type))
-        self._brush_background = QtGui.QBrush(QtGui.QColor("#4b4c51"))
-        self._brush_segment = QtGui.QBrush(QtGui.QColor("#595b61")) 
-        self._invalid_icon = QtGui.QImage(ToolsSystem.get_path("Sources","icons","node","invalid.png"))
-
-    def initTitle(self):
-        super(ZenoNodeGraphics, self).initTitle()
-        self.title_item.setPos(self.title_horizontal_padding, -3)
-
-    def paint(self, painter, option, widget):
-        '''
-        self._brush_title = QtGui.QBrush(QtGui.QColor("#6db463"))
-        if self.node.isDirty():
-            self._brush_title = QtGui.QBrush(QtGui.QColor("#bbbb4c"))
-        if self.node.isInvalid():
-            self._brush_title = QtGui.QBrush(QtGui.QColor("#de6e5b"))
-        '''
-
-        super(ZenoNodeGraphics, self).paint(painter, option, widget)
-
-        # draw node icon
-        painter.drawImage(                    
-            QtCore.QRectF(self.width-self.title_horizontal_padding-20, 2.5, 15, 15),
-            self.icon,
-            QtCore.QRectF(0, 0, 32, 32)
-        )
-
-        # draw warning if node is invalid
-        if self.node.isInvalid():
-            painter.drawImage(
-                QtCore.QRectF(-14, -14, 24, 24),
-                self._invalid_icon,
-                QtCore.QRectF(0, 0, 64, 64)
-            )
-    
-class ZenoNodeContent(node_content.NodeContentWidget):
-    def initUI(self):
-        layout = QtWidgets.QVBoxLayout(self)
-
-class ZenoNode(node_creator.NodeConfig):
-    icon = ""
-    op_code = 0
-    op_title = "undefined"
-    content_label = ""
-    content_label_objname = "zeno_node_bg"
-
-    GraphicNode_class = ZenoNodeGraphics
-    NodeContent_class = ZenoNodeContent
-
-    def __init__(self, title=op_title, scene=None, node_type="unknown", inputs=[1,1], outputs=[2]):
-        self.node_type = node_type
-        super(ZenoNode, self).__init__(title, scene, inputs, outputs) # self.__class__ will access instance from derived class 
-        
-        self.value = None
-
-        # mark node dirty by default, cuz it's needed to be used/evaluated
-        self.markDirty()
-
-    def initInnerClasses(self):
-        """Sets up graphics Node and Content Widget"""
-        node_content_class = self.getNodeContentClass()
-        graphics_node_class = self.getGraphicsNodeClass()
-        if node_content_class is not None: self.content = node_content_class(self)
-        if graphics_node_class is not None: self.node_graphic = graphics_node_class(self, self.validateIcon(self.icon))
-
-    def initSettings(self):
-        super(ZenoNode, self).initSettings()
-        self.input_socket_position = node_creator.LEFT_TOP
-        self.output_socket_position = node_creator.RIGHT_TOP
-
-    def validateIcon(self, icon):
-        if icon == "" or QtGui.QImageReader.canRead(QtGui.QImageReader(icon))==False:    # check if icon not valid, replace with template icon if true
-            return ToolsSystem.get_path("Sources","icons","node","python.png")
-        return icon
-
-    def evalOperation(self, input1, input2):
-        return 1
-
-    def evalImplementation(self):
-        # this is where derived class/nodes will implement it's custom evaluation
-        input1 = self.getInput(0)
-        input2 = self.getInput(1)
-
-        if input1 is None or input2 is None:
-            self.markInvalid()
-            self.markDescendantsDirty()
-            self.node_graphic.setToolTip("Connect all inputs")
-            return None
-        
-        else:
-            value = self.evalOperation(input1.eval(), input2.eval())
-            self.value = value
-            self.markDirty(False)
-            self.markInvalid(False)
-            self.node_graphic.setToolTip("")
-
-            self.markDescendantsDirty()
-            self.evalChildren()
-
-            return value
-
-    def eval(self):
-        if not self.isDirty() and not self.isInvalid():
-            if DEBUG: print("_> returning cached %s value:" % self.__class__.__name__, self.value)
-            return self.value
-        
-        try:
-            value = self.evalImplementation()
-            return value
-        except ValueError as e:
-            self.markInvalid()
-            self.node_graphic.setToolTip(str(e))
-            self.markDescendantsDirty()
-        except Exception as e:
-            self.markInvalid()
-            self.node_graphic.setToolTip(str(e))
-            if DEBUG: print("Node Eval::", e)
-
-    def onInputChanged(self, socket=None):
-        if DEBUG: print("%s::__onInputChanged"% self.__class__.__name__)
-        self.markDirty()
-        self.eval()
-
-    def serialize(self):
-        res = super(ZenoNode, self).serialize()
-        res['op_code'] = self.__class__.op_code
-        return res
-
-    def deserialize(self, data, hashmap=[], restore_id=True):
-        res = super(ZenoNode, self).deserialize(data, hashmap, restore_id)
-        if DEBUG: print('Deserialized zenoNode "%s"'% self.__class__.__name__, "res:", res)
-        return res
-
-"""  
-class ZenoNodeIcon(QtWidgets.QLabel):
-    def __init__(self, icon="", size=(32,32), parent=None):
-        super(ZenoNodeIcon, self).__init__(parent)
-
-        self.icon = icon
-        self.size = size
-
-        self.initUI()
-
-    def initUI(self):
-        self.icon_validator = QtGui.QImageReader(self.icon)
-        if QtGui.QImageReader.canRead(self.icon_validator):
-            self.item_image = QtGui.QImage(self.icon)
-        else:
-            self.item_image = QtGui.QImage(ToolsSystem.get_path("Sources","icons","shelf","python.png"))
-
-        self.item_image = self.item_image.scaled(self.size[0],self.size[1],QtCore.Qt.IgnoreAspectRatio,QtCore.Qt.SmoothTransformation)
-        self.item_pixmap = QtGui.QPixmap()
-        self.item_pixmap.convertFromImage(self.item_image)
-        self.setPixmap(self.item_pixmap)
+from collections import OrderedDict
+
+from PySide2 import QtCore,QtWidgets,QtGui
+
+try:
+    import numpy
+except ImportError:
+    numpy = None    # batch evaluation (evalBatch) not available
+
+import GUI.node_creator as node_creator
+import GUI.node_content as node_content
+import GUI.node_eval_cache as node_eval_cache
+
+import ZCore.ToolsSystem as ToolsSystem
+
+DEBUG = False
+
+class BatchNotAvailable(Exception): pass
+
+NODE_COLORS = {
+    "math" : QtGui.QColor("#303030"),
+    "evaluation" : QtGui.QColor("#912130"),
+    "unknown" :  QtGui.QColor("#454545"),
+}
+
+class ZenoNodeGraphics(node_creator.NodeGraphics):
+    def __init__(self, node, icon="", parent=None):
+        super(ZenoNodeGraphics, self).__init__(node, parent)
+        self.icon = icon
+
+    @property
+    def node_type(self):
+        return self.node.node_type
+    
+    def getNodeHeaderColor(self, key):
+        try: return NODE_COLORS[key]
+        except: return NODE_COLORS["unknown"]
+
+    def initSizes(self):
+        super(ZenoNodeGraphics, self).initSizes()
+        self.width = 160
+        self.edge_roundness = 5
+        self.edge_padding = 0 # feels like edge padding is edge/outline width
+        self.title_height = 20
+        self.title_horizontal_padding = 5
+        self.title_vertical_padding = 10
+        
+        # calculate node height from input and output amount
+        self.height = self.title_height + (self.node.segment_amount*self.node.socket_spacing) + (self.node.socket_spacing/4)
+
+    def initAsset(self):
+        super(ZenoNodeGraphics, self).initAsset()
+        self._title_font = QtGui.QFont("Ubuntu", 8)
+        self._brush_title = QtGui.QBrush(self.getNodeHeaderColor(self.node_type))
+        self._brush_background = QtGui.QBrush(QtGui.QColor("#4b4c51"))
+        self._brush_segment = QtGui.QBrush(QtGui.QColor("#595b61")) 
+        self._invalid_icon = QtGui.QImage(ToolsSystem.get_path("Sources","icons","node","invalid.png"))
+        self._brush_pending = QtGui.QBrush(QtGui.QColor(0, 0, 0, 80))
+
+    def initTitle(self):
+        super(ZenoNodeGraphics, self).initTitle()
+        self.title_item.setPos(self.title_horizontal_padding, -3)
+
+    def paint(self, painter, option, widget):
+        '''
+        self._brush_title = QtGui.QBrush(QtGui.QColor("#6db463"))
+        if self.node.isDirty():
+            self._brush_title = QtGui.QBrush(QtGui.QColor("#bbbb4c"))
+        if self.node.isInvalid():
+            self._brush_title = QtGui.QBrush(QtGui.QColor("#de6e5b"))
+        '''
+
+        super(ZenoNodeGraphics, self).paint(painter, option, widget)
+
+        # draw node icon
+        painter.drawImage(                    
+            QtCore.QRectF(self.width-self.title_horizontal_padding-20, 2.5, 15, 15),
+            self.icon,
+            QtCore.QRectF(0, 0, 32, 32)
+        )
+
+        # tint node by its evaluation cost (profiler heat map)
+        profiler = self.node.scene.profiler
+        if profiler.heat_map:
+            cost = profiler.getNodeCost(self.node)
+            if cost > 0.0:
+                painter.setPen(QtCore.Qt.NoPen)
+                painter.setBrush(QtGui.QColor(255, 64, 0, int(40 + 140*cost)))
+                painter.drawRoundedRect(0, 0, self.width, self.height, self.edge_roundness, self.edge_roundness)
+
+        # dim node while background evaluation result is pending
+        if self.node.isPending():
+            painter.setPen(QtCore.Qt.NoPen)
+            painter.setBrush(self._brush_pending)
+            painter.drawRoundedRect(0, 0, self.width, self.height, self.edge_roundness, self.edge_roundness)
+
+        # draw warning if node is invalid
+        if self.node.isInvalid():
+            painter.drawImage(
+                QtCore.QRectF(-14, -14, 24, 24),
+                self._invalid_icon,
+                QtCore.QRectF(0, 0, 64, 64)
+            )
+    
+class ZenoNodeContent(node_content.NodeContentWidget):
+    def initUI(self):
+        layout = QtWidgets.QVBoxLayout(self)
+
+class ZenoNode(node_creator.NodeConfig):
+    icon = ""
+    op_code = 0
+    op_title = "undefined"
+    op_expression = None    # python expression template of evalOperation used by GraphCompiler, i.e. "(%s + %s)"
+    content_label = ""
+    content_label_objname = "zeno_node_bg"
+
+    GraphicNode_class = ZenoNodeGraphics
+    NodeContent_class = ZenoNodeContent
+
+    def __init__(self, title=op_title, scene=None, node_type="unknown", inputs=[1,1], outputs=[2]):
+        self.node_type = node_type
+        self.tool_tip = ""
+        super(ZenoNode, self).__init__(title, scene, inputs, outputs) # self.__class__ will access instance from derived class 
+        
+        self.value = None
+
+        # mark node dirty by default, cuz it's needed to be used/evaluated
+        self.markDirty()
+
+    def initInnerClasses(self):
+        """Sets up graphics Node and Content Widget"""
+        node_content_class = self.getNodeContentClass()
+        graphics_node_class = self.getGraphicsNodeClass()
+        if node_content_class is not None: self.content = node_content_class(self)
+        if graphics_node_class is not None: self.node_graphic = graphics_node_class(self, self.validateIcon(self.icon))
+
+    def initSettings(self):
+        super(ZenoNode, self).initSettings()
+        self.input_socket_position = node_creator.LEFT_TOP
+        self.output_socket_position = node_creator.RIGHT_TOP
+
+    def setToolTip(self, text):
+        # tool tip is Qt state, when evaluated on worker thread (parallel pass) it's applied on main thread afterwards
+        self.tool_tip = text    # kept on the node too, headless scene has no graphics (see ZCore.Batch)
+        node_graphic = self.node_graphic
+        if node_graphic is not None: self.scene.scheduler.callInMainThread(node_graphic.setToolTip, text)
+
+    def validateIcon(self, icon):
+        if icon == "" or QtGui.QImageReader.canRead(QtGui.QImageReader(icon))==False:    # check if icon not valid, replace with template icon if true
+            return ToolsSystem.get_path("Sources","icons","node","python.png")
+        return icon
+
+    def evalOperation(self, input1, input2):
+        return 1
+
+    def getEvalCacheKey(self):
+        # key for scene's eval cache: (id, op_code, input value fingerprints), None means don't cache
+        input_nodes = [self.getInput(index) for index in range(len(self.inputs))]
+        if any(input_node is None for input_node in input_nodes): return None
+
+        fingerprints = tuple(node_eval_cache.fingerprint(input_node.eval()) for input_node in input_nodes)
+        if None in fingerprints: return None     # input not evaluated or array (batch evaluation)
+        return (self.id, self.__class__.op_code, fingerprints)
+
+    def evalImplementation(self):
+        # this is where derived class/nodes will implement it's custom evaluation
+        input1 = self.getInput(0)
+        input2 = self.getInput(1)
+
+        if input1 is None or input2 is None:
+            self.markInvalid()
+            # descendants inside scheduler pass are already Dirty, walking them for every invalid node is quadratic
+            if not self.scene.scheduler.isScheduled(self): self.markDescendantsDirty()
+            self.setToolTip("Connect all inputs")
+            return None
+        
+        else:
+            # descendants are evaluated by the scheduler (once per pass), not from here
+            value = self.evalOperation(input1.eval(), input2.eval())
+            self.value = value
+            self.markDirty(False)
+            self.markInvalid(False)
+            self.setToolTip("")
+
+            return value
+
+    def eval(self):
+        self.scene.scheduler.finishJobs()   # background job in flight would leave stale value on main thread
+        if not self.isDirty() and not self.isInvalid():
+            if DEBUG: print("_> returning cached %s value:" % self.__class__.__name__, self.value)
+            return self.value
+
+        # already evaluated (even if invalid) in current scheduler pass, invalid node has no value like when it failed
+        if self.scene.scheduler.isEvaluated(self): return None if self.isInvalid() else self.value
+        
+        profile_token = self.scene.profiler.start()
+        cache_hit = False
+        try:
+            # same inputs were evaluated before, reuse the result
+            cache = self.scene.eval_cache
+            cache_key = self.getEvalCacheKey() if cache.enabled else None
+            if cache_key is not None:
+                found, value = cache.get(cache_key)
+                if found:
+                    if DEBUG: print("_> returning memoized %s value:" % self.__class__.__name__, value)
+                    cache_hit = True
+                    self.value = value
+                    self.markDirty(False)
+                    self.markInvalid(False)
+                    self.setToolTip("")
+                    return value
+
+            value = self.evalImplementation()
+            if cache_key is not None and not self.isInvalid(): cache.store(cache_key, self.id, value)
+            return value
+        except ValueError as e:
+            self.markInvalid()
+            self.setToolTip(str(e))
+            if not self.scene.scheduler.isScheduled(self): self.markDescendantsDirty()
+        except Exception as e:
+            self.markInvalid()
+            self.setToolTip(str(e))
+            if DEBUG: print("Node Eval::", e)
+        finally:
+            self.scene.scheduler.markEvaluated(self)
+            self.scene.profiler.stop(self, profile_token, cache_hit)
+
+    def onInputChanged(self, socket=None):
+        if DEBUG: print("%s::__onInputChanged"% self.__class__.__name__)
+        # evaluate this node and its descendants, each one once
+        self.scene.scheduler.evaluate([self])
+
+    def serialize(self):
+        res = super(ZenoNode, self).serialize()
+        res['op_code'] = self.__class__.op_code
+        return res
+
+    def deserialize(self, data, hashmap={}, restore_id=True):
+        res = super(ZenoNode, self).deserialize(data, hashmap, restore_id)
+        if DEBUG: print('Deserialized zenoNode "%s"'% self.__class__.__name__, "res:", res)
+        return res
+
+def isArray(value):
+    """Return ``True`` if value is NumPy array (result of batch evaluation)"""
+    return numpy is not None and isinstance(value, numpy.ndarray)
+
+def evalBatch(scene, bindings, keep_bound=False):
+    """
+    Evaluate graph element-wise over NumPy arrays in one pass. Every bound Input node passes its whole array
+    through `evalOperation` of the nodes downstream, so there is no per-element Python overhead
+
+    :param scene: scene containing the graph
+    :type scene: :class:`~GUI.node_editor.Scene`
+    :param bindings: Input node -> sample values (anything ``numpy.asarray`` accepts)
+    :type bindings: ``dict``
+    :param keep_bound: if ``False`` Input nodes are unbound (back to line edit value) after evaluation
+    :type keep_bound: ``bool``
+    :return: node -> evaluated value for every evaluated node without outputs (i.e. Output nodes)
+    :rtype: ``OrderedDict``
+    """
+    if numpy is None: raise BatchNotAvailable("NumPy is not installed, batch evaluation is not available")
+
+    for node, values in bindings.items(): node.bindBatch(values)
+    try:
+        evaluated = scene.scheduler.evaluate(list(bindings.keys()))
+        results = OrderedDict((node, node.value) for node in evaluated if not node.outputs)
+    finally:
+        if not keep_bound:
+            for node in bindings.keys(): node.unbindBatch()
+            scene.scheduler.evaluate(list(bindings.keys()))
+    return results
+
+"""  
+class ZenoNodeIcon(QtWidgets.QLabel):
+    def __init__(self, icon="", size=(32,32), parent=None):
+        super(ZenoNodeIcon, self).__init__(parent)
+
+        self.icon = icon
+        self.size = size
+
+        self.initUI()
+
+    def initUI(self):
+        self.icon_validator = QtGui.QImageReader(self.icon)
+        if QtGui.QImageReader.canRead(self.icon_validator):
+            self.item_image = QtGui.QImage(self.icon)
+        else:
+            self.item_image = QtGui.QImage(ToolsSystem.get_path("Sources","icons","shelf","python.png"))
+
+        self.item_image = self.item_image.scaled(self.size[0],self.size[1],QtCore.Qt.IgnoreAspectRatio,QtCore.Qt.SmoothTransformation)
+        self.item_pixmap = QtGui.QPixmap()
+        self.item_pixmap.convertFromImage(self.item_image)
+        self.setPixmap(self.item_pixmap)
 """
\ No newline at end of file
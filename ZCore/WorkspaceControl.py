@@ -1,54 +1,54 @@
-from PySide2 import QtCore
-from shiboken2 import getCppPointer
-import maya.OpenMayaUI as omui
-import maya.cmds as cmds
-
-class WorkspaceControl(object):
-
-    def __init__(self, name):
-        self.name = name
-        self.widget = None
-
-    def create(self, label, widget, ui_script=None):
-
-        cmds.workspaceControl(self.name, label=label)
-
-        if ui_script:
-            cmds.workspaceControl(self.name, e=True, uiScript=ui_script)
-        
-        self.add_widget_to_layout(widget)
-        self.set_visible(True)
-
-    def restore(self, widget):
-        self.add_widget_to_layout(widget)
-
-    def add_widget_to_layout(self, widget):
-        if widget:
-            self.widget = widget
-            self.widget.setAttribute(QtCore.Qt.WA_DontCreateNativeAncestors)    # prevent widget become native ui to maya, avoid unwanted flicker/slow process/etc
-
-            workspace_control_ptr = long(omui.MQtUtil.findControl(self.name))
-            widget_ptr = long(getCppPointer(self.widget)[0])
-
-            omui.MQtUtil.addWidgetToMayaLayout(widget_ptr, workspace_control_ptr)
-
-    def exists(self):
-        return cmds.workspaceControl(self.name, q=True, exists=True)
-    
-    def is_visible(self):
-        return cmds.workspaceControl(self.name, q=True, visible=True)
-
-    def set_visible(self, visible):
-        if visible:
-            cmds.workspaceControl(self.name, e=True, restore=True)
-        else:
-            cmds.workspaceControl(self.name, e=True, visible=False)
-
-    def set_label(self, label):
-        cmds.workspaceControl(self.name, e=True, label=label)
-    
-    def is_floating(self):
-        return cmds.workspaceControl(self.name, q=True, floating=True)
-    
-    def is_collapsed(self):
+from PySide2 import QtCore
+from shiboken2 import getCppPointer
+import maya.OpenMayaUI as omui
+import maya.cmds as cmds
+
+class WorkspaceControl(object):
+
+    def __init__(self, name):
+        self.name = name
+        self.widget = None
+
+    def create(self, label, widget, ui_script=None):
+
+        cmds.workspaceControl(self.name, label=label)
+
+        if ui_script:
+            cmds.workspaceControl(self.name, e=True, uiScript=ui_script)
+        
+        self.add_widget_to_layout(widget)
+        self.set_visible(True)
+
+    def restore(self, widget):
+        self.add_widget_to_layout(widget)
+
+    def add_widget_to_layout(self, widget):
+        if widget:
+            self.widget = widget
+            self.widget.setAttribute(QtCore.Qt.WA_DontCreateNativeAncestors)    # prevent widget become native ui to maya, avoid unwanted flicker/slow process/etc
+
+            workspace_control_ptr = long(omui.MQtUtil.findControl(self.name))
+            widget_ptr = long(getCppPointer(self.widget)[0])
+
+            omui.MQtUtil.addWidgetToMayaLayout(widget_ptr, workspace_control_ptr)
+
+    def exists(self):
+        return cmds.workspaceControl(self.name, q=True, exists=True)
+    
+    def is_visible(self):
+        return cmds.workspaceControl(self.name, q=True, visible=True)
+
+    def set_visible(self, visible):
+        if visible:
+            cmds.workspaceControl(self.name, e=True, restore=True)
+        else:
+            cmds.workspaceControl(self.name, e=True, visible=False)
+
+    def set_label(self, label):
+        cmds.workspaceControl(self.name, e=True, label=label)
+    
+    def is_floating(self):
+        return cmds.workspaceControl(self.name, q=True, floating=True)
+    
+    def is_collapsed(self):
         return cmds.workspaceControl(self.name, q=True, collapse=True)
\ No newline at end of file
@@ -1,61 +1,109 @@
-from PySide2 import QtCore,QtWidgets,QtGui
-from ZCore.Config import *  # with import it's cuz error, looping problem?
-
-import GUI.node_content as node_content
-import ZCore.NodeBase as NodeBase
-import ZCore.ToolsSystem as ToolsSystem
-
-class ZenoInputContent(node_content.NodeContentWidget):
-    def initUI(self):
-        self.edit = QtWidgets.QLineEdit("1", self)
-        self.edit.setAlignment(QtCore.Qt.AlignRight)
-        self.edit.setObjectName(self.node.content_label_objname)
-        self.edit.setStyleSheet("background: #303030; max-height: 17.5; margin-left: 5px; margin-top: 1.25")
-
-    def serialize(self):    # serialize because there is content inside (line edit)
-        res = super(ZenoInputContent,self).serialize()
-        res['value'] = self.edit.text()
-        return res
-    
-    def deserialize(self, data, hashmap=[]):   # deserialize because there is content inside (line edit)
-        res = super(ZenoInputContent, self).deserialize(data, hashmap)
-        try:
-            value = data['value']
-            self.edit.setText(value)
-            return True & res   # idk what & difference with ,
-        except Exception as e: pass
-        return res
-
-@register_node(OP_NODE_INPUT)
-class ZenoNode_Input(NodeBase.ZenoNode):
-    icon = ToolsSystem.get_path("Sources","icons","node","in.png")
-    op_code = OP_NODE_INPUT
-    op_title = "Input"
-    content_label = "in"
-    content_label_objname = "zeno_node_input"
-
-    def __init__(self, nameID=op_title, scene=None):
-        super(ZenoNode_Input, self).__init__(self.__class__.op_title, scene, "evaluation", inputs=[], outputs=[1])    # call init function, cuz this node use custom socket config
-        self.eval()
-
-    def initInnerClasses(self): # append custom class to node content
-        self.content = ZenoInputContent(self)
-        self.node_graphic = NodeBase.ZenoNodeGraphics(self, self.validateIcon(self.icon))
-        self.content.edit.textChanged.connect(self.onInputChanged)
-
-    def evalImplementation(self):
-        unsaved_value = self.content.edit.text()
-        saved_value = int(unsaved_value)    # checking if line edit contain correct type(interger)
-        self.value = saved_value
-        # if everything goes well, pass success evaluation
-        self.markDirty(False)
-        self.markInvalid(False)
-
-        self.markDescendantsInvalid(False)
-        self.markDescendantsDirty()
-
-        self.node_graphic.setToolTip("")    # if everything ok, make sure tool tip empty (no warning)
-
-        self.evalChildren()
-
+from PySide2 import QtCore,QtWidgets,QtGui
+from ZCore.Config import *  # with import it's cuz error, looping problem?
+
+import GUI.node_content as node_content
+import ZCore.NodeBase as NodeBase
+import ZCore.ToolsSystem as ToolsSystem
+
+class ZenoInputContent(node_content.NodeContentWidget):
+    def initUI(self):
+        self.edit = QtWidgets.QLineEdit("1", self)
+        self.edit.setAlignment(QtCore.Qt.AlignRight)
+        self.edit.setObjectName(self.node.content_label_objname)
+        self.edit.setStyleSheet("background: #303030; max-height: 17.5; margin-left: 5px; margin-top: 1.25")
+
+    def serialize(self):    # serialize because there is content inside (line edit)
+        res = super(ZenoInputContent,self).serialize()
+        res['value'] = self.edit.text()
+        return res
+    
+    def deserialize(self, data, hashmap={}):   # deserialize because there is content inside (line edit)
+        res = super(ZenoInputContent, self).deserialize(data, hashmap)
+        if 'value' not in data: return res     # content of old files, line edit keeps default value
+        self.edit.setText(data['value'])
+        return True & res   # idk what & difference with ,
+
+@register_node(OP_NODE_INPUT)
+class ZenoNode_Input(NodeBase.ZenoNode):
+    icon = ToolsSystem.get_path("Sources","icons","node","in.png")
+    op_code = OP_NODE_INPUT
+    op_title = "Input"
+    content_label = "in"
+    content_label_objname = "zeno_node_input"
+
+    def __init__(self, nameID=op_title, scene=None):
+        self.batch_values = None    # NumPy array bound by batch evaluation, overrides line edit value
+        self.input_text = "1"       # text snapshot, evaluation doesn't touch line edit (may run on worker thread or headless)
+        super(ZenoNode_Input, self).__init__(self.__class__.op_title, scene, "evaluation", inputs=[], outputs=[1])    # call init function, cuz this node use custom socket config
+        self.eval()
+
+    def onTextChanged(self, text):
+        self.input_text = text
+
+    def bindBatch(self, values):
+        # bind array of sample values, see NodeBase.evalBatch
+        if NodeBase.numpy is None: raise NodeBase.BatchNotAvailable("NumPy is not installed, batch evaluation is not available")
+        self.batch_values = NodeBase.numpy.asarray(values)
+        if self.content is not None: self.content.edit.setEnabled(False)
+        self.setToolTip("bound to %d values" % self.batch_values.size)
+        self.markDirty()
+
+    def unbindBatch(self):
+        self.batch_values = None
+        if self.content is not None: self.content.edit.setEnabled(True)
+        self.markDirty()
+
+    def initInnerClasses(self): # append custom class to node content
+        self.content = ZenoInputContent(self)
+        self.node_graphic = NodeBase.ZenoNodeGraphics(self, self.validateIcon(self.icon))
+        self.content.edit.setText(self.input_text)     # line edit of headless node is created later
+        self.content.edit.setEnabled(self.batch_values is None)
+        self.content.edit.textChanged.connect(self.onTextChanged)
+        self.content.edit.textChanged.connect(self.onContentChanged)
+        self.content.edit.textChanged.connect(self.onInputChanged)
+
+    def onInputChanged(self, socket=None):
+        # typing evaluates downstream graph as background job, next keystroke cancels it
+        self.scene.scheduler.evaluateAsync([self])
+
+    def setInputText(self, text):
+        # set value from code, line edit (when exists) triggers the same as typing
+        if self.content is not None: self.content.edit.setText(text)
+        else:
+            self.input_text = text
+            self.onContentChanged()
+            self.markDirty()
+
+    def serialize(self):
+        res = super(ZenoNode_Input, self).serialize()
+        if self.content is None: res['content'] = dict(res['content'], value=self.input_text)   # headless, no line edit
+        return res
+
+    def deserialize(self, data, hashmap={}, restore_id=True):
+        res = super(ZenoNode_Input, self).deserialize(data, hashmap, restore_id)
+        if self.content is None and 'value' in data['content']:
+            self.input_text = data['content']['value']
+            self._content_data = None   # value lives in input_text until line edit is created
+            self.markDirty()
+        return res
+
+    def getEvalCacheKey(self):
+        return None     # not memoized, value comes from line edit
+
+    def evalImplementation(self):
+        if self.batch_values is not None:
+            self.value = self.batch_values
+            self.markDirty(False)
+            self.markInvalid(False)
+            return self.value
+
+        unsaved_value = self.input_text
+        saved_value = int(unsaved_value)    # checking if line edit contain correct type(interger)
+        self.value = saved_value
+        # if everything goes well, pass success evaluation
+        self.markDirty(False)
+        self.markInvalid(False)
+
+        self.setToolTip("")    # if everything ok, make sure tool tip empty (no warning)
+
         return self.value
\ No newline at end of file
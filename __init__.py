@@ -1,5 +1,5 @@
-import sys
-import os
-
-sys.dont_write_bytecode = True  
-sys.path.append(os.path.dirname(os.path.realpath(__file__)))
+import sys
+import os
+
+sys.dont_write_bytecode = True  
+sys.path.append(os.path.dirname(os.path.realpath(__file__)))
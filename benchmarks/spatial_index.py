@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark of spatial item index (see :mod:`~GUI.node_spatial`) against Qt's own lookup. Hit-testing and rubber band
+lookup on big scene are timed, results are printed to stdout
+
+usage: python benchmarks/spatial_index.py [node count]
+"""
+
+from PySide2 import QtCore, QtGui, QtWidgets
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import GUI.node_creator as node_creator
+import GUI.node_editor as node_editor
+
+def _timeCalls(function, arguments):
+    # average time of one call in milliseconds
+    start = time.time()
+    for argument in arguments: function(argument)
+    return (time.time() - start) * 1000.0 / len(arguments)
+
+def main(argv=None):
+    """Benchmark hit-testing and rubber band lookup on a grid of `Nodes` chained by `Edges`, indexed lookup
+    against ``QGraphicsScene`` linear scan"""
+    argv = sys.argv[1:] if argv is None else argv
+    count = int(argv[0]) if argv else 10000
+
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    widget = node_editor.NodeEditorWidget()
+    widget.resize(1280, 800)
+    scene, view = widget.scene, widget.view
+
+    start = time.time()
+    columns = int(count ** 0.5) or 1
+    previous = None
+    for index in range(count):
+        node = node_creator.NodeConfig("Node %d" % index, scene, inputs=[1], outputs=[1])
+        node.setPos((index % columns) * 260, (index // columns) * 180)
+        if previous is not None: node_creator.EdgeConfig(scene, previous.outputs[0], node.inputs[0])
+        previous = node
+    print("scene: %d nodes, %d edges, built in %.1fs" % (scene.getNodesCount(), scene.getEdgesCount(), time.time() - start))
+
+    random.seed(0)
+    size = (columns * 260, (count // columns + 1) * 180)
+    points = [QtCore.QPointF(random.uniform(0, size[0]), random.uniform(0, size[1])) for _ in range(200)]
+
+    start = time.time()
+    scene.scene_graphic.item_index.update()
+    print("index build: %.1f ms" % ((time.time() - start) * 1000.0))
+
+    # click and hover points spread over the whole scene, as if the view scrolled around
+    view.resetTransform()
+    view.centerOn(size[0] / 2.0, size[1] / 2.0)
+    view.scale(0.02, 0.02)
+    positions = [view.mapFromScene(point) for point in points]
+    print("click (itemAt) index: %.3f ms, qt: %.3f ms" % (
+        _timeCalls(view.itemAt, positions), _timeCalls(super(node_editor.GraphicsView, view).itemAt, positions)))
+
+    paths = []
+    for point in points[:50]:
+        path = QtGui.QPainterPath()
+        path.addRect(QtCore.QRectF(point.x(), point.y(), 600, 400))
+        paths.append(path)
+    print("rubber band area index: %.3f ms, qt: %.3f ms" % (
+        _timeCalls(scene.scene_graphic.item_index.selectableItemsInPath, paths),
+        _timeCalls(lambda path: [item for item in scene.scene_graphic.items(path)
+                                 if item.flags() & QtWidgets.QGraphicsItem.ItemIsSelectable], paths)))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,51 +1,51 @@
-#!/usr/bin/env python
-
-"""The setup script."""
-
-from setuptools import setup, find_packages
-
-with open('README.rst') as readme_file:
-    readme = readme_file.read()
-
-with open('HISTORY.rst') as history_file:
-    history = history_file.read()
-
-with open('requirements.txt') as requirements_file:
-    requirements = requirements_file.read()
-
-setup_requirements = [ ]
-
-test_requirements = [ ]
-
-import GUI
-
-setup(
-    author="Aldo Aldrich",
-    author_email='atxadaaldo17022@gmail.com',
-    python_requires='>=2.7',
-    classifiers=[
-        'Development Status :: 2 - Pre-Alpha',
-        'Intended Audience :: Developers',
-        'License :: OSI Approved :: MIT License',
-        'Natural Language :: English',
-        'Programming Language :: Python :: 3',
-        'Programming Language :: Python :: 3.6',
-        'Programming Language :: Python :: 3.7',
-        'Programming Language :: Python :: 3.8',
-    ],
-    description="Python Node Editor using Pyside2",
-    install_requires=requirements,
-    license="MIT license",
-    long_description=readme + '\n\n' + history,
-    include_package_data=True,
-    keywords='node_editor',
-    name='node_editor',
-    #packages=find_packages(include=['template', 'template.*']),
-    packages=find_packages(include=['GUI*'], exclude=['ZCore*']),
-    setup_requires=setup_requirements,
-    test_suite='tests',
-    tests_require=test_requirements,
-    url='https://github.com/Atxada/Node_Editor',
-    version='0.9.0',
-    zip_safe=False,
-)
+#!/usr/bin/env python
+
+"""The setup script."""
+
+from setuptools import setup, find_packages
+
+with open('README.rst') as readme_file:
+    readme = readme_file.read()
+
+with open('HISTORY.rst') as history_file:
+    history = history_file.read()
+
+with open('requirements.txt') as requirements_file:
+    requirements = requirements_file.read()
+
+setup_requirements = [ ]
+
+test_requirements = [ ]
+
+import GUI
+
+setup(
+    author="Aldo Aldrich",
+    author_email='atxadaaldo17022@gmail.com',
+    python_requires='>=2.7',
+    classifiers=[
+        'Development Status :: 2 - Pre-Alpha',
+        'Intended Audience :: Developers',
+        'License :: OSI Approved :: MIT License',
+        'Natural Language :: English',
+        'Programming Language :: Python :: 3',
+        'Programming Language :: Python :: 3.6',
+        'Programming Language :: Python :: 3.7',
+        'Programming Language :: Python :: 3.8',
+    ],
+    description="Python Node Editor using Pyside2",
+    install_requires=requirements,
+    license="MIT license",
+    long_description=readme + '\n\n' + history,
+    include_package_data=True,
+    keywords='node_editor',
+    name='node_editor',
+    #packages=find_packages(include=['template', 'template.*']),
+    packages=find_packages(include=['GUI*'], exclude=['ZCore*']),
+    setup_requires=setup_requirements,
+    test_suite='tests',
+    tests_require=test_requirements,
+    url='https://github.com/Atxada/Node_Editor',
+    version='0.9.0',
+    zip_safe=False,
+)
@@ -0,0 +1,78 @@
+import os
+import shutil
+import sys
+
+import pytest
+
+# no display needed, must be set before first QApplication is created
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path: sys.path.insert(0, ROOT_DIR)
+
+SAVE_DIR = os.path.join(ROOT_DIR, "ZCore", "Save")
+
+from PySide2 import QtWidgets
+
+import GUI.node_editor as node_editor
+import GUI.node_creator as node_creator
+import ZCore.Config as Config
+from ZCore.nodes_class import *
+from ZCore.nodes_class.input import ZenoNode_Input
+from ZCore.nodes_class.output import ZenoNode_Output
+from ZCore.nodes_class.operations import ZenoNode_Add, ZenoNode_Multiply
+
+
+def selectNodeClass(data):
+    return Config.get_class_from_opcode(data['op_code'])
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+@pytest.fixture
+def scene():
+    """Headless `Scene`, no QApplication required"""
+    scene = node_editor.Scene(headless=True)
+    scene.setNodeClassSelector(selectNodeClass)
+    return scene
+
+
+@pytest.fixture
+def editor(qapp):
+    """`NodeEditorWidget` with graphics, Input line edits and Output labels"""
+    widget = node_editor.NodeEditorWidget()
+    widget.scene.setNodeClassSelector(selectNodeClass)
+    yield widget
+    widget.waitForSave()
+    widget.scene.scheduler.finishJobs()
+    widget.scene.journal.close()
+    widget.scene.clear()
+
+
+@pytest.fixture
+def graph_file(tmp_path):
+    """Copy of ``graph_math.json``, file loads and saves create journals next to the graph"""
+    def copy(name="graph_math.json"):
+        path = str(tmp_path / name)
+        shutil.copy(os.path.join(SAVE_DIR, name), path)
+        return path
+    return copy
+
+
+@pytest.fixture
+def math_graph():
+    """Build ``(in1 + in2) * in2 -> Output`` inside given scene, returns ``(in1, in2, add, mul, out)``"""
+    def build(scene):
+        in1, in2 = ZenoNode_Input(scene=scene), ZenoNode_Input(scene=scene)
+        add, mul = ZenoNode_Add(scene=scene), ZenoNode_Multiply(scene=scene)
+        out = ZenoNode_Output(scene=scene)
+        node_creator.EdgeConfig(scene, in1.outputs[0], add.inputs[0])
+        node_creator.EdgeConfig(scene, in2.outputs[0], add.inputs[1])
+        node_creator.EdgeConfig(scene, add.outputs[0], mul.inputs[0])
+        node_creator.EdgeConfig(scene, in2.outputs[0], mul.inputs[1])
+        node_creator.EdgeConfig(scene, mul.outputs[0], out.inputs[0])
+        return in1, in2, add, mul, out
+    return build
@@ -0,0 +1,39 @@
+import pytest
+
+import ZCore.NodeBase as NodeBase
+
+numpy = pytest.importorskip("numpy")
+
+
+def test_eval_batch(scene, math_graph):
+    in1, in2, add, mul, out = math_graph(scene)
+    xs, ys = numpy.arange(1000), numpy.full(1000, 2)
+
+    results = NodeBase.evalBatch(scene, {in1: xs, in2: ys})
+    assert list(results.keys()) == [out]
+    assert numpy.array_equal(results[out], (xs + 2) * 2)
+    # unbound inputs are back to their line edit values
+    assert in1.batch_values is None and out.value == (1 + 1) * 1
+
+
+def test_eval_batch_keep_bound(scene, math_graph):
+    in1, in2, add, mul, out = math_graph(scene)
+    xs = numpy.arange(10)
+
+    results = NodeBase.evalBatch(scene, {in1: xs}, keep_bound=True)
+    assert numpy.array_equal(results[out], xs + 1)
+    assert in1.batch_values is not None and numpy.array_equal(out.value, xs + 1)
+
+    in1.unbindBatch()
+    scene.scheduler.evaluate([in1])
+    assert out.value == 2
+
+
+def test_eval_batch_without_numpy(scene, math_graph, monkeypatch):
+    in1, in2, add, mul, out = math_graph(scene)
+    monkeypatch.setattr(NodeBase, "numpy", None)
+
+    with pytest.raises(NodeBase.BatchNotAvailable):
+        NodeBase.evalBatch(scene, {in1: [1, 2]})
+    with pytest.raises(NodeBase.BatchNotAvailable):
+        in1.bindBatch([1, 2])
@@ -0,0 +1,61 @@
+import json
+import os
+
+import pytest
+
+import ZCore.Batch as Batch
+
+GRAPH_MATH_INPUT_ID = 1904899704928     # Input node with value '1' feeding Add and Subtract inside graph_math.json
+
+
+def outputValues(result):
+    return [(output['value'], output['valid']) for output in result['outputs']]
+
+
+def test_evaluate_file(graph_file):
+    result = Batch.evaluateFile(graph_file())
+
+    assert outputValues(result) == [(3, True), (-1, True), (0, True), (None, False)]
+    assert not result['ok'] and 'error' not in result
+    assert result['outputs'][3]['message'] == "Input is NaN"
+
+
+def test_evaluate_file_bindings(graph_file):
+    pytest.importorskip("numpy")
+    bindings = Batch.parseBindings(["%d=0:2:3" % GRAPH_MATH_INPUT_ID])
+
+    result = Batch.evaluateFile(graph_file(), bindings)
+    assert outputValues(result) == [([2.0, 3.0, 4.0], True), ([-2.0, -1.0, 0.0], True), (0, True), (None, False)]
+
+    with pytest.raises(ValueError):
+        Batch.parseBindings(["%d" % GRAPH_MATH_INPUT_ID])
+    assert 'error' in Batch.evaluateFile(graph_file(), Batch.parseBindings(["1=0:1:2"]))
+
+
+def test_evaluate_invalid_file(tmp_path):
+    path = str(tmp_path / "broken.json")
+    with open(path, "w") as file: file.write("{")
+
+    result = Batch.evaluateFile(path)
+    assert not result['ok'] and result['error'].startswith("InvalidFile")
+
+
+def test_evaluate_files_parallel(graph_file, tmp_path):
+    graph_file(); graph_file("graph2.json")
+    files = Batch.collectFiles([str(tmp_path), str(tmp_path / "graph2.json")])
+    assert [os.path.basename(path) for path in files] == ["graph2.json", "graph_math.json"]
+
+    serial = list(Batch.evaluateFiles(files, jobs=1))
+    parallel = list(Batch.evaluateFiles(files, jobs=2))
+    assert [result['file'] for result in parallel] == files
+    assert [result.get('outputs') for result in parallel] == [result.get('outputs') for result in serial]
+
+
+def test_main_writes_json_lines(graph_file, tmp_path):
+    path = graph_file()
+    output = str(tmp_path / "results.jsonl")
+
+    assert Batch.main(["-j", "1", "-o", output, path]) == 1     # graph_math.json has invalid Output
+    with open(output) as file: lines = [json.loads(line) for line in file]
+    assert len(lines) == 1 and lines[0]['file'] == path
+    assert [value for value, _ in outputValues(lines[0])] == [3, -1, 0, None]
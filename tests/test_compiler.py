@@ -0,0 +1,54 @@
+import pytest
+
+import GUI.node_creator as node_creator
+import ZCore.GraphCompiler as GraphCompiler
+
+
+def test_compiled_graph(scene, math_graph):
+    in1, in2, add, mul, out = math_graph(scene)
+    compiled = GraphCompiler.getCompiler(scene).getCompiled()
+
+    assert compiled.input_ids == [in1.id, in2.id] and compiled.output_ids == [out.id]
+    assert compiled(3, 4) == ((3 + 4) * 4,)
+    assert compiled(-2, 1) == (-1,)
+    with pytest.raises(GraphCompiler.CompileError):
+        compiled(1)
+
+
+def test_compiled_graph_reused_by_structure(scene, math_graph):
+    in1, in2, add, mul, out = math_graph(scene)
+    compiler = GraphCompiler.getCompiler(scene)
+    compiled = compiler.getCompiled()
+    assert compiler.getCompiled() is compiled and GraphCompiler.getCompiler(scene) is compiler
+
+    # moving nodes or editing values doesn't recompile
+    add.setPos(100, 100); in1.setInputText("9")
+    assert compiler.getCompiled() is compiled
+
+    mul.inputs[1].edges[0].remove()
+    disconnected = compiler.getCompiled()
+    assert disconnected is not compiled and disconnected(3, 4) == (None,)
+
+    node_creator.EdgeConfig(scene, in2.outputs[0], mul.inputs[1])
+    assert compiler.getCompiled() is compiled
+    assert compiler.evaluate(3, 4) == (28,)
+
+
+def test_compiled_graph_numpy(scene, math_graph):
+    numpy = pytest.importorskip("numpy")
+    math_graph(scene)
+    xs = numpy.arange(100)
+
+    result, = GraphCompiler.getCompiler(scene).evaluate(xs, 2)
+    assert numpy.array_equal(result, (xs + 2) * 2)
+
+
+def test_compile_error_for_plain_node(scene, math_graph):
+    in1, in2, add, mul, out = math_graph(scene)
+    plain = node_creator.NodeConfig("plain", scene, inputs=[1], outputs=[1])
+    add.inputs[0].edges[0].remove()
+    node_creator.EdgeConfig(scene, plain.outputs[0], add.inputs[0])
+    assert add.getInput(0) is plain
+
+    with pytest.raises(GraphCompiler.CompileError):
+        GraphCompiler.getCompiler(scene).getCompiled()
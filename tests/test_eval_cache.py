@@ -0,0 +1,76 @@
+import GUI.node_creator as node_creator
+import GUI.node_eval_cache as node_eval_cache
+from ZCore.nodes_class.input import ZenoNode_Input
+from ZCore.nodes_class.operations import ZenoNode_Add
+
+
+def test_fingerprint():
+    assert node_eval_cache.fingerprint(None) is None
+    assert node_eval_cache.fingerprint([1, 2]) is None
+    assert node_eval_cache.fingerprint(1) != node_eval_cache.fingerprint(1.0) != node_eval_cache.fingerprint(True)
+
+
+def test_cache_lru_and_invalidate():
+    cache = node_eval_cache.EvalCache(max_size=2)
+    cache.store("a", 1, 10)
+    cache.store("b", 2, 20)
+    assert cache.get("a") == (True, 10)     # "a" is most recently used now
+    cache.store("c", 2, 30)
+    assert cache.get("b") == (False, None) and len(cache) == 2
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    cache.invalidateNode(2)
+    assert cache.get("c") == (False, None) and cache.get("a") == (True, 10) and len(cache) == 1
+
+    cache.enabled = False
+    cache.store("d", 3, 40)
+    assert cache.get("a") == (False, None)
+    cache.clear()
+    assert len(cache) == 0 and cache.hits == 0 and cache.misses == 0
+
+
+def test_cache_hits_repeated_inputs(scene, math_graph, monkeypatch):
+    in1, in2, add, mul, out = math_graph(scene)
+    calls = []
+    original = ZenoNode_Add.evalOperation
+    monkeypatch.setattr(ZenoNode_Add, "evalOperation", lambda self, a, b: calls.append((a, b)) or original(self, a, b))
+
+    for text in ("3", "5", "3"):
+        in1.setInputText(text)
+        scene.scheduler.evaluate([in1])
+    assert calls == [(3, 1), (5, 1)]
+    assert out.value == (3 + 1) * 1 and scene.eval_cache.hits >= 2
+
+
+def test_cache_invalidated_by_edges(scene, math_graph):
+    in1, in2, add, mul, out = math_graph(scene)
+    in1.setInputText("3"); in2.setInputText("4")
+    scene.scheduler.evaluate([in1, in2])
+    assert out.value == 28
+    keys = len(scene.eval_cache)
+
+    # key is made of input values, new input node with the same value reuses the stored result
+    other = ZenoNode_Input(scene=scene)
+    other.setInputText("3")
+    add.inputs[0].edges[0].remove()
+    assert len(scene.eval_cache) < keys
+    node_creator.EdgeConfig(scene, other.outputs[0], add.inputs[0])
+    scene.scheduler.evaluate([other])
+    assert out.value == 28
+
+    other.setInputText("6")
+    scene.scheduler.evaluate([other])
+    assert (add.value, out.value) == (10, 40)
+
+    mul.inputs[1].edges[0].remove()
+    scene.scheduler.evaluate([mul])
+    assert mul.isInvalid() and out.isInvalid()
+
+
+def test_cache_size_limit(scene, math_graph):
+    in1, in2, add, mul, out = math_graph(scene)
+    scene.eval_cache.max_size = 3
+    for value in range(10):
+        in1.setInputText(str(value))
+        scene.scheduler.evaluate([in1])
+    assert len(scene.eval_cache) <= 3 and out.value == (9 + 1) * 1
@@ -0,0 +1,71 @@
+import json
+import os
+import subprocess
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HEADLESS_SCRIPT = """
+import json, sys
+from PySide2 import QtWidgets
+import GUI.node_editor as node_editor
+import ZCore.Config as Config
+from ZCore.nodes_class import *
+
+scene = node_editor.Scene(headless=True)
+scene.setNodeClassSelector(lambda data: Config.get_class_from_opcode(data['op_code']))
+scene.loadFromFile(sys.argv[1])
+outputs = [node for node in scene.iterNodes() if node.op_code == Config.OP_NODE_OUTPUT]
+values = [output.eval() for output in outputs]
+json.dump({
+    'qapplication': QtWidgets.QApplication.instance() is not None,
+    'graphics': scene.hasGraphics() or any(node.node_graphic is not None or node.content is not None
+                                           for node in scene.iterNodes()),
+    'values': values,
+    'invalid': [output.isInvalid() for output in outputs],
+}, sys.stdout)
+"""
+
+
+def test_headless_load_without_qapplication():
+    # QApplication of other tests lives for the whole session, run in fresh interpreter
+    env = dict(os.environ, PYTHONPATH=ROOT_DIR)
+    env.pop("QT_QPA_PLATFORM", None)
+    graph = os.path.join(ROOT_DIR, "ZCore", "Save", "graph_math.json")
+    output = subprocess.check_output([sys.executable, "-c", HEADLESS_SCRIPT, graph], cwd=ROOT_DIR, env=env)
+    result = json.loads(output.decode("utf-8").strip().splitlines()[-1])
+
+    assert not result['qapplication'] and not result['graphics']
+    assert result['values'] == [3, -1, 0, None] and result['invalid'] == [False, False, False, True]
+
+
+def test_headless_round_trip(scene, math_graph):
+    in1, in2, add, mul, out = math_graph(scene)
+    in1.setInputText("3"); in2.setInputText("4")
+    add.setPos(100, 50)
+    scene.scheduler.evaluate([in1, in2])
+    assert out.value == 28
+    data = scene.serialize()
+    assert data['nodes'][0]['content'] == {'value': '3'} and data['nodes'][2]['pos_x'] == 100
+
+    other = type(scene)(headless=True)
+    other.setNodeClassSelector(scene.node_class_selector)
+    other.deserialize(json.loads(json.dumps(data)))
+    outputs = [node for node in other.iterNodes() if not node.outputs]
+    other.scheduler.evaluate(outputs)
+    assert outputs[0].value == 28
+    assert json.loads(json.dumps(other.serialize())) == json.loads(json.dumps(data))
+
+
+def test_headless_graphics_created_later(qapp, scene, math_graph):
+    in1, in2, add, mul, out = math_graph(scene)
+    in1.setInputText("3"); in2.setInputText("4")
+    add.setPos(100, 50)
+    scene.scheduler.evaluate([in1, in2])
+
+    scene.initGraphics()
+    assert scene.hasGraphics()
+    assert all(node.node_graphic is not None and node.content is not None for node in scene.iterNodes())
+    assert all(edge.edge_graphic is not None for edge in scene.iterEdges())
+    assert in1.content.edit.text() == "3" and add.node_graphic.pos().x() == 100
+    assert out.content.label.text() == "Result: 28"
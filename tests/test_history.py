@@ -0,0 +1,181 @@
+def byID(items):
+    return dict((item['id'], item) for item in items)
+
+
+def test_history_stamp_contains_touched_items_only(scene, math_graph):
+    in1, in2, add, mul, out = math_graph(scene)
+    history = scene.history
+    history.storeInitialHistoryStamp()
+
+    add.setPos(500, 250)
+    history.storeHistory("move node")
+    stamp = history.history_stack[-1]
+    assert list(stamp['nodes'].keys()) == [add.id] and not stamp['edges']
+
+    edge = mul.inputs[1].edges[0]
+    edge.remove()
+    history.storeHistory("delete edge")
+    stamp = history.history_stack[-1]
+    assert list(stamp['edges'].keys()) == [edge.id] and not stamp['nodes']
+
+
+def test_history_undo_redo(scene, math_graph):
+    in1, in2, add, mul, out = math_graph(scene)
+    history = scene.history
+    history.storeInitialHistoryStamp()
+    base = scene.serialize()
+
+    add.setPos(500, 250)
+    history.storeHistory("move node")
+    in1.setInputText("7")
+    history.storeHistory("edit input")
+    mul.remove()
+    history.storeHistory("delete node")
+    assert scene.getNodesCount() == 4 and scene.getEdgesCount() == 2
+
+    history.undo()
+    restored = scene.getNodeByID(mul.id)
+    assert restored is not None and restored is not mul
+    assert scene.getNodesCount() == 5 and scene.getEdgesCount() == 5
+    assert restored.inputs[0].edges[0].start_socket is add.outputs[0]
+    history.undo()
+    assert in1.input_text == "1"
+    history.undo()
+    assert add.pos.x() == 0 and not history.canUndo()
+    # restored node is appended to the registries, compare by id
+    assert byID(scene.serialize()['nodes']) == byID(base['nodes'])
+    assert byID(scene.serialize()['edges']) == byID(base['edges'])
+
+    history.redo(); history.redo(); history.redo()
+    assert add.pos.x() == 500 and in1.input_text == "7"
+    assert scene.getNodeByID(mul.id) is None and scene.getEdgesCount() == 2
+    assert not history.canRedo()
+
+
+def test_history_new_stamp_drops_redo(scene, math_graph):
+    in1, in2, add, mul, out = math_graph(scene)
+    history = scene.history
+    history.storeInitialHistoryStamp()
+
+    add.setPos(10, 10)
+    history.storeHistory("move")
+    history.undo()
+    assert history.canRedo()
+    add.setPos(20, 20)
+    history.storeHistory("move again")
+    assert not history.canRedo() and len(history.history_stack) == 2
+    history.undo()
+    assert add.pos.x() == 0
+
+
+def test_history_memory_budget_evicts_oldest(scene, math_graph):
+    in1, in2, add, mul, out = math_graph(scene)
+    history = scene.history
+    history.storeInitialHistoryStamp()
+    for i in range(30):
+        add.setPos(i + 1, i + 1)
+        history.storeHistory("move %d" % i)
+    stamps, size = history.getMemoryUsage()
+    assert stamps == 31 and size == sum(stamp['size'] for stamp in history.history_stack)
+
+    history.history_memory_budget = size // 3
+    add.setPos(99, 99)
+    history.storeHistory("move last")
+    stamps, size = history.getMemoryUsage()
+    assert stamps < 31 and size <= history.history_memory_budget
+    assert size == sum(stamp['size'] for stamp in history.history_stack)
+
+    # oldest reachable state is the base stamp, its delta is dropped
+    while history.canUndo(): history.undo()
+    assert not history.history_stack[0]['nodes'] and not history.history_stack[0]['edges']
+    assert add.pos.x() == 31 - stamps + 1
+    history.redo()
+    assert add.pos.x() == 31 - stamps + 2
+
+
+def test_history_limit_and_current_stamp_kept(scene, math_graph):
+    in1, in2, add, mul, out = math_graph(scene)
+    history = scene.history
+    history.history_memory_budget = 1      # smaller than any stamp
+    history.storeInitialHistoryStamp()
+
+    add.setPos(5, 5)
+    history.storeHistory("move")
+    assert history.getMemoryUsage()[0] == 1 and not history.canUndo()
+    assert add.pos.x() == 5
+
+    history.history_memory_budget = 10**9
+    history.history_limit = 3
+    for i in range(5):
+        add.setPos(i, 0)
+        history.storeHistory("move %d" % i)
+    assert history.getMemoryUsage()[0] == 3
+
+
+def test_history_restore_reports_changes(scene, math_graph):
+    in1, in2, add, mul, out = math_graph(scene)
+    history = scene.history
+    history.storeInitialHistoryStamp()
+
+    add.setPos(300, 300)
+    history.storeHistory("move")
+    history.undo()
+    assert history.last_restored_changes['nodes'] == [add.id]
+
+    mul.inputs[1].edges[0].remove()
+    history.storeHistory("delete edge")
+    history.undo()
+    assert history.last_restored_changes['affected_nodes'] == [mul.id]
+    assert history.getAffectedNodes() == [mul]
+    assert mul.inputs[1].edges[0].start_socket is in2.outputs[0]
+
+
+def test_deserialize_reuses_unchanged_nodes(scene, math_graph, monkeypatch):
+    in1, in2, add, mul, out = math_graph(scene)
+    scene.history.storeInitialHistoryStamp()
+    data = scene.serialize()
+    called = []
+    original = type(add).deserialize
+    monkeypatch.setattr(type(add), "deserialize",
+                        lambda self, *args, **kwargs: called.append(self) or original(self, *args, **kwargs))
+
+    scene.deserialize(data)
+    assert called == []
+
+    data['nodes'][2]['pos_x'] = 999
+    scene.deserialize(data)
+    assert called == [add] and add.pos.x() == 999
+    assert scene.getNodeByID(add.id) is add and scene.getEdgesCount() == 5
+
+    # node touched since the last stamp is reloaded even though data matches the committed state
+    scene.history.storeHistory("apply")
+    del called[:]
+    add.setPos(1, 1)
+    scene.deserialize(data)
+    assert called == [add] and add.pos.x() == 999
+
+
+def test_history_coalesces_selection_stamps(editor, math_graph):
+    scene = editor.scene
+    nodes = math_graph(scene)
+    history = scene.history
+    history.clear(); history.storeInitialHistoryStamp()
+    modified = []
+    history.addHistoryModifiedListener(modified.append)
+
+    for node in nodes:
+        for other in nodes: other.node_graphic.setSelected(False)
+        node.node_graphic.setSelected(True)
+        scene.onItemSelected()
+    assert len(history.history_stack) == 2 and len(modified) == 1
+    assert history.history_stack[-1]['selection']['nodes'] == [nodes[-1].id]
+
+    # real change breaks the run of selection stamps
+    nodes[0].setPos(1, 2)
+    history.storeHistory("move")
+    nodes[0].node_graphic.setSelected(True)
+    scene.onItemSelected()
+    assert len(history.history_stack) == 4
+
+    history.undo(); history.undo(); history.undo()
+    assert history.captureCurrentSelection()['nodes'] == []
@@ -0,0 +1,133 @@
+import json
+import os
+import time
+
+import pytest
+
+import GUI.node_editor as node_editor
+import GUI.node_journal as node_journal
+import GUI.node_storage as node_storage
+import ZCore.Config as Config
+
+
+def state(scene):
+    return json.dumps(scene.serialize(), sort_keys=True)
+
+
+def crash(editor):
+    # window dies without fileClose, journal stays on disk
+    editor.scene.journal._file.close()
+
+
+@pytest.fixture
+def open_editor(qapp):
+    editors = []
+    def create(path):
+        editor = node_editor.NodeEditorWidget()
+        editor.scene.setNodeClassSelector(lambda data: Config.get_class_from_opcode(data['op_code']))
+        assert editor.fileLoad(path)
+        editors.append(editor)
+        return editor
+    yield create
+    for editor in editors:
+        editor.waitForSave()
+        editor.scene.journal.close()
+
+
+def test_journal_replay_after_crash(open_editor, graph_file):
+    path = graph_file()
+    journal_path = node_journal.getJournalFilename(path)
+    editor = open_editor(path)
+    scene = editor.scene
+    assert not os.path.exists(journal_path)     # created with first change
+
+    node = scene.nodes[0]
+    node.setPos(node.pos.x() + 50, node.pos.y() + 7)
+    scene.history.storeHistory("move", setModified=True)
+    scene.nodes[1].remove()
+    scene.history.storeHistory("remove", setModified=True)
+    scene.nodes[2].setPos(1, 2)
+    scene.history.storeHistory("move again", setModified=True)
+    scene.history.undo()
+    assert os.path.exists(journal_path)
+    expected = state(scene)
+    crash(editor)
+    # record cut in the middle by crash is ignored
+    with open(journal_path, "ab") as file: file.write(b'{"nodes":[[1,')
+
+    recovered = open_editor(path)
+    assert state(recovered.scene) == expected and recovered.scene.has_been_modified
+
+    # second crash after recovery replays both sessions
+    recovered.scene.nodes[0].setPos(-5, -5)
+    recovered.scene.history.storeHistory("move", setModified=True)
+    expected = state(recovered.scene)
+    crash(recovered)
+    assert state(open_editor(path).scene) == expected
+
+
+def test_journal_cleared_by_save(open_editor, graph_file):
+    path = graph_file()
+    journal_path = node_journal.getJournalFilename(path)
+    editor = open_editor(path)
+    scene = editor.scene
+    scene.nodes[0].setPos(9, 9)
+    scene.history.storeHistory("move", setModified=True)
+    assert os.path.exists(journal_path)
+
+    assert editor.fileSave() and editor.waitForSave()
+    assert not scene.has_been_modified and not os.path.exists(journal_path)
+
+    scene.nodes[1].setPos(19, 9)
+    scene.history.storeHistory("move", setModified=True)
+    header, records = node_journal.readJournal(journal_path)
+    assert len(records) == 1 and header['base'] == node_journal.getFileStamp(path)
+
+
+def test_journal_compaction(open_editor, graph_file):
+    path = graph_file()
+    editor = open_editor(path)
+    scene, journal = editor.scene, editor.scene.journal
+    journal.compact_size = 1
+
+    scene.nodes[1].setPos(19, 9)
+    scene.history.storeHistory("move", setModified=True)
+    assert editor.waitForSave()
+    header, records = node_journal.readJournal(journal.getFilename())
+    assert header['snapshot'] and records == [] and scene.has_been_modified
+
+    journal.compact_size = 10 ** 9
+    scene.nodes[2].setPos(29, 9)
+    scene.history.storeHistory("move", setModified=True)
+    expected = state(scene)
+    crash(editor)
+    recovered = open_editor(path)
+    assert state(recovered.scene) == expected and recovered.scene.has_been_modified
+
+
+def test_journal_of_changed_file_ignored(open_editor, graph_file):
+    path = graph_file()
+    editor = open_editor(path)
+    editor.scene.nodes[0].setPos(1, 1)
+    editor.scene.history.storeHistory("move", setModified=True)
+    crash(editor)
+
+    # graph saved by someone else after the journal was written
+    time.sleep(0.01)
+    graph_file()
+    os.utime(path, None)
+    reloaded = open_editor(path)
+    saved = node_storage.readFile(path)['nodes'][0]
+    assert not reloaded.scene.has_been_modified
+    assert (reloaded.scene.nodes[0].pos.x(), reloaded.scene.nodes[0].pos.y()) == (saved['pos_x'], saved['pos_y'])
+
+
+def test_journal_discarded_on_close(open_editor, graph_file, tmp_path):
+    path = graph_file()
+    editor = open_editor(path)
+    editor.scene.nodes[0].setPos(1, 1)
+    editor.scene.history.storeHistory("move", setModified=True)
+    assert os.path.exists(node_journal.getJournalFilename(path))
+
+    editor.fileClose()
+    assert os.listdir(str(tmp_path)) == ["graph_math.json"]
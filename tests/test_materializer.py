@@ -0,0 +1,76 @@
+import json
+import time
+
+import pytest
+
+from PySide2 import QtCore
+
+import GUI.node_creator as node_creator
+from ZCore.nodes_class.input import ZenoNode_Input
+from ZCore.nodes_class.operations import ZenoNode_Add
+
+
+@pytest.fixture
+def big_graph(scene, tmp_path):
+    """Save chain of 400 Add nodes in 20 rows spread far beyond one viewport, returns ``(path, serialized)``"""
+    previous = ZenoNode_Input(scene=scene)
+    for k in range(400):
+        node = ZenoNode_Add(scene=scene)
+        node.setPos((k % 20) * 1000, (k // 20) * 1000)
+        node_creator.EdgeConfig(scene, previous.outputs[0], node.inputs[0])
+        previous = node
+    path = str(tmp_path / "big.zgb")
+    scene.saveToFile(path)
+    return path, json.dumps(scene.serialize())
+
+
+def loadLazily(qapp, editor, path):
+    editor.resize(800, 600)
+    editor.show()
+    qapp.processEvents()
+    editor.view.centerOn(0, 0)
+    assert editor.fileLoad(path)
+    while editor.scene.materializer._update_scheduled:
+        qapp.processEvents()
+        time.sleep(0.001)
+    return editor.scene
+
+
+def hasGraphics(scene):
+    return [node for node in scene.iterNodes() if node.node_graphic is not None]
+
+
+def test_lazy_load_materializes_viewport(qapp, editor, big_graph):
+    path, serialized = big_graph
+    scene = loadLazily(qapp, editor, path)
+
+    made = hasGraphics(scene)
+    assert 0 < len(made) < scene.getNodesCount() // 4
+    for edge in scene.iterEdges():
+        if edge.edge_graphic is not None: assert edge.start_socket.node.node_graphic is not None
+    # not materialized nodes still serialize the same
+    assert json.dumps(scene.serialize()) == serialized
+
+    scene.materializer.materializeRect(QtCore.QRectF(15000, 15000, 1000, 1000))
+    assert len(hasGraphics(scene)) > len(made)
+
+    scene.materializer.materializeAll()
+    assert not scene.materializer.hasPending()
+    assert all(edge.edge_graphic is not None for edge in scene.iterEdges())
+    assert json.dumps(scene.serialize()) == serialized
+
+
+def test_lazy_load_pending_node_moved_and_removed(qapp, editor, big_graph):
+    path, serialized = big_graph
+    scene = loadLazily(qapp, editor, path)
+    pending = [node for node in scene.iterNodes() if node.node_graphic is None]
+    moved, removed = pending[-1], pending[-2]
+
+    moved.setPos(-5000, -5000)
+    scene.materializer.materializeRect(QtCore.QRectF(-5100, -5100, 400, 400))
+    assert moved.node_graphic is not None and moved.node_graphic.pos().x() == -5000
+
+    removed.remove()
+    assert not scene.materializer._pending_nodes.get(removed.id)
+    scene.materializer.materializeAll()
+    assert scene.getNodeByID(removed.id) is None and removed.node_graphic is None
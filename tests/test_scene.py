@@ -0,0 +1,42 @@
+import GUI.node_creator as node_creator
+
+
+def test_registries_lookup_by_id(scene, math_graph):
+    in1, in2, add, mul, out = math_graph(scene)
+    edge = add.inputs[1].edges[0]
+
+    assert scene.getNodeByID(mul.id) is mul
+    assert scene.getEdgeByID(edge.id) is edge
+    assert scene.getSocketByID(add.inputs[1].id) is add.inputs[1]
+    assert scene.getNodeByID(-1) is None and scene.getEdgeByID(-1) is None and scene.getSocketByID(-1) is None
+
+
+def test_registries_counts_and_order(scene, math_graph):
+    nodes = math_graph(scene)
+
+    assert scene.getNodesCount() == 5 and scene.getEdgesCount() == 5
+    assert len(scene._sockets) == 1 + 1 + 3 + 3 + 1
+    # insertion order is kept, serialization and evaluation depend on it
+    assert list(scene.iterNodes()) == list(nodes) == scene.nodes
+    assert list(scene.iterEdges()) == scene.edges
+
+
+def test_registries_remove(scene, math_graph):
+    in1, in2, add, mul, out = math_graph(scene)
+    socket_id = add.inputs[0].id
+
+    add.remove()
+    assert scene.getNodeByID(add.id) is None and scene.getSocketByID(socket_id) is None
+    assert scene.getNodesCount() == 4 and scene.getEdgesCount() == 2
+    assert all(edge.start_socket.node is not add and edge.end_socket.node is not add for edge in scene.iterEdges())
+
+    scene.clear()
+    assert scene.nodes == [] and scene.edges == [] and len(scene._sockets) == 0
+
+
+def test_registries_follow_id_change(scene, math_graph):
+    in1, in2, add, mul, out = math_graph(scene)
+    old_id = add.id
+
+    scene.changeNodeID(add, 12345)
+    assert add.id == 12345 and scene.getNodeByID(12345) is add and scene.getNodeByID(old_id) is None
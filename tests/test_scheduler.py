@@ -0,0 +1,272 @@
+import threading
+import time
+
+import GUI.node_creator as node_creator
+import GUI.node_editor as node_editor
+import ZCore.Config as Config
+from ZCore.nodes_class.input import ZenoNode_Input
+from ZCore.nodes_class.output import ZenoNode_Output
+from ZCore.nodes_class.operations import ZenoNode_Add
+
+
+def connect(scene, parent, child, index):
+    return node_creator.EdgeConfig(scene, parent.outputs[0], child.inputs[index])
+
+
+def buildDiamondChain(scene, depth):
+    # every layer sums both nodes of previous layer twice, output is source * 2 ** depth
+    source = ZenoNode_Input(scene=scene)
+    previous, layers = [source], []
+    for _ in range(depth):
+        layer = [ZenoNode_Add(scene=scene), ZenoNode_Add(scene=scene)]
+        for node in layer:
+            connect(scene, previous[0], node, 0)
+            connect(scene, previous[-1], node, 1)
+        previous = layer
+        layers.extend(layer)
+    out = ZenoNode_Output(scene=scene)
+    connect(scene, previous[0], out, 0)
+    return source, layers, out
+
+
+def test_sort_topologically(scene, math_graph):
+    in1, in2, add, mul, out = math_graph(scene)
+    scheduler = scene.scheduler
+
+    order = scheduler.sortTopologically([out, mul, add, in2, in1])
+    assert order.index(in1) < order.index(add) < order.index(mul) < order.index(out)
+    assert order.index(in2) < order.index(add)
+    assert scheduler.getDownstreamNodes([add]) == [add, mul, out]
+    assert set(scheduler.getDownstreamNodes([in2])) == set([in2, add, mul, out])
+
+
+def test_sort_topologically_appends_cycle(scene):
+    first, second, third = ZenoNode_Add(scene=scene), ZenoNode_Add(scene=scene), ZenoNode_Add(scene=scene)
+    connect(scene, first, second, 0)
+    connect(scene, second, third, 0)
+    connect(scene, third, second, 1)
+
+    assert scene.scheduler.sortTopologically([first, second, third]) == [first, second, third]
+
+
+def test_evaluate_each_node_once(scene, monkeypatch):
+    source, layers, out = buildDiamondChain(scene, 12)
+    counts = {}
+    original = ZenoNode_Add.evalImplementation
+    def counting(self):
+        counts[self.id] = counts.get(self.id, 0) + 1
+        return original(self)
+    monkeypatch.setattr(ZenoNode_Add, "evalImplementation", counting)
+    scene.eval_cache.enabled = False
+
+    source.setInputText("2")
+    order = scene.scheduler.evaluate([source])
+    assert order[0] is source and order[-1] is out and len(order) == 26
+    assert len(counts) == 24 and all(count == 1 for count in counts.values())
+    assert out.value == 2 * 2 ** 12 and not out.isDirty()
+
+
+def test_evaluate_math_graph(scene, math_graph):
+    in1, in2, add, mul, out = math_graph(scene)
+    in1.setInputText("3"); in2.setInputText("4")
+    scene.scheduler.evaluate([in1, in2])
+    assert (add.value, mul.value, out.value) == (7, 28, 28)
+
+    in1.setInputText("x")
+    scene.scheduler.evaluate([in1])
+    assert in1.isInvalid() and add.isInvalid() and out.isInvalid()
+
+
+def test_propagation_deep_chain(scene):
+    # far deeper than recursion limit would allow, fan-in of two edges per node
+    chain = [node_creator.NodeConfig("c0", scene, inputs=[1, 1], outputs=[1])]
+    for i in range(1, 1500):
+        node = node_creator.NodeConfig("c%d" % i, scene, inputs=[1, 1], outputs=[1])
+        connect(scene, chain[-1], node, 0)
+        connect(scene, chain[-1], node, 1)
+        chain.append(node)
+
+    assert len(chain[0].getDescendantNodes()) == 1499
+    chain[0].markDescendantsDirty()
+    assert all(node.isDirty() for node in chain[1:]) and not chain[0].isDirty()
+    chain[0].markDescendantsInvalid()
+    assert all(node.isInvalid() for node in chain[1:]) and not chain[0].isInvalid()
+    chain[0].markDescendantsInvalid(False)
+    assert not any(node.isInvalid() for node in chain)
+
+
+def test_propagation_visits_shared_child_once(scene, monkeypatch):
+    source, layers, out = buildDiamondChain(scene, 3)
+    scene.scheduler.evaluate([source])
+    calls = []
+    original = node_creator.NodeConfig.markDirty
+    monkeypatch.setattr(node_creator.NodeConfig, "markDirty",
+                        lambda self, *args, **kwargs: calls.append(self.id) or original(self, *args, **kwargs))
+
+    source.markDescendantsDirty()
+    assert sorted(calls) == sorted(node.id for node in layers + [out])
+    del calls[:]
+    source.markDescendantsDirty()
+    assert calls == []      # already dirty, nothing to repaint
+
+
+def buildBranches(scene, count):
+    # independent Input -> Add(x, x) -> Output branches
+    branches = []
+    for _ in range(count):
+        source, add, out = ZenoNode_Input(scene=scene), ZenoNode_Add(scene=scene), ZenoNode_Output(scene=scene)
+        connect(scene, source, add, 0)
+        connect(scene, source, add, 1)
+        connect(scene, add, out, 0)
+        branches.append((source, add, out))
+    return branches
+
+
+def test_get_components(scene, math_graph):
+    branches = buildBranches(scene, 3)
+    nodes = [node for branch in branches for node in branch]
+    components = scene.scheduler.getComponents(scene.scheduler.sortTopologically(nodes))
+    assert components == [list(branch) for branch in branches]
+
+    in1, in2, add, mul, out = math_graph(scene)
+    assert len(scene.scheduler.getComponents([in1, in2, add, mul, out])) == 1
+
+
+def test_evaluate_parallel(editor, monkeypatch):
+    scene = editor.scene
+    branches = buildBranches(scene, 6)
+    scene.scheduler.parallel = True
+    scene.eval_cache.enabled = False
+    threads = set()
+    original = ZenoNode_Add.evalOperation
+    def recording(self, a, b):
+        threads.add(threading.current_thread().name)
+        return original(self, a, b)
+    monkeypatch.setattr(ZenoNode_Add, "evalOperation", recording)
+
+    for k, (source, add, out) in enumerate(branches): source.input_text = str(k + 10)
+    order = scene.scheduler.evaluate([branch[0] for branch in branches])
+
+    assert len(order) == 18
+    assert [out.value for _, _, out in branches] == [2 * (k + 10) for k in range(6)]
+    # labels are set on main thread once all branches finished
+    assert [out.content.label.text() for _, _, out in branches] == ["Result: %d" % (2 * (k + 10)) for k in range(6)]
+    assert threads and threading.current_thread().name not in threads
+    assert not scene.scheduler._main_thread_calls
+
+
+def test_evaluate_parallel_shared_parent(scene, monkeypatch):
+    shared = ZenoNode_Input(scene=scene)
+    shared.setInputText("5")
+    branches = buildBranches(scene, 2)
+    for source, add, out in branches:
+        add.inputs[1].edges[0].remove()
+        connect(scene, shared, add, 1)
+    scene.scheduler.parallel = True
+    shared_calls = []
+    original = ZenoNode_Input.evalImplementation
+    monkeypatch.setattr(ZenoNode_Input, "evalImplementation",
+                        lambda self: (self is shared and shared_calls.append(self)) or original(self))
+
+    scene.scheduler.evaluate([branch[0] for branch in branches])
+    assert [out.value for _, _, out in branches] == [1 + 5, 1 + 5]
+    assert len(shared_calls) == 1
+
+
+def settle(qapp, scene):
+    while scene.scheduler.isEvaluatingAsync():
+        qapp.processEvents()
+        time.sleep(0.001)
+
+
+def test_evaluate_async_typing(qapp, editor, monkeypatch):
+    scene = editor.scene
+    source = ZenoNode_Input(scene=scene)
+    previous = source
+    for _ in range(50):
+        add = ZenoNode_Add(scene=scene)
+        connect(scene, previous, add, 0)
+        connect(scene, source, add, 1)
+        previous = add
+    out = ZenoNode_Output(scene=scene)
+    connect(scene, previous, out, 0)
+    settle(qapp, scene)
+    scene.eval_cache.enabled = False
+    calls = []
+    original = ZenoNode_Add.evalOperation
+    def slow(self, a, b):
+        time.sleep(0.002)
+        calls.append(self.id)
+        return original(self, a, b)
+    monkeypatch.setattr(ZenoNode_Add, "evalOperation", slow)
+
+    # every keystroke cancels job in flight, only the last one is applied
+    for text in ("2", "3", "4", "5"): source.content.edit.setText(text)
+    assert source.isPending() and out.isPending()
+    jobs = scene.scheduler._jobs[:]
+    settle(qapp, scene)
+    assert out.content.label.text() == "Result: %d" % (51 * 5)
+    assert not any(node.isPending() for node in scene.iterNodes())
+    assert all(job.is_cancelled for job in jobs[:-1]) and not jobs[-1].is_cancelled
+    assert len(calls) < 4 * 50
+
+    # synchronous pass takes over running job
+    source.content.edit.setText("6")
+    scene.scheduler.evaluate([out])
+    assert out.content.label.text() == "Result: %d" % (51 * 6)
+    assert not scene.scheduler.isEvaluatingAsync()
+    for _ in range(10): qapp.processEvents()
+    assert out.content.label.text() == "Result: %d" % (51 * 6)
+
+
+def test_evaluate_async_value_read_on_main_thread(qapp, editor, math_graph):
+    scene = editor.scene
+    in1, in2, add, mul, out = math_graph(scene)
+    settle(qapp, scene)
+
+    in1.content.edit.setText("3"); in2.content.edit.setText("4")
+    # job in flight is finished before its value is read, no event loop needed
+    assert out.eval() == 28 and not out.isPending()
+    assert out.content.label.text() == "Result: 28"
+
+
+def test_loaded_graph_values(qapp, graph_file):
+    scene = node_editor.Scene()
+    scene.setNodeClassSelector(lambda data: Config.get_class_from_opcode(data['op_code']))
+    scene.loadFromFile(graph_file())
+    outputs = [node for node in scene.iterNodes() if node.op_code == Config.OP_NODE_OUTPUT]
+
+    assert [(out.eval(), out.isInvalid()) for out in outputs] == [(3, False), (-1, False), (0, False), (None, True)]
+    qapp.processEvents()
+    assert [(out.eval(), out.isInvalid()) for out in outputs] == [(3, False), (-1, False), (0, False), (None, True)]
+
+
+def test_clear_doesnt_evaluate(scene, monkeypatch):
+    source, layers, out = buildDiamondChain(scene, 10)
+    calls = []
+    monkeypatch.setattr(scene.scheduler, "evaluate", calls.append)
+
+    scene.clear()
+    assert calls == [] and scene.getNodesCount() == 0 and scene.getEdgesCount() == 0
+
+
+def test_invalid_nodes_dont_walk_descendants_in_pass(scene, monkeypatch):
+    source = ZenoNode_Input(scene=scene)
+    chain = [ZenoNode_Add(scene=scene)]
+    connect(scene, source, chain[0], 0)
+    for _ in range(200):
+        chain.append(ZenoNode_Add(scene=scene))
+        connect(scene, chain[-2], chain[-1], 0)
+    walks = []
+    original = node_creator.NodeConfig.getDescendantNodes
+    monkeypatch.setattr(node_creator.NodeConfig, "getDescendantNodes",
+                        lambda self: walks.append(self) or original(self))
+
+    # every node of the chain gets invalid, pass marked the whole subgraph Dirty already
+    chain[0].inputs[0].edges[0].remove()
+    assert all(node.isInvalid() for node in chain) and walks == []
+
+    # outside of pass invalid node still marks its descendants
+    for node in chain[1:]: node.markDirty(False)
+    chain[0].markDirty()
+    assert chain[0].eval() is None and len(walks) == 1 and all(node.isDirty() for node in chain)
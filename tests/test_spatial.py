@@ -0,0 +1,153 @@
+import random
+
+import pytest
+
+from PySide2 import QtCore, QtGui, QtWidgets
+
+import GUI.node_creator as node_creator
+import GUI.node_spatial as node_spatial
+
+
+@pytest.fixture
+def loaded_editor(qapp, editor, graph_file):
+    editor.resize(800, 600)
+    editor.show()
+    editor.fileLoad(graph_file())
+    editor.scene.materializer.materializeAll()
+    return editor
+
+
+def test_spatial_grid():
+    grid = node_spatial.SpatialGrid(10)
+    grid.insert('a', 1, 1, 2, 2)
+    grid.insert('b', 15, -25, 35, 5)
+    grid.insert('a', 3, 3, 4, 4)     # re-insert moves the item
+
+    assert grid.query(0, 0, 5, 5) == ['a'] and grid.query(20, 0, 21, 1) == ['b']
+    assert sorted(grid.query(-100, -100, 100, 100)) == ['a', 'b'] and len(grid) == 2
+    assert grid.query(1, 1, 2, 2) == [] and grid.getBounds('a') == (3, 3, 4, 4)
+
+    grid.insert('a', 50, 50, 51, 51)
+    assert grid.query(0, 0, 5, 5) == [] and 'a' in grid
+    grid.remove('a')
+    grid.remove('missing')
+    assert 'a' not in grid and len(grid) == 1
+
+
+def bruteSocketsNear(scene, x, y, radius):
+    rect = QtCore.QRectF(x - radius, y - radius, 2 * radius, 2 * radius)
+    return set(item.socket for item in scene.scene_graphic.items(rect) if isinstance(item, node_creator.SocketGraphics))
+
+
+def checkSocketIndex(editor, rng):
+    scene = editor.scene
+    for _ in range(100):
+        node = rng.choice(scene.nodes)
+        socket = rng.choice(node.inputs + node.outputs)
+        x, y = socket.getSocketScenePosition()
+        x, y = x + rng.uniform(-40, 40), y + rng.uniform(-40, 40)
+        for radius in (12, 112):
+            assert set(scene.socket_index.getSocketsNear(x, y, radius)) == bruteSocketsNear(scene, x, y, radius)
+        item, pos = editor.view.snapping.getSnappedToSocketPosition(QtCore.QPointF(x, y))
+        if item is not None: assert (pos.x(), pos.y()) == item.socket.getSocketScenePosition()
+
+
+def test_socket_index_matches_scene(loaded_editor):
+    scene, rng = loaded_editor.scene, random.Random(21)
+    checkSocketIndex(loaded_editor, rng)
+
+    for node in scene.nodes[:5]: node.setPos(node.pos.x() + 333, node.pos.y() - 77)
+    checkSocketIndex(loaded_editor, rng)
+    removed = scene.nodes[3].inputs + scene.nodes[3].outputs
+    scene.nodes[3].remove()
+    assert all(scene.socket_index.getPosition(socket) is None for socket in removed)
+    checkSocketIndex(loaded_editor, rng)
+    scene.history.undo()
+    checkSocketIndex(loaded_editor, rng)
+    scene.nodes[0].node_graphic.moveBy(5, 5)
+    checkSocketIndex(loaded_editor, rng)
+
+
+def test_socket_index_lazy_update(loaded_editor):
+    scene = loaded_editor.scene
+    node = scene.nodes[0]
+    socket = node.outputs[0] if node.outputs else node.inputs[0]
+    x, y = scene.socket_index.getPosition(socket)
+
+    node.node_graphic.moveBy(100, 50)
+    assert scene.socket_index.getPosition(socket) == (x + 100, y + 50)
+    assert scene.socket_index.getNearestSocket(x + 101, y + 51, 12) == (socket, (x + 100, y + 50))
+
+
+def checkItemIndex(editor, rng):
+    scene, view = editor.scene, editor.view
+    qt_item_at = super(type(view), view).itemAt
+    bounds = scene.scene_graphic.itemsBoundingRect()
+    for _ in range(300):
+        point = view.mapFromScene(QtCore.QPointF(rng.uniform(bounds.left(), bounds.right()),
+                                                 rng.uniform(bounds.top(), bounds.bottom())))
+        assert view.itemAt(point) is qt_item_at(point)
+    for _ in range(30):
+        path = QtGui.QPainterPath()
+        path.addRect(QtCore.QRectF(rng.uniform(bounds.left(), bounds.right()),
+                                   rng.uniform(bounds.top(), bounds.bottom()), 300, 200))
+        expected = set(item for item in scene.scene_graphic.items(path)
+                       if item.flags() & QtWidgets.QGraphicsItem.ItemIsSelectable and item.parentItem() is None)
+        assert set(scene.scene_graphic.item_index.selectableItemsInPath(path)) == expected
+
+
+def test_item_index_matches_scene(loaded_editor):
+    scene, view, rng = loaded_editor.scene, loaded_editor.view, random.Random(22)
+    view.fitInView(scene.scene_graphic.itemsBoundingRect())
+    checkItemIndex(loaded_editor, rng)
+
+    for node in scene.nodes[:5]:
+        node.setPos(node.pos.x() + 333, node.pos.y() - 77)
+        node.updateConnectedEdges()
+    checkItemIndex(loaded_editor, rng)
+    scene.nodes[3].remove()
+    checkItemIndex(loaded_editor, rng)
+    scene.history.undo()
+    checkItemIndex(loaded_editor, rng)
+    view.resetTransform()
+    view.scale(2, 2)
+    view.centerOn(scene.nodes[1].node_graphic)
+    checkItemIndex(loaded_editor, rng)
+
+
+def test_item_index_cut_line(loaded_editor):
+    scene, view = loaded_editor.scene, loaded_editor.view
+    # vertical line across the middle of first edge
+    middle = scene.edges[0].edge_graphic.getPath().pointAtPercent(0.5)
+    points = [middle + QtCore.QPointF(0, -50), middle + QtCore.QPointF(0, 50)]
+    expected = [edge for edge in scene.edges if edge.edge_graphic.intersectsWith(*points)]
+    assert scene.edges[0] in expected
+    edges = scene.getEdgesCount()
+
+    view.cutline.line_points = points
+    view.cutline.updateLine()
+    view.cutIntersectingEdge()
+    view.cutline.line_points = []
+    assert scene.getEdgesCount() == edges - len(expected)
+    assert not any(scene.getEdgeByID(edge.id) for edge in expected)
+
+
+def test_item_index_untracked_items(qapp):
+    index = node_spatial.ItemIndex()
+    scene = QtWidgets.QGraphicsScene()
+    items = [scene.addRect(QtCore.QRectF(0, 0, 10, 10)) for _ in range(node_spatial.MAX_VOLATILE_ITEMS + 4)]
+    for item in items: index.addItem(item, tracked=False)
+    assert len(index._volatile) == node_spatial.MAX_VOLATILE_ITEMS
+    assert set(index.query(QtCore.QRectF(-5, -5, 20, 20))) == set(items)
+
+    # volatile items are found after unreported moves, the rest after markDirty
+    for item in items: item.setPos(1000, 1000)
+    found = index.query(QtCore.QRectF(995, 995, 20, 20))
+    assert set(found) == set(items[:node_spatial.MAX_VOLATILE_ITEMS])
+    for item in items[node_spatial.MAX_VOLATILE_ITEMS:]: index.markDirty(item)
+    assert set(index.query(QtCore.QRectF(995, 995, 20, 20))) == set(items)
+    # later added items stack on top
+    assert index.query(QtCore.QRectF(995, 995, 20, 20))[0] is items[-1]
+
+    index.removeItem(items[0])
+    assert items[0] not in index.query(QtCore.QRectF(995, 995, 20, 20))
@@ -0,0 +1,175 @@
+import io
+import json
+import os
+import time
+
+import pytest
+
+import GUI.node_creator as node_creator
+import GUI.node_editor as node_editor
+import GUI.node_storage as node_storage
+
+
+@pytest.fixture
+def loaded(scene, graph_file):
+    scene.loadFromFile(graph_file())
+    return scene
+
+
+def loadCopy(scene, filename):
+    other = type(scene)(headless=True)
+    other.setNodeClassSelector(scene.node_class_selector)
+    other.loadFromFile(filename)
+    return other
+
+
+@pytest.mark.parametrize("indent", [4, 2, None])
+def test_stream_writer_matches_json_dumps(loaded, indent):
+    stream = io.StringIO()
+    node_storage.writeJSON(loaded, stream, indent)
+    separators = (',', ': ') if indent is not None else (',', ':')
+    assert stream.getvalue() == json.dumps(loaded.serialize(), indent=indent, separators=separators)
+
+
+def test_stream_writer_empty_scene(scene):
+    for indent, separators in ((4, (',', ': ')), (None, (',', ':'))):
+        stream = io.StringIO()
+        node_storage.writeJSON(scene, stream, indent)
+        assert stream.getvalue() == json.dumps(scene.serialize(), indent=indent, separators=separators)
+
+
+def test_save_round_trip(loaded, tmp_path):
+    path = str(tmp_path / "saved.json")
+    loaded.saveToFile(path)
+    full_size = os.path.getsize(path)
+    assert loadCopy(loaded, path).serialize() == loaded.serialize()
+
+    loaded.saveToFile(path, compact=True)
+    assert os.path.getsize(path) < full_size / 2
+    assert loadCopy(loaded, path).serialize() == loaded.serialize()
+
+
+def test_save_is_atomic(loaded, tmp_path, monkeypatch):
+    path = str(tmp_path / "saved.json")
+    loaded.saveToFile(path)
+    os.chmod(path, 0o640)
+    with open(path) as file: before = file.read()
+
+    def crash(node): raise RuntimeError("crash")
+    monkeypatch.setattr(node_creator.NodeConfig, "serialize", crash)
+    with pytest.raises(RuntimeError):
+        loaded.saveToFile(path)
+    monkeypatch.undo()
+
+    # old file untouched, temporary file removed
+    with open(path) as file: assert file.read() == before
+    assert sorted(os.listdir(str(tmp_path))) == ["graph_math.json", "saved.json"]
+
+    loaded.saveToFile(path, compact=True)
+    assert os.stat(path).st_mode & 0o777 == 0o640
+
+
+@pytest.mark.parametrize("name", ["graph_math.json", "graph2.json", "spline_name.json", "tes.json"])
+def test_binary_pack_round_trip(graph_file, name):
+    data = node_storage.readFile(graph_file(name))
+    header = dict((key, value) for key, value in data.items() if key not in ('nodes', 'edges'))
+
+    assert node_storage.unpackBinary(node_storage.packBinary(header, data['nodes'], data['edges'])) == data
+
+
+def test_binary_records_which_dont_fit():
+    node = {'id': 2 ** 70, 'title': "big", 'pos_x': 0.0, 'pos_y': 0.0, 'inputs': [], 'outputs': [], 'content': {}}
+    extra = {'id': 5, 'title': "extra", 'pos_x': 1.5, 'pos_y': -2.0, 'inputs': [], 'outputs': [], 'content': {},
+             'op_code': 3}
+    edge = {'id': 7, 'edge_type': 1, 'start': None, 'end': 2 ** 70}
+    header = {'id': 1, 'scene_width': 10, 'scene_height': 20}
+
+    data = node_storage.unpackBinary(node_storage.packBinary(header, [node, extra], [edge]))
+    assert data['nodes'] == [node, extra] and data['edges'] == [edge]
+    assert dict((key, data[key]) for key in header) == header
+
+
+def test_binary_save_and_load(loaded, tmp_path):
+    path = str(tmp_path / "saved.zgb")
+    loaded.saveToFile(path)
+    with open(path, "rb") as file: assert file.read(4) == node_storage.BINARY_MAGIC
+    assert loadCopy(loaded, path).serialize() == loaded.serialize()
+
+    json_path = str(tmp_path / "converted.json")
+    assert node_storage.main([path, json_path]) == 0
+    assert node_storage.readFile(json_path) == node_storage.readFile(path)
+    assert node_storage.main([path]) == 2
+
+
+@pytest.mark.parametrize("content", [b"xx", b"JSON" + b"\0" * 40, node_storage.BINARY_MAGIC + b"\xff\xff" + b"\0" * 40])
+def test_binary_invalid_file(scene, tmp_path, content):
+    path = str(tmp_path / "bad.zgb")
+    with open(path, "wb") as file: file.write(content)
+
+    with pytest.raises(node_storage.BinaryFormatError):
+        node_storage.readFile(path)
+    with pytest.raises(node_editor.InvalidFile):
+        scene.loadFromFile(path)
+
+
+def test_binary_truncated_file(loaded, tmp_path):
+    path = str(tmp_path / "saved.zgb")
+    loaded.saveToFile(path)
+    with open(path, "rb") as file: content = file.read()
+    with open(path, "wb") as file: file.write(content[:len(content) // 2])
+
+    with pytest.raises(node_storage.BinaryFormatError):
+        node_storage.readFile(path)
+
+
+def test_background_save(qapp, editor, graph_file, tmp_path):
+    editor.fileLoad(graph_file())
+    scene = editor.scene
+    scene.materializer.materializeAll()
+    node = scene.nodes[0]
+    node.setPos(node.pos.x() + 10, node.pos.y())
+    scene.history.storeHistory("move", setModified=True)
+    reference = str(tmp_path / "reference.json")
+    scene.saveToFile(reference)
+    scene.has_been_modified = True
+
+    path, done = str(tmp_path / "saved.json"), []
+    editor.fileSave(path, callback=done.append)
+    # later edit doesn't get into the file, snapshot was taken by fileSave
+    node.setPos(0, 0)
+    assert editor.waitForSave() and done[0].isSuccessful()
+    with open(path) as saved, open(reference) as expected: assert saved.read() == expected.read()
+    assert not scene.has_been_modified
+
+
+def test_background_save_keeps_modified_flag(qapp, editor, graph_file, tmp_path):
+    editor.fileLoad(graph_file())
+    scene = editor.scene
+
+    # modified while saving
+    scene.has_been_modified = True
+    scene.saver.saveAsync(str(tmp_path / "saved.json"))
+    scene.has_been_modified = True
+    assert scene.saver.waitForDone() and scene.has_been_modified
+
+    # failed save
+    job = scene.saver.saveAsync(str(tmp_path / "missing" / "saved.json"))
+    assert not scene.saver.waitForDone() and job.error is not None and scene.has_been_modified
+
+
+def test_background_save_delivered_by_event_loop(qapp, editor, graph_file, tmp_path):
+    editor.fileLoad(graph_file())
+    scene = editor.scene
+    scene.has_been_modified = True
+
+    progress = []
+    job = scene.saver.saveAsync(str(tmp_path / "saved.zgb"),
+                                progress_callback=lambda job, written, total: progress.append((written, total)))
+    start = time.time()
+    while not job.is_finished and time.time() - start < 10:
+        qapp.processEvents()
+        time.sleep(0.001)
+    assert job.isSuccessful() and not scene.has_been_modified
+    total = scene.getNodesCount() + scene.getEdgesCount()
+    assert progress[-1] == (total, total)
+    assert loadCopy(scene, str(tmp_path / "saved.zgb")).serialize() == scene.serialize()